@@ -1,14 +1,21 @@
 from flask import Flask
 
+from .cli import register_cli
 from .config import Config
 from .extensions import db, migrate, swagger
 from .middleware.audit import init_audit_middleware
+from .models.candidate_search import include_in_autogenerate
 from .routes.auth import auth_bp, users_bp
 from .routes.health import health_bp
 from .routes.job_descriptions import jd_bp
 from .routes.candidates import candidates_bp
 from .routes.applications import applications_bp
+from .routes.exports import exports_bp
 from .routes.processing_jobs import processing_jobs_bp
+from .routes.resumes import resumes_bp
+from .services.jd_profiles import init_jd_profile_cache
+from .services.parser_sandbox import init_parser_sandbox
+from .services.taxonomy import init_skill_taxonomy
 
 
 def create_app(config_object=Config):
@@ -16,9 +23,13 @@ def create_app(config_object=Config):
     app.config.from_object(config_object)
 
     db.init_app(app)
-    migrate.init_app(app, db)
+    migrate.init_app(app, db, include_object=include_in_autogenerate)
     swagger.init_app(app)
     init_audit_middleware(app)
+    register_cli(app)
+    init_jd_profile_cache(app)
+    init_skill_taxonomy(app)
+    init_parser_sandbox(app)
 
     app.register_blueprint(auth_bp, url_prefix="/api")
     app.register_blueprint(users_bp, url_prefix="/api")
@@ -27,5 +38,7 @@ def create_app(config_object=Config):
     app.register_blueprint(candidates_bp, url_prefix="/api")
     app.register_blueprint(applications_bp, url_prefix="/api")
     app.register_blueprint(processing_jobs_bp, url_prefix="/api")
+    app.register_blueprint(exports_bp, url_prefix="/api")
+    app.register_blueprint(resumes_bp, url_prefix="/api")
 
     return app
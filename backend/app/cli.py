@@ -0,0 +1,83 @@
+import json
+
+import click
+from flask import Flask
+
+from app.extensions import db
+from app.models.job_description import JobDescription
+from app.services.batch_scoring import DEFAULT_CHUNK_SIZE, SCORING_ENGINES, score_applications_for_jd
+from app.services.candidate_features import DEFAULT_REFRESH_CHUNK_SIZE, refresh_stale_features
+from app.services.taxonomy import SkillTaxonomy, compile_taxonomy, configured_taxonomy_path, load_taxonomy_source
+from app.services.worker import DEFAULT_POLL_INTERVAL, Worker
+
+
+def register_cli(app: Flask):
+    @app.cli.command("score-jd")
+    @click.argument("jd_id", type=int)
+    @click.option("--weights", "raw_weights", default=None, help="JSON object of scoring weights.")
+    @click.option("--chunk-size", default=DEFAULT_CHUNK_SIZE, show_default=True, type=click.IntRange(min=1))
+    @click.option("--engine", default="python", show_default=True, type=click.Choice(SCORING_ENGINES))
+    def score_jd_command(jd_id: int, raw_weights: str | None, chunk_size: int, engine: str):
+        """Score every application of a job description."""
+        weights = None
+        if raw_weights:
+            try:
+                weights = json.loads(raw_weights)
+            except json.JSONDecodeError as exc:
+                raise click.BadParameter("weights must be valid JSON", param_hint="--weights") from exc
+            if not isinstance(weights, dict):
+                raise click.BadParameter("weights must be a JSON object", param_hint="--weights")
+
+        jd = db.session.get(JobDescription, jd_id)
+        if jd is None:
+            raise click.ClickException(f"job description {jd_id} not found")
+
+        summary = score_applications_for_jd(jd, weights=weights, chunk_size=chunk_size, engine=engine)
+        click.echo(
+            f"scored {summary.scored} applications for jd {jd_id} "
+            f"in {summary.chunks} chunks ({summary.duration_ms} ms)"
+        )
+
+    @app.cli.command("refresh-features")
+    @click.option("--chunk-size", default=DEFAULT_REFRESH_CHUNK_SIZE, show_default=True, type=click.IntRange(min=1))
+    def refresh_features_command(chunk_size: int):
+        """Rebuild candidate feature records built by an older scorer version."""
+        refreshed = refresh_stale_features(chunk_size=chunk_size)
+        click.echo(f"refreshed {refreshed} candidate feature records")
+
+    @app.cli.group("taxonomy")
+    def taxonomy_group():
+        """Manage the compiled skill taxonomy."""
+
+    @taxonomy_group.command("compile")
+    @click.argument("source", type=click.Path(exists=True, dir_okay=False))
+    @click.argument("output", required=False, type=click.Path(dir_okay=False))
+    def compile_taxonomy_command(source: str, output: str | None):
+        """Compile a JSON skill taxonomy into the binary file workers memory-map.
+
+        OUTPUT defaults to SKILL_TAXONOMY_PATH; running workers pick up the new file on their own.
+        """
+        output = output or configured_taxonomy_path(app)
+        if output is None:
+            raise click.UsageError("pass OUTPUT or set SKILL_TAXONOMY_PATH")
+        try:
+            compile_taxonomy(load_taxonomy_source(source), output)
+            taxonomy = SkillTaxonomy(output)
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+        click.echo(
+            f"compiled {taxonomy.skill_count} skills and {taxonomy.alias_count} aliases "
+            f"into {output} ({taxonomy.checksum})"
+        )
+
+    @app.cli.command("worker")
+    @click.option("--concurrency", default=1, show_default=True, type=click.IntRange(min=1))
+    @click.option("--poll-interval", default=DEFAULT_POLL_INTERVAL, show_default=True, type=click.FloatRange(min=0.05))
+    @click.option("--burst", is_flag=True, help="Exit once no job is due instead of polling.")
+    def worker_command(concurrency: int, poll_interval: float, burst: bool):
+        """Run queued processing jobs."""
+        worker = Worker(app, concurrency=concurrency, poll_interval=poll_interval, burst=burst)
+        click.echo(f"worker {worker.name} started with {concurrency} thread(s)")
+        processed = worker.run()
+        click.echo(f"worker {worker.name} stopped after {processed} job(s)")
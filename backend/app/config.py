@@ -8,8 +8,29 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+    EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
     AUDIT_LOG_PATH = os.getenv("AUDIT_LOG_PATH", "logs/audit.log")
     TOKEN_MAX_AGE_SECONDS = int(os.getenv("TOKEN_MAX_AGE_SECONDS", "28800"))
+    JD_PROFILE_CACHE_SIZE = int(os.getenv("JD_PROFILE_CACHE_SIZE", "256"))
+    MINHASH_ENABLED = os.getenv("MINHASH_ENABLED", "false").lower() == "true"
+    MINHASH_NUM_PERM = int(os.getenv("MINHASH_NUM_PERM", "128"))
+    LSH_BANDS = int(os.getenv("LSH_BANDS", "64"))
+    SKILL_TAXONOMY_PATH = os.getenv("SKILL_TAXONOMY_PATH", "")
+    SKILL_TAXONOMY_CHECK_INTERVAL = float(os.getenv("SKILL_TAXONOMY_CHECK_INTERVAL", "5"))
+    JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    JOB_RETRY_BACKOFF_SECONDS = float(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "10"))
+    JOB_RETRY_BACKOFF_MAX_SECONDS = float(os.getenv("JOB_RETRY_BACKOFF_MAX_SECONDS", "600"))
+    BULK_UPLOAD_MAX_FILES = int(os.getenv("BULK_UPLOAD_MAX_FILES", "5000"))
+    BULK_UPLOAD_MAX_FILE_BYTES = int(os.getenv("BULK_UPLOAD_MAX_FILE_BYTES", str(20 * 1024 * 1024)))
+    BULK_INSERT_BATCH_SIZE = int(os.getenv("BULK_INSERT_BATCH_SIZE", "500"))
+    BULK_PARSE_PROCESSES = int(os.getenv("BULK_PARSE_PROCESSES", "4"))
+    PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES") or 0) or None
+    PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS") or 0) or None
+    PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", "0"))
+    PARSER_SANDBOX_PROCESSES = int(os.getenv("PARSER_SANDBOX_PROCESSES", "0"))
+    PARSER_TIMEOUT_SECONDS = float(os.getenv("PARSER_TIMEOUT_SECONDS", "60"))
+    PARSER_MEMORY_LIMIT_MB = int(os.getenv("PARSER_MEMORY_LIMIT_MB", "1024"))
     SWAGGER = {
         "title": "Resume ATS Scanner API",
         "uiversion": 3,
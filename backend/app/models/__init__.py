@@ -1,8 +1,33 @@
 from .application import Application
 from .candidate import Candidate
+from .candidate_features import CandidateFeatures
+from .candidate_skill import CandidateSkill
+from .candidate_term import CandidateTerm
 from .job_description import JobDescription
+from .lsh_bucket import LshBucket
 from .processing_job import ProcessingJob
+from .report_export import ReportExport
+from .resume_blob import ResumeBlob, ResumeParse
 from .review_note import ReviewNote
+from .term import Term
+from .upload_batch import UploadBatch, UploadBatchItem
 from .user import User
 
-__all__ = ["Application", "Candidate", "JobDescription", "ProcessingJob", "ReviewNote", "User"]
+__all__ = [
+    "Application",
+    "Candidate",
+    "CandidateFeatures",
+    "CandidateSkill",
+    "CandidateTerm",
+    "JobDescription",
+    "LshBucket",
+    "ProcessingJob",
+    "ReportExport",
+    "ResumeBlob",
+    "ResumeParse",
+    "ReviewNote",
+    "Term",
+    "UploadBatch",
+    "UploadBatchItem",
+    "User",
+]
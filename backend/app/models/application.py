@@ -5,6 +5,14 @@ from app.extensions import db
 
 class Application(db.Model):
     __tablename__ = "applications"
+    # Per-JD listings: ranked by score, filtered by status (also the shortlist export).
+    # Both lead with jd_id, so they also serve plain lookups by JD.
+    __table_args__ = (
+        db.Index("ix_applications_jd_id_total_score", "jd_id", "total_score"),
+        db.Index("ix_applications_jd_id_status", "jd_id", "status"),
+        # Also the index for lookups by candidate.
+        db.UniqueConstraint("candidate_id", "jd_id", name="uq_applications_candidate_id_jd_id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     candidate_id = db.Column(db.Integer, db.ForeignKey("candidates.id"), nullable=False)
@@ -14,6 +22,8 @@ class Application(db.Model):
     score_breakdown_json = db.Column(db.JSON, nullable=True)
     reviewed_by = db.Column(db.String(120), nullable=True)
     reviewed_at = db.Column(db.DateTime, nullable=True)
+    # Bumped by every status change; clients send it back to detect concurrent edits.
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
     created_at = db.Column(
         db.DateTime, default=lambda: datetime.now(UTC), nullable=False
     )
@@ -34,5 +44,6 @@ class Application(db.Model):
             "score_breakdown_json": self.score_breakdown_json,
             "reviewed_by": self.reviewed_by,
             "reviewed_at": self.reviewed_at.isoformat() if self.reviewed_at else None,
+            "version": self.version,
             "created_at": self.created_at.isoformat(),
         }
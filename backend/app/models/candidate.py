@@ -12,6 +12,7 @@ class Candidate(db.Model):
     phone = db.Column(db.String(50), nullable=True)
     resume_filename = db.Column(db.String(255), nullable=False)
     resume_path = db.Column(db.String(500), nullable=False)
+    resume_sha256 = db.Column(db.String(64), nullable=True, index=True)
     extracted_text = db.Column(db.Text, nullable=True)
     profile_json = db.Column(db.JSON, nullable=True)
     created_at = db.Column(
@@ -21,6 +22,9 @@ class Candidate(db.Model):
     applications = db.relationship(
         "Application", back_populates="candidate", cascade="all, delete-orphan"
     )
+    features = db.relationship(
+        "CandidateFeatures", back_populates="candidate", uselist=False, cascade="all, delete-orphan"
+    )
 
     def to_dict(self):
         return {
@@ -30,6 +34,7 @@ class Candidate(db.Model):
             "phone": self.phone,
             "resume_filename": self.resume_filename,
             "resume_path": self.resume_path,
+            "resume_sha256": self.resume_sha256,
             "extracted_text": self.extracted_text,
             "profile_json": self.profile_json,
             "created_at": self.created_at.isoformat(),
@@ -0,0 +1,32 @@
+from datetime import UTC, datetime
+
+from app.extensions import db
+
+
+class CandidateFeatures(db.Model):
+    __tablename__ = "candidate_features"
+
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidates.id"), primary_key=True)
+    feature_version = db.Column(db.String(20), nullable=False)
+    term_ids = db.Column(db.LargeBinary, nullable=False)
+    term_count = db.Column(db.Integer, nullable=False, default=0)
+    skills = db.Column(db.JSON, nullable=False, default=list)
+    years_experience = db.Column(db.Integer, nullable=True, index=True)
+    education_levels = db.Column(db.JSON, nullable=False, default=list)
+    minhash = db.Column(db.LargeBinary, nullable=True)
+    updated_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(UTC), nullable=False
+    )
+
+    candidate = db.relationship("Candidate", back_populates="features")
+
+    def to_dict(self):
+        return {
+            "candidate_id": self.candidate_id,
+            "feature_version": self.feature_version,
+            "term_count": self.term_count,
+            "skills": self.skills,
+            "years_experience": self.years_experience,
+            "education_levels": self.education_levels,
+            "updated_at": self.updated_at.isoformat(),
+        }
@@ -0,0 +1,32 @@
+from sqlalchemy import DDL, event
+
+from app.models.candidate import Candidate
+
+# The full-text index of candidates is dialect-specific, so it is created with DDL
+# rather than declared as a model: an FTS5 virtual table on SQLite, a GIN-indexed
+# tsvector on PostgreSQL. Rows are keyed by candidate id (the FTS5 rowid).
+SEARCH_TABLE = "candidate_search"
+
+_SQLITE_CREATE = DDL(
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+    "USING fts5(full_name, email, skills, body, tokenize='unicode61 remove_diacritics 2')"
+)
+_POSTGRES_CREATE = [
+    DDL(
+        f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+        "candidate_id INTEGER PRIMARY KEY REFERENCES candidates (id) ON DELETE CASCADE, "
+        "document TSVECTOR NOT NULL)"
+    ),
+    DDL(f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document ON {SEARCH_TABLE} USING GIN (document)"),
+]
+_DROP = DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+event.listen(Candidate.__table__, "after_create", _SQLITE_CREATE.execute_if(dialect="sqlite"))
+for _statement in _POSTGRES_CREATE:
+    event.listen(Candidate.__table__, "after_create", _statement.execute_if(dialect="postgresql"))
+event.listen(Candidate.__table__, "before_drop", _DROP)
+
+
+def include_in_autogenerate(object_, name, type_, reflected, compare_to) -> bool:
+    """Alembic ``include_object`` hook: leave the search table (and FTS5's shadow tables) to hand-written migrations."""
+    return not (type_ == "table" and name and name.startswith(SEARCH_TABLE))
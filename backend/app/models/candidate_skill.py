@@ -0,0 +1,12 @@
+from app.extensions import db
+
+MAX_SKILL_LENGTH = 100
+
+
+class CandidateSkill(db.Model):
+    """One canonical skill extracted from ``candidate_id``'s resume, for filtering in SQL."""
+
+    __tablename__ = "candidate_skills"
+
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidates.id"), primary_key=True)
+    skill = db.Column(db.String(MAX_SKILL_LENGTH), primary_key=True, index=True)
@@ -0,0 +1,12 @@
+from app.extensions import db
+
+
+class CandidateTerm(db.Model):
+    """Posting entry of the inverted index: ``term_id`` occurs in ``candidate_id``'s resume."""
+
+    __tablename__ = "candidate_terms"
+
+    term_id = db.Column(db.Integer, db.ForeignKey("terms.id"), primary_key=True)
+    candidate_id = db.Column(
+        db.Integer, db.ForeignKey("candidates.id"), primary_key=True, index=True
+    )
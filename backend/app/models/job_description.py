@@ -12,8 +12,12 @@ class JobDescription(db.Model):
     level = db.Column(db.String(120), nullable=True)
     location = db.Column(db.String(120), nullable=True)
     text = db.Column(db.Text, nullable=False)
+    scoring_profile_json = db.Column(db.JSON, nullable=True)
+    text_hash = db.Column(db.String(64), nullable=True)
+    scorer_version = db.Column(db.String(20), nullable=True)
+    minhash_signature = db.Column(db.LargeBinary, nullable=True)
     created_at = db.Column(
-        db.DateTime, default=lambda: datetime.now(UTC), nullable=False
+        db.DateTime, default=lambda: datetime.now(UTC), nullable=False, index=True
     )
     applications = db.relationship(
         "Application", back_populates="job_description", cascade="all, delete-orphan"
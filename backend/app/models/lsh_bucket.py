@@ -0,0 +1,13 @@
+from app.extensions import db
+
+
+class LshBucket(db.Model):
+    """LSH banding entry: ``candidate_id``'s MinHash band ``band`` hashes to ``bucket``."""
+
+    __tablename__ = "lsh_buckets"
+
+    band = db.Column(db.Integer, primary_key=True)
+    bucket = db.Column(db.BigInteger, primary_key=True)
+    candidate_id = db.Column(
+        db.Integer, db.ForeignKey("candidates.id"), primary_key=True, index=True
+    )
@@ -5,11 +5,26 @@ from app.extensions import db
 
 class ProcessingJob(db.Model):
     __tablename__ = "processing_jobs"
+    __table_args__ = (
+        db.Index("ix_processing_jobs_claim", "status", "run_after"),
+        db.Index("ix_processing_jobs_status_created_at", "status", "created_at"),
+        db.Index("ix_processing_jobs_entity", "entity_type", "entity_id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(50), nullable=False, default="process_candidate", server_default="process_candidate")
     entity_type = db.Column(db.String(50), nullable=False)
     entity_id = db.Column(db.Integer, nullable=False)
+    payload_json = db.Column(db.JSON, nullable=True)
     status = db.Column(db.String(50), nullable=False, default="queued")
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    max_attempts = db.Column(db.Integer, nullable=False, default=3, server_default="3")
+    run_after = db.Column(
+        db.DateTime, default=lambda: datetime.now(UTC), server_default=db.func.current_timestamp(), nullable=False
+    )
+    locked_by = db.Column(db.String(120), nullable=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    cancel_requested = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())
     error_message = db.Column(db.Text, nullable=True)
     started_at = db.Column(db.DateTime, nullable=True)
     completed_at = db.Column(db.DateTime, nullable=True)
@@ -17,12 +32,24 @@ class ProcessingJob(db.Model):
         db.DateTime, default=lambda: datetime.now(UTC), nullable=False
     )
 
+    @property
+    def reported_status(self) -> str:
+        # Clients see the dead-letter state as "failed", the status terminal failures had
+        # before the queue.
+        return "failed" if self.status == "dead" else self.status
+
     def to_dict(self):
         return {
             "id": self.id,
+            "job_type": self.job_type,
             "entity_type": self.entity_type,
             "entity_id": self.entity_id,
-            "status": self.status,
+            "payload": self.payload_json,
+            "status": self.reported_status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_after": self.run_after.isoformat() if self.run_after else None,
+            "cancel_requested": self.cancel_requested,
             "error_message": self.error_message,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
@@ -0,0 +1,46 @@
+from datetime import UTC, datetime
+
+from app.extensions import db
+
+
+class ReportExport(db.Model):
+    __tablename__ = "report_exports"
+
+    id = db.Column(db.Integer, primary_key=True)
+    format = db.Column(db.String(20), nullable=False)
+    status = db.Column(db.String(50), nullable=False, default="queued")
+    params_json = db.Column(db.JSON, nullable=False)
+    total_rows = db.Column(db.Integer, nullable=True)
+    rows_written = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    file_name = db.Column(db.String(255), nullable=True)
+    size_bytes = db.Column(db.BigInteger, nullable=True)
+    created_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(UTC), nullable=False
+    )
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self, job=None):
+        status = self.status
+        if job is not None and status != "completed" and job.status in {"cancelled", "dead"}:
+            # The job's outcome wins: a failed attempt rolls back the export's own status.
+            status = "cancelled" if job.status == "cancelled" else "failed"
+        if self.total_rows:
+            progress = round(self.rows_written / self.total_rows, 4)
+        else:
+            progress = 1.0 if self.status == "completed" else 0.0
+        return {
+            "id": self.id,
+            "format": self.format,
+            "status": status,
+            "params": self.params_json,
+            "total_rows": self.total_rows,
+            "rows_written": self.rows_written,
+            "progress": progress,
+            "size_bytes": self.size_bytes,
+            "download_url": f"/api/exports/{self.id}/download" if self.status == "completed" else None,
+            "error_message": job.error_message if job is not None and status == "failed" else None,
+            "job": job.to_dict() if job is not None else None,
+            "created_at": self.created_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
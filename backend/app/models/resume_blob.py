@@ -0,0 +1,39 @@
+from datetime import UTC, datetime
+
+from app.extensions import db
+
+
+class ResumeBlob(db.Model):
+    """One stored resume file, addressed by the SHA-256 of its content."""
+
+    __tablename__ = "resume_blobs"
+
+    sha256 = db.Column(db.String(64), primary_key=True)
+    storage_path = db.Column(db.String(500), nullable=False)
+    size_bytes = db.Column(db.BigInteger, nullable=False)
+    original_filename = db.Column(db.String(255), nullable=False)
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(UTC), nullable=False
+    )
+
+    def to_dict(self):
+        return {
+            "sha256": self.sha256,
+            "size_bytes": self.size_bytes,
+            "original_filename": self.original_filename,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+class ResumeParse(db.Model):
+    """Cached parser output for a resume's content, per parser version."""
+
+    __tablename__ = "resume_parses"
+
+    content_sha256 = db.Column(db.String(64), primary_key=True)
+    parser_version = db.Column(db.String(40), primary_key=True)
+    extracted_text = db.Column(db.Text, nullable=False)
+    profile_json = db.Column(db.JSON, nullable=True)
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(UTC), nullable=False
+    )
@@ -5,6 +5,7 @@ from app.extensions import db
 
 class ReviewNote(db.Model):
     __tablename__ = "review_notes"
+    __table_args__ = (db.Index("ix_review_notes_application_id_created_at", "application_id", "created_at"),)
 
     id = db.Column(db.Integer, primary_key=True)
     application_id = db.Column(
@@ -0,0 +1,11 @@
+from app.extensions import db
+
+
+class Term(db.Model):
+    __tablename__ = "terms"
+
+    id = db.Column(db.Integer, primary_key=True)
+    text = db.Column(db.Text, unique=True, nullable=False)
+
+    def to_dict(self):
+        return {"id": self.id, "text": self.text}
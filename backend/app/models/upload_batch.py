@@ -0,0 +1,64 @@
+from datetime import UTC, datetime
+
+from app.extensions import db
+
+
+class UploadBatch(db.Model):
+    __tablename__ = "upload_batches"
+
+    id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(50), nullable=False, default="queued")
+    total_files = db.Column(db.Integer, nullable=False, default=0)
+    created_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+    created_at = db.Column(
+        db.DateTime, default=lambda: datetime.now(UTC), nullable=False
+    )
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    items = db.relationship(
+        "UploadBatchItem", back_populates="batch", cascade="all, delete-orphan", order_by="UploadBatchItem.id"
+    )
+
+    def to_dict(self, counts: dict[str, int] | None = None, job=None):
+        counts = counts or {}
+        status = self.status
+        if job is not None and status != "completed" and job.status in {"cancelled", "dead"}:
+            # The job's outcome wins: a cancelled or dead-lettered job leaves the batch "processing".
+            status = "cancelled" if job.status == "cancelled" else "failed"
+        accepted = self.total_files - counts.get("rejected", 0)
+        finished = counts.get("processed", 0) + counts.get("failed", 0)
+        return {
+            "id": self.id,
+            "status": status,
+            "total_files": self.total_files,
+            "accepted": accepted,
+            "rejected": counts.get("rejected", 0),
+            "pending": counts.get("pending", 0),
+            "processed": counts.get("processed", 0),
+            "failed": counts.get("failed", 0),
+            "progress": round(finished / accepted, 4) if accepted else 1.0,
+            "created_at": self.created_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+
+
+class UploadBatchItem(db.Model):
+    __tablename__ = "upload_batch_items"
+
+    id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.Integer, db.ForeignKey("upload_batches.id"), nullable=False, index=True)
+    filename = db.Column(db.String(255), nullable=False)
+    status = db.Column(db.String(50), nullable=False, default="pending")
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidates.id"), nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+
+    batch = db.relationship("UploadBatch", back_populates="items")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "candidate_id": self.candidate_id,
+            "error_message": self.error_message,
+        }
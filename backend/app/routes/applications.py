@@ -1,54 +1,237 @@
 import csv
-import re
+import heapq
+from dataclasses import dataclass, field
 from io import StringIO
-from datetime import UTC, datetime
+from datetime import datetime
 
-from flask import Blueprint, Response, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from flasgger import swag_from
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
 
 from app.auth import require_auth
 from app.extensions import db
 from app.models.application import Application
 from app.models.candidate import Candidate
+from app.models.candidate_features import CandidateFeatures
 from app.models.job_description import JobDescription
 from app.models.review_note import ReviewNote
-from app.services.scoring import score_candidate_against_jd
+from app.services.application_status import set_status_by_id, set_status_where
+from app.services.batch_scoring import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_TOP_N,
+    MAX_CHUNK_SIZE,
+    MAX_TOP_N,
+    SCORING_ENGINES,
+    link_candidates_to_jd,
+    rerank_applications_for_jd,
+    score_applications_for_jd,
+)
+from app.services.candidate_features import (
+    analysis_matches_skills,
+    candidate_analysis,
+    features_match_skills,
+    get_candidate_features,
+    is_current,
+    record_from_row,
+    resolve_profile_term_ids,
+    resolve_skill_term_ids,
+)
+from app.services.candidate_index import skills_filter
+from app.services.candidate_search import SearchQueryError, search_candidate_ids
+from app.services.jd_profiles import get_jd_profile
+from app.services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    parse_page_args,
+    rows_after,
+)
+from app.services.scoring import CandidateAnalysis, score_features_against_profile, scorer_version
+from app.services.taxonomy import canonical_skill
 
 applications_bp = Blueprint("applications", __name__)
 VALID_STATUSES = {"new", "reviewed", "shortlisted", "rejected"}
+LIST_SCAN_BATCH_SIZE = 500
+MAX_BULK_STATUS_APPLICATIONS = 10_000
+MAX_BULK_LINK_CANDIDATES = 50_000
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CHUNK_BYTES = 64 * 1024
+EXPORT_COLUMNS = [
+    "application_id",
+    "candidate_id",
+    "full_name",
+    "email",
+    "phone",
+    "total_score",
+    "status",
+    "reviewed_by",
+    "reviewed_at",
+]
 
 
-def _extract_candidate_years(candidate: Candidate) -> int | None:
-    if isinstance(candidate.profile_json, dict):
+def _extract_candidate_years(
+    candidate: Candidate,
+    features: CandidateFeatures | None = None,
+    analysis: CandidateAnalysis | None = None,
+) -> int | None:
+    if is_current(features):
+        return features.years_experience
+    if analysis is None and isinstance(candidate.profile_json, dict):
+        # The profile's years take precedence in the analysis too; skip scanning the text.
         years = candidate.profile_json.get("years_experience")
         if isinstance(years, (int, float)):
             return int(years)
+    return (analysis or candidate_analysis(candidate)).years_experience
 
-    text = (candidate.extracted_text or "").lower()
-    match = re.search(r"(\d{1,2})\s*\+?\s*years?", text)
-    if match:
-        return int(match.group(1))
-    return None
 
-
-def _candidate_matches_skills(candidate: Candidate, required_skills: set[str]) -> bool:
+def _candidate_matches_skills(
+    candidate: Candidate,
+    required_skills: set[str],
+    features: CandidateFeatures | None = None,
+    skill_term_ids: dict[str, list[int] | None] | None = None,
+    analysis: CandidateAnalysis | None = None,
+) -> bool:
     if not required_skills:
         return True
 
-    profile_skills = set()
-    if isinstance(candidate.profile_json, dict):
-        skills = candidate.profile_json.get("skills")
-        if isinstance(skills, list):
-            profile_skills = {str(skill).strip().lower() for skill in skills if str(skill).strip()}
+    if is_current(features):
+        return features_match_skills(record_from_row(features), required_skills, skill_term_ids or {})
+    # No stored record yet: analyze the candidate the way the record would be built.
+    return analysis_matches_skills(analysis or candidate_analysis(candidate), required_skills)
+
+
+@dataclass
+class _ApplicationFilters:
+    """Filters of the applications list, shared with the shortlist export."""
+
+    min_score: float | None = None
+    max_score: float | None = None
+    status: str | None = None
+    required_skills: set[str] = field(default_factory=set)
+    min_experience: int | None = None
+
+    @property
+    def checks_candidates(self) -> bool:
+        return bool(self.required_skills) or self.min_experience is not None
+
+
+def _parse_application_filters(args, default_status: str | None = None) -> _ApplicationFilters:
+    """Filters from the query string or a JSON object; ``ValueError`` with a client message if one is invalid."""
+    filters = _ApplicationFilters(status=args.get("status") or default_status)
+    for name in ("min_score", "max_score"):
+        if args.get(name) is not None:
+            try:
+                if isinstance(args[name], bool):
+                    raise ValueError
+                setattr(filters, name, float(args[name]))
+            except (TypeError, ValueError):
+                raise ValueError(f"{name} must be a number") from None
+    if filters.status is not None and filters.status not in VALID_STATUSES:
+        raise ValueError("invalid status value")
+    filters.required_skills = {
+        canonical_skill(skill) for skill in (args.get("skills") or "").split(",") if skill.strip()
+    }
+    if args.get("min_experience") is not None:
+        value = args["min_experience"]
+        try:
+            # JSON bodies: int() would turn true into 1 and truncate 2.5 to 2.
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError
+            filters.min_experience = int(value)
+        except (TypeError, ValueError):
+            raise ValueError("min_experience must be an integer") from None
+    return filters
+
+
+def _apply_application_filters(query, filters: _ApplicationFilters):
+    """``(query, stale, skill_term_ids)``: ``query`` narrowed by ``filters``.
+
+    Skills and experience are filtered in SQL on the stored feature records.
+    Candidates whose record is missing or outdated pass the SQL filter and must be
+    checked with :func:`_candidate_passes_filters`; ``stale`` selects them, and is
+    ``None`` when no candidate filter is set.
+    """
+    if filters.min_score is not None:
+        query = query.filter(Application.total_score.isnot(None), Application.total_score >= filters.min_score)
+    if filters.max_score is not None:
+        query = query.filter(Application.total_score.isnot(None), Application.total_score <= filters.max_score)
+    if filters.status is not None:
+        query = query.filter(Application.status == filters.status)
+    if not filters.checks_candidates:
+        return query, None, {}
 
-    text_blob = (candidate.extracted_text or "").lower()
-    for skill in required_skills:
-        if skill in profile_skills or skill in text_blob:
-            continue
+    skill_term_ids = resolve_skill_term_ids(filters.required_skills) if filters.required_skills else {}
+    version = scorer_version()
+    pushed_down = [CandidateFeatures.feature_version == version]
+    if filters.required_skills:
+        pushed_down.append(skills_filter(filters.required_skills, skill_term_ids, Application.candidate_id))
+    if filters.min_experience is not None:
+        pushed_down.append(CandidateFeatures.years_experience >= filters.min_experience)
+    stale = or_(CandidateFeatures.candidate_id.is_(None), CandidateFeatures.feature_version != version)
+    query = query.outerjoin(CandidateFeatures, CandidateFeatures.candidate_id == Application.candidate_id).filter(
+        or_(and_(*pushed_down), stale)
+    )
+    return query, stale, skill_term_ids
+
+
+def _candidate_passes_filters(
+    candidate: Candidate,
+    features: CandidateFeatures | None,
+    filters: _ApplicationFilters,
+    skill_term_ids: dict[str, list[int] | None],
+) -> bool:
+    analysis = None if is_current(features) else candidate_analysis(candidate)
+    if not _candidate_matches_skills(candidate, filters.required_skills, features, skill_term_ids, analysis):
         return False
+    if filters.min_experience is not None:
+        candidate_years = _extract_candidate_years(candidate, features, analysis)
+        if candidate_years is None or candidate_years < filters.min_experience:
+            return False
     return True
 
 
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _optional_float(value) -> float | None:
+    return None if value is None else float(value)
+
+
+def _applications_after(sort: str, total_score: float | None, application_id: int) -> list:
+    """Filters selecting the applications listed after the one with ``total_score`` and ``application_id``.
+
+    Scored and unscored applications are separate segments, in listing order:
+    OR-ing them into one filter would stop the database from seeking to the
+    cursor in the ``(jd_id, total_score)`` index.
+    """
+    score, app_id = Application.total_score, Application.id
+    if total_score is None:
+        unscored = and_(score.is_(None), app_id > application_id)
+        scored = score.isnot(None)
+    else:
+        unscored = score.is_(None)
+        scored = rows_after([(score, sort == "score_desc"), (app_id, False)], [total_score, application_id])
+
+    if sort == "score_asc":
+        # Unscored applications come first.
+        return [unscored, scored] if total_score is None else [scored]
+    return [unscored] if total_score is None else [scored, unscored]
+
+
+def _existing_application_id(candidate_id: int, jd_id: int) -> int | None:
+    return db.session.query(Application.id).filter_by(candidate_id=candidate_id, jd_id=jd_id).scalar()
+
+
+def _already_applied(application_id: int):
+    return jsonify({"error": "candidate already applied to this job description", "application_id": application_id}), 409
+
+
 @applications_bp.post("/applications")
 @require_auth(roles={"admin", "recruiter"})
 @swag_from(
@@ -71,7 +254,11 @@ def _candidate_matches_skills(candidate: Candidate, required_skills: set[str]) -
                 }
             },
         },
-        "responses": {201: {"description": "Application created"}, 400: {"description": "Invalid payload"}},
+        "responses": {
+            201: {"description": "Application created"},
+            400: {"description": "Invalid payload"},
+            409: {"description": "Candidate already applied to the JD"},
+        },
     }
 )
 def create_application():
@@ -86,6 +273,9 @@ def create_application():
     jd = db.session.get(JobDescription, jd_id)
     if candidate is None or jd is None:
         return jsonify({"error": "candidate or job description not found"}), 400
+    existing = _existing_application_id(candidate_id, jd_id)
+    if existing is not None:
+        return _already_applied(existing)
 
     application = Application(
         candidate_id=candidate_id,
@@ -95,10 +285,105 @@ def create_application():
         status="new",
     )
     db.session.add(application)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # A concurrent request created the same pair between the check and the insert.
+        db.session.rollback()
+        existing = _existing_application_id(candidate_id, jd_id)
+        if existing is None:
+            raise
+        return _already_applied(existing)
     return jsonify(application.to_dict()), 201
 
 
+@applications_bp.post("/jds/<int:jd_id>/applications/bulk")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Applications"],
+        "description": "Links many candidates to a JD and scores the new applications in the same pass. "
+        "Candidates that already applied are skipped.",
+        "parameters": [
+            {
+                "name": "jd_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "candidate_ids": {"type": "array", "items": {"type": "integer"}},
+                            "search": {
+                                "type": "string",
+                                "description": "Link every candidate matching this full-text query",
+                                "example": "python AND (aws OR gcp)",
+                            },
+                            "weights": {
+                                "type": "object",
+                                "properties": {
+                                    "skills": {"type": "number"},
+                                    "experience": {"type": "number"},
+                                    "education": {"type": "number"},
+                                    "keywords": {"type": "number"},
+                                },
+                            },
+                            "chunk_size": {"type": "integer", "example": 500},
+                            "engine": {"type": "string", "enum": ["python", "numpy"], "default": "numpy"},
+                        },
+                    }
+                }
+            },
+        },
+        "responses": {
+            200: {"description": "Link summary: created, existing and unknown candidates"},
+            400: {"description": "Invalid payload or search query"},
+            404: {"description": "JD not found"},
+        },
+    }
+)
+def bulk_create_applications_for_jd(jd_id: int):
+    jd = db.session.get(JobDescription, jd_id)
+    if jd is None:
+        return jsonify({"error": "job description not found"}), 404
+
+    payload = request.get_json(silent=True) or {}
+    candidate_ids, search = payload.get("candidate_ids"), payload.get("search")
+    if (candidate_ids is None) == (search is None):
+        return jsonify({"error": "provide either candidate_ids or search"}), 400
+    if candidate_ids is not None:
+        if not isinstance(candidate_ids, list) or not candidate_ids or not all(map(_is_int, candidate_ids)):
+            return jsonify({"error": "candidate_ids must be a non-empty list of integers"}), 400
+    else:
+        if not isinstance(search, str):
+            return jsonify({"error": "search must be a string"}), 400
+        try:
+            candidate_ids = search_candidate_ids(search, limit=MAX_BULK_LINK_CANDIDATES + 1)
+        except SearchQueryError as exc:
+            return jsonify({"error": str(exc)}), 400
+    if len(candidate_ids) > MAX_BULK_LINK_CANDIDATES:
+        return jsonify({"error": f"at most {MAX_BULK_LINK_CANDIDATES} candidates per request"}), 400
+
+    weights = payload.get("weights")
+    if weights is not None and not isinstance(weights, dict):
+        return jsonify({"error": "weights must be an object"}), 400
+    chunk_size = payload.get("chunk_size", DEFAULT_CHUNK_SIZE)
+    if not _is_int(chunk_size) or not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+        return jsonify({"error": f"chunk_size must be an integer between 1 and {MAX_CHUNK_SIZE}"}), 400
+    engine = payload.get("engine", "numpy")
+    if engine not in SCORING_ENGINES:
+        return jsonify({"error": "engine must be one of: " + ", ".join(SCORING_ENGINES)}), 400
+
+    summary = link_candidates_to_jd(jd, candidate_ids, weights=weights, chunk_size=chunk_size, engine=engine)
+    return jsonify(summary.to_dict()), 200
+
+
 @applications_bp.get("/jds/<int:jd_id>/applications")
 @require_auth(roles={"admin", "recruiter"})
 @swag_from(
@@ -147,10 +432,31 @@ def create_application():
                 "required": False,
                 "schema": {"type": "integer", "example": 3},
             },
+            {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "minimum": 1, "maximum": MAX_PAGE_SIZE, "example": DEFAULT_PAGE_SIZE},
+            },
+            {
+                "name": "cursor",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "string"},
+            },
+            {
+                "name": "offset",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "minimum": 0, "example": 0},
+            },
         ],
         "responses": {
-            200: {"description": "Applications for a JD"},
-            400: {"description": "Invalid query filter"},
+            200: {
+                "description": "Applications for a JD",
+                "headers": {NEXT_CURSOR_HEADER: {"description": "Cursor of the next page, absent on the last page"}},
+            },
+            400: {"description": "Invalid query filter, limit or cursor"},
             404: {"description": "JD not found"},
         },
     }
@@ -160,70 +466,90 @@ def list_applications_for_jd(jd_id: int):
     if jd is None:
         return jsonify({"error": "job description not found"}), 404
 
-    sort = request.args.get("sort", "score_desc")
-    query = (
-        db.session.query(Application, Candidate)
-        .join(Candidate, Candidate.id == Application.candidate_id)
-        .filter(Application.jd_id == jd_id)
-    )
+    sort = "score_asc" if request.args.get("sort") == "score_asc" else "score_desc"
+    query = db.session.query(Application).filter(Application.jd_id == jd_id)
 
-    min_score = request.args.get("min_score")
-    max_score = request.args.get("max_score")
-    if min_score is not None:
-        try:
-            min_score_value = float(min_score)
-        except ValueError:
-            return jsonify({"error": "min_score must be a number"}), 400
-        query = query.filter(Application.total_score.isnot(None), Application.total_score >= min_score_value)
+    try:
+        limit, cursor = parse_page_args(request.args)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    try:
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        return jsonify({"error": "offset must be an integer"}), 400
+    if offset < 0:
+        return jsonify({"error": "offset must not be negative"}), 400
 
-    if max_score is not None:
+    cursor_scope = f"applications:{jd_id}:{sort}"
+    segments = []
+    if cursor:
+        if offset:
+            return jsonify({"error": "cursor and offset cannot be combined"}), 400
         try:
-            max_score_value = float(max_score)
-        except ValueError:
-            return jsonify({"error": "max_score must be a number"}), 400
-        query = query.filter(Application.total_score.isnot(None), Application.total_score <= max_score_value)
-
-    status_filter = request.args.get("status")
-    if status_filter:
-        if status_filter not in VALID_STATUSES:
-            return jsonify({"error": "invalid status value"}), 400
-        query = query.filter(Application.status == status_filter)
-
-    required_skills = {
-        skill.strip().lower()
-        for skill in (request.args.get("skills") or "").split(",")
-        if skill.strip()
-    }
+            segments = _applications_after(sort, *decode_cursor(cursor, cursor_scope, _optional_float, int))
+        except InvalidCursor as exc:
+            return jsonify({"error": str(exc)}), 400
 
-    min_experience = request.args.get("min_experience")
-    min_experience_value = None
-    if min_experience is not None:
-        try:
-            min_experience_value = int(min_experience)
-        except ValueError:
-            return jsonify({"error": "min_experience must be an integer"}), 400
-
-    rows = query.all()
-    filtered_applications = []
-    for application, candidate in rows:
-        if not _candidate_matches_skills(candidate, required_skills):
-            continue
-        if min_experience_value is not None:
-            candidate_years = _extract_candidate_years(candidate)
-            if candidate_years is None or candidate_years < min_experience_value:
-                continue
-        filtered_applications.append(application)
+    try:
+        filters = _parse_application_filters(request.args)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    query, stale, skill_term_ids = _apply_application_filters(query, filters)
 
+    # Unscored applications sort last by descending score and first by ascending
+    # score; ties keep application order.
     if sort == "score_asc":
-        filtered_applications.sort(
-            key=lambda item: (item.total_score is not None, item.total_score if item.total_score is not None else 0.0)
-        )
+        order_by = (Application.total_score.asc().nulls_first(), Application.id.asc())
+
+        def sort_key(item):
+            return (item.total_score is not None, item.total_score or 0.0, item.id)
+
     else:
-        filtered_applications.sort(
-            key=lambda item: (item.total_score is None, -(item.total_score if item.total_score is not None else 0.0))
-        )
+        order_by = (Application.total_score.desc().nulls_last(), Application.id.asc())
+
+        def sort_key(item):
+            return (item.total_score is None, -(item.total_score or 0.0), item.id)
 
-    return jsonify([item.to_dict() for item in filtered_applications]), 200
+    def page_response(applications):
+        # Pages are fetched with one extra row, which tells whether there is a next page.
+        headers = {}
+        if limit is not None and len(applications) > limit:
+            applications = applications[:limit]
+            last = applications[-1]
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(cursor_scope, [last.total_score, last.id])
+        return jsonify([item.to_dict() for item in applications]), 200, headers
+
+    # Unless some candidates still need checking in Python, the database sorts and pages.
+    has_stale_candidates = stale is not None and db.session.query(query.filter(stale).exists()).scalar()
+    if not has_stale_candidates:
+        if not segments:
+            return page_response(
+                query.order_by(*order_by).offset(offset).limit(None if limit is None else limit + 1).all()
+            )
+        applications = []
+        for segment in segments:
+            applications += query.filter(segment).order_by(*order_by).limit(limit + 1 - len(applications)).all()
+            if len(applications) > limit:
+                break
+        return page_response(applications)
+
+    if segments:
+        query = query.filter(or_(*segments))
+    rows = (
+        query.join(Candidate, Candidate.id == Application.candidate_id)
+        .add_columns(Candidate, CandidateFeatures)
+        .yield_per(LIST_SCAN_BATCH_SIZE)
+    )
+
+    def matching_applications():
+        for application, candidate, features in rows:
+            if _candidate_passes_filters(candidate, features, filters, skill_term_ids):
+                yield application
+
+    if limit is None:
+        return page_response(sorted(matching_applications(), key=sort_key)[offset:])
+    # Bounded heap: memory grows with offset + limit, not with the number of applicants.
+    return page_response(heapq.nsmallest(offset + limit + 1, matching_applications(), key=sort_key)[offset:])
 
 
 @applications_bp.get("/jds/<int:jd_id>/shortlist/export.csv")
@@ -237,9 +563,47 @@ def list_applications_for_jd(jd_id: int):
                 "in": "path",
                 "required": True,
                 "schema": {"type": "integer"},
-            }
+            },
+            {
+                "name": "status",
+                "in": "query",
+                "required": False,
+                "schema": {
+                    "type": "string",
+                    "enum": ["new", "reviewed", "shortlisted", "rejected"],
+                    "default": "shortlisted",
+                },
+            },
+            {
+                "name": "min_score",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "number", "example": 60},
+            },
+            {
+                "name": "max_score",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "number", "example": 95},
+            },
+            {
+                "name": "skills",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "string", "example": "python,flask"},
+            },
+            {
+                "name": "min_experience",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "example": 3},
+            },
         ],
-        "responses": {200: {"description": "Shortlist export CSV"}, 404: {"description": "JD not found"}},
+        "responses": {
+            200: {"description": "Shortlist export CSV, best score first"},
+            400: {"description": "Invalid query filter"},
+            404: {"description": "JD not found"},
+        },
     }
 )
 def export_shortlist_csv(jd_id: int):
@@ -247,54 +611,181 @@ def export_shortlist_csv(jd_id: int):
     if jd is None:
         return jsonify({"error": "job description not found"}), 404
 
-    rows = (
-        db.session.query(Application, Candidate)
-        .join(Candidate, Candidate.id == Application.candidate_id)
-        .filter(Application.jd_id == jd_id, Application.status == "shortlisted")
-        .order_by(Application.total_score.desc())
-        .all()
+    try:
+        filters = _parse_application_filters(request.args, default_status="shortlisted")
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    query, stale, skill_term_ids = _apply_application_filters(
+        db.session.query(Application).filter(Application.jd_id == jd_id), filters
     )
-
-    out = StringIO()
-    writer = csv.writer(out)
-    writer.writerow(
-        [
-            "application_id",
-            "candidate_id",
-            "full_name",
-            "email",
-            "phone",
-            "total_score",
-            "status",
-            "reviewed_by",
-            "reviewed_at",
-        ]
+    query = query.join(Candidate, Candidate.id == Application.candidate_id).add_columns(Candidate)
+    if stale is not None:
+        query = query.add_columns(CandidateFeatures)
+    else:
+        query = query.options(load_only(Candidate.full_name, Candidate.email, Candidate.phone))
+    # yield_per streams rows in batches (a server-side cursor on PostgreSQL).
+    rows = query.order_by(Application.total_score.desc().nulls_last(), Application.id.asc()).yield_per(
+        EXPORT_BATCH_SIZE
     )
 
-    for application, candidate in rows:
-        writer.writerow(
-            [
-                application.id,
-                candidate.id,
-                candidate.full_name or "",
-                candidate.email or "",
-                candidate.phone or "",
-                application.total_score if application.total_score is not None else "",
-                application.status,
-                application.reviewed_by or "",
-                application.reviewed_at.isoformat() if application.reviewed_at else "",
-            ]
-        )
+    def generate_csv():
+        # Rows are written to a small buffer that is flushed every EXPORT_CHUNK_BYTES,
+        # so memory stays flat however many rows the export has.
+        out = StringIO()
+        writer = csv.writer(out)
+        writer.writerow(EXPORT_COLUMNS)
+        for application, candidate, *features in rows:
+            if features and not is_current(features[0]):
+                if not _candidate_passes_filters(candidate, features[0], filters, skill_term_ids):
+                    continue
+            writer.writerow(
+                [
+                    application.id,
+                    candidate.id,
+                    candidate.full_name or "",
+                    candidate.email or "",
+                    candidate.phone or "",
+                    application.total_score if application.total_score is not None else "",
+                    application.status,
+                    application.reviewed_by or "",
+                    application.reviewed_at.isoformat() if application.reviewed_at else "",
+                ]
+            )
+            if out.tell() >= EXPORT_CHUNK_BYTES:
+                yield out.getvalue()
+                out.seek(0)
+                out.truncate()
+        yield out.getvalue()
 
-    csv_data = out.getvalue()
     filename = f"jd_{jd_id}_shortlist.csv"
     return Response(
-        csv_data,
+        stream_with_context(generate_csv()),
         mimetype="text/csv",
-        headers={"Content-Disposition": f'attachment; filename=\"{filename}\"'},
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
+@applications_bp.patch("/applications/status")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Applications"],
+        "description": "Applies one status to many applications in a single transaction. Select them by id, "
+        "optionally with the version last seen for each (stale versions are reported as conflicts), "
+        "or by jd_id plus the ranked-list filters.",
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["status"],
+                        "properties": {
+                            "status": {"type": "string", "enum": ["new", "reviewed", "shortlisted", "rejected"]},
+                            "reviewed_by": {"type": "string"},
+                            "applications": {
+                                "type": "array",
+                                "items": {
+                                    "oneOf": [
+                                        {"type": "integer"},
+                                        {
+                                            "type": "object",
+                                            "required": ["id"],
+                                            "properties": {"id": {"type": "integer"}, "version": {"type": "integer"}},
+                                        },
+                                    ]
+                                },
+                            },
+                            "jd_id": {"type": "integer"},
+                            "filter": {
+                                "type": "object",
+                                "properties": {
+                                    "status": {"type": "string"},
+                                    "min_score": {"type": "number"},
+                                    "max_score": {"type": "number"},
+                                    "skills": {"type": "array", "items": {"type": "string"}},
+                                    "min_experience": {"type": "integer"},
+                                },
+                            },
+                        },
+                    }
+                }
+            },
+        },
+        "responses": {
+            200: {"description": "Per-application results: updated, conflict or not_found"},
+            400: {"description": "Invalid payload"},
+            404: {"description": "JD not found"},
+        },
+    }
+)
+def bulk_update_application_status():
+    payload = request.get_json(silent=True) or {}
+    status = payload.get("status")
+    if status not in VALID_STATUSES:
+        return jsonify({"error": "invalid status value"}), 400
+    reviewed_by = payload.get("reviewed_by")
+    applications, jd_id = payload.get("applications"), payload.get("jd_id")
+    if (applications is None) == (jd_id is None):
+        return jsonify({"error": "provide either applications or jd_id"}), 400
+
+    if applications is not None:
+        if not isinstance(applications, list) or not applications:
+            return jsonify({"error": "applications must be a non-empty list"}), 400
+        if len(applications) > MAX_BULK_STATUS_APPLICATIONS:
+            return jsonify({"error": f"at most {MAX_BULK_STATUS_APPLICATIONS} applications per request"}), 400
+        expected_versions: dict[int, int | None] = {}
+        for item in applications:
+            application_id, version = (item.get("id"), item.get("version")) if isinstance(item, dict) else (item, None)
+            if not _is_int(application_id) or not (version is None or _is_int(version)):
+                return jsonify({"error": "applications must be ids or objects with integer id and version"}), 400
+            expected_versions[application_id] = version
+        results = set_status_by_id(expected_versions, status, reviewed_by)
+    else:
+        if not _is_int(jd_id):
+            return jsonify({"error": "jd_id must be an integer"}), 400
+        if db.session.get(JobDescription, jd_id) is None:
+            return jsonify({"error": "job description not found"}), 404
+        filter_args = payload.get("filter") or {}
+        if not isinstance(filter_args, dict):
+            return jsonify({"error": "filter must be an object"}), 400
+        skills = filter_args.get("skills")
+        if isinstance(skills, list) and all(isinstance(skill, str) for skill in skills):
+            filter_args = {**filter_args, "skills": ",".join(skills)}
+        elif skills is not None and not isinstance(skills, str):
+            return jsonify({"error": "skills must be a string or a list of strings"}), 400
+        try:
+            filters = _parse_application_filters(filter_args)
+        except (TypeError, ValueError) as exc:
+            return jsonify({"error": str(exc)}), 400
+        query, stale, skill_term_ids = _apply_application_filters(
+            db.session.query(Application.id).filter(Application.jd_id == jd_id), filters
+        )
+        if stale is None:
+            # Only application columns are filtered: a single UPDATE ... WHERE does it all.
+            updated = set_status_where([query.whereclause], status, reviewed_by)
+            results = [
+                {"id": application_id, "result": "updated", "version": updated[application_id]}
+                for application_id in sorted(updated)
+            ]
+        else:
+            rows = query.join(Candidate, Candidate.id == Application.candidate_id).add_columns(
+                Candidate, CandidateFeatures
+            )
+            matching = [
+                application_id
+                for application_id, candidate, features in rows.yield_per(LIST_SCAN_BATCH_SIZE)
+                if is_current(features) or _candidate_passes_filters(candidate, features, filters, skill_term_ids)
+            ]
+            results = set_status_by_id(dict.fromkeys(sorted(matching)), status, reviewed_by)
+    db.session.commit()
+
+    counts = {outcome: 0 for outcome in ("updated", "conflict", "not_found")}
+    for result in results:
+        counts[result["result"]] += 1
+    return jsonify({"status": status, **counts, "results": results}), 200
+
+
 @applications_bp.patch("/applications/<int:application_id>/status")
 @require_auth(roles={"admin", "recruiter"})
 @swag_from(
@@ -321,12 +812,21 @@ def export_shortlist_csv(jd_id: int):
                                 "enum": ["new", "reviewed", "shortlisted", "rejected"],
                             },
                             "reviewed_by": {"type": "string"},
+                            "version": {
+                                "type": "integer",
+                                "description": "Version last seen; the update is refused if it changed since",
+                            },
                         },
                     }
                 }
             },
         },
-        "responses": {200: {"description": "Status updated"}, 400: {"description": "Invalid status"}, 404: {"description": "Not found"}},
+        "responses": {
+            200: {"description": "Status updated"},
+            400: {"description": "Invalid status"},
+            404: {"description": "Not found"},
+            409: {"description": "Application changed since the given version"},
+        },
     }
 )
 def update_application_status(application_id: int):
@@ -338,10 +838,14 @@ def update_application_status(application_id: int):
     status = payload.get("status")
     if status not in VALID_STATUSES:
         return jsonify({"error": "invalid status value"}), 400
+    version = payload.get("version")
+    if version is not None and not _is_int(version):
+        return jsonify({"error": "version must be an integer"}), 400
 
-    application.status = status
-    application.reviewed_by = payload.get("reviewed_by")
-    application.reviewed_at = datetime.now(UTC)
+    [result] = set_status_by_id({application_id: version}, status, payload.get("reviewed_by"))
+    if result["result"] != "updated":
+        db.session.rollback()
+        return jsonify({"error": "application was changed by another update", "version": result["version"]}), 409
     db.session.commit()
     return jsonify(application.to_dict()), 200
 
@@ -410,9 +914,28 @@ def create_application_note(application_id: int):
                 "in": "path",
                 "required": True,
                 "schema": {"type": "integer"},
-            }
+            },
+            {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "minimum": 1, "maximum": MAX_PAGE_SIZE, "example": DEFAULT_PAGE_SIZE},
+            },
+            {
+                "name": "cursor",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "string"},
+            },
         ],
-        "responses": {200: {"description": "List notes"}, 404: {"description": "Not found"}},
+        "responses": {
+            200: {
+                "description": "List notes, oldest first",
+                "headers": {NEXT_CURSOR_HEADER: {"description": "Cursor of the next page, absent on the last page"}},
+            },
+            400: {"description": "Invalid limit or cursor"},
+            404: {"description": "Not found"},
+        },
     }
 )
 def list_application_notes(application_id: int):
@@ -420,12 +943,28 @@ def list_application_notes(application_id: int):
     if application is None:
         return jsonify({"error": "application not found"}), 404
 
-    notes = (
-        ReviewNote.query.filter_by(application_id=application_id)
-        .order_by(ReviewNote.created_at.asc())
-        .all()
+    try:
+        limit, cursor = parse_page_args(request.args)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    cursor_scope = f"notes:{application_id}"
+    keys = [(ReviewNote.created_at, False), (ReviewNote.id, False)]
+    query = ReviewNote.query.filter_by(application_id=application_id).order_by(
+        ReviewNote.created_at.asc(), ReviewNote.id.asc()
     )
-    return jsonify([note.to_dict() for note in notes]), 200
+    if cursor:
+        try:
+            query = query.filter(rows_after(keys, decode_cursor(cursor, cursor_scope, datetime.fromisoformat, int)))
+        except InvalidCursor as exc:
+            return jsonify({"error": str(exc)}), 400
+
+    notes = query.limit(None if limit is None else limit + 1).all()
+    headers = {}
+    if limit is not None and len(notes) > limit:
+        notes = notes[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(cursor_scope, [notes[-1].created_at, notes[-1].id])
+    return jsonify([note.to_dict() for note in notes]), 200, headers
 
 
 @applications_bp.post("/applications/score")
@@ -478,9 +1017,12 @@ def score_application():
     if candidate is None or jd is None:
         return jsonify({"error": "candidate or job description not found"}), 400
 
-    result = score_candidate_against_jd(
-        candidate=candidate.to_dict(),
-        jd=jd.to_dict(),
+    features = get_candidate_features(candidate)
+    profile = get_jd_profile(jd)
+    result = score_features_against_profile(
+        features=features,
+        profile=profile,
+        jd_term_ids=resolve_profile_term_ids(profile),
         weights=payload.get("weights"),
     )
 
@@ -498,3 +1040,134 @@ def score_application():
         ),
         200,
     )
+
+
+@applications_bp.post("/jds/<int:jd_id>/score-all")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Applications"],
+        "parameters": [
+            {
+                "name": "jd_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "requestBody": {
+            "required": False,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "weights": {
+                                "type": "object",
+                                "properties": {
+                                    "skills": {"type": "number"},
+                                    "experience": {"type": "number"},
+                                    "education": {"type": "number"},
+                                    "keywords": {"type": "number"},
+                                },
+                            },
+                            "chunk_size": {"type": "integer", "example": 500},
+                            "engine": {"type": "string", "enum": ["python", "numpy"]},
+                        },
+                    }
+                }
+            },
+        },
+        "responses": {
+            200: {"description": "All applications scored"},
+            400: {"description": "Invalid payload"},
+            404: {"description": "JD not found"},
+        },
+    }
+)
+def score_all_applications_for_jd(jd_id: int):
+    jd = db.session.get(JobDescription, jd_id)
+    if jd is None:
+        return jsonify({"error": "job description not found"}), 404
+
+    payload = request.get_json(silent=True) or {}
+    weights = payload.get("weights")
+    if weights is not None and not isinstance(weights, dict):
+        return jsonify({"error": "weights must be an object"}), 400
+
+    chunk_size = payload.get("chunk_size", DEFAULT_CHUNK_SIZE)
+    if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+        return jsonify({"error": f"chunk_size must be an integer between 1 and {MAX_CHUNK_SIZE}"}), 400
+
+    engine = payload.get("engine", "python")
+    if engine not in SCORING_ENGINES:
+        return jsonify({"error": "engine must be one of: " + ", ".join(SCORING_ENGINES)}), 400
+
+    summary = score_applications_for_jd(jd, weights=weights, chunk_size=chunk_size, engine=engine)
+    return jsonify(summary.to_dict()), 200
+
+
+@applications_bp.post("/jds/<int:jd_id>/rerank")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Applications"],
+        "parameters": [
+            {
+                "name": "jd_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["weights"],
+                        "properties": {
+                            "weights": {
+                                "type": "object",
+                                "properties": {
+                                    "skills": {"type": "number"},
+                                    "experience": {"type": "number"},
+                                    "education": {"type": "number"},
+                                    "keywords": {"type": "number"},
+                                },
+                            },
+                            "top_n": {"type": "integer", "example": DEFAULT_TOP_N},
+                            "commit": {"type": "boolean", "default": False},
+                        },
+                    }
+                }
+            },
+        },
+        "responses": {
+            200: {"description": "Ranking under the new weights"},
+            400: {"description": "Invalid payload"},
+            404: {"description": "JD not found"},
+        },
+    }
+)
+def rerank_applications(jd_id: int):
+    jd = db.session.get(JobDescription, jd_id)
+    if jd is None:
+        return jsonify({"error": "job description not found"}), 404
+
+    payload = request.get_json(silent=True) or {}
+    weights = payload.get("weights")
+    if not isinstance(weights, dict):
+        return jsonify({"error": "weights object is required"}), 400
+
+    top_n = payload.get("top_n", DEFAULT_TOP_N)
+    if not isinstance(top_n, int) or isinstance(top_n, bool) or not 1 <= top_n <= MAX_TOP_N:
+        return jsonify({"error": f"top_n must be an integer between 1 and {MAX_TOP_N}"}), 400
+
+    commit = payload.get("commit", False)
+    if not isinstance(commit, bool):
+        return jsonify({"error": "commit must be a boolean"}), 400
+
+    result = rerank_applications_for_jd(jd, weights=weights, top_n=top_n, commit=commit)
+    return jsonify(result.to_dict()), 200
@@ -1,17 +1,24 @@
-from datetime import UTC, datetime
 import json
-from pathlib import Path
-from uuid import uuid4
 
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, g, jsonify, request
 from flasgger import swag_from
 from werkzeug.utils import secure_filename
 
 from app.auth import require_auth
 from app.extensions import db
 from app.models.candidate import Candidate
-from app.models.processing_job import ProcessingJob
-from app.services.resume_parser import extract_profile_from_text, parse_resume_file
+from app.models.candidate_features import CandidateFeatures
+from app.models.upload_batch import UploadBatch
+from app.services.bulk_upload import batch_item_counts, enqueue_upload_batch, ingest_uploads, latest_batch_job
+from app.services.candidate_features import refresh_candidate_features
+from app.services.candidate_processing import enqueue_candidate_processing
+from app.services.candidate_search import (
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    SearchQueryError,
+    search_candidates,
+)
+from app.services.uploads import find_blob, store_upload
 
 candidates_bp = Blueprint("candidates", __name__)
 
@@ -29,13 +36,17 @@ candidates_bp = Blueprint("candidates", __name__)
                         "type": "object",
                         "properties": {
                             "resume": {"type": "string", "format": "binary"},
+                            "resume_sha256": {
+                                "type": "string",
+                                "description": "Reference an already stored resume instead of sending the file",
+                            },
+                            "resume_filename": {"type": "string"},
                             "full_name": {"type": "string"},
                             "email": {"type": "string"},
                             "phone": {"type": "string"},
                             "extracted_text": {"type": "string"},
                             "profile_json": {"type": "string", "example": "{\"skills\": [\"python\"], \"years_experience\": 4}"},
                         },
-                        "required": ["resume"],
                     }
                 }
             },
@@ -47,23 +58,24 @@ candidates_bp = Blueprint("candidates", __name__)
     }
 )
 def upload_candidate_resume():
-    if "resume" not in request.files:
+    resume = request.files.get("resume")
+    resume_sha256 = (request.form.get("resume_sha256") or "").strip().lower()
+    if resume is None and not resume_sha256:
         return jsonify({"error": "resume file is required"}), 400
 
-    resume = request.files["resume"]
-    if not resume.filename:
-        return jsonify({"error": "resume filename is required"}), 400
-
-    configured_upload = current_app.config.get("UPLOAD_DIR", "uploads")
-    upload_root = Path(configured_upload)
-    if not upload_root.is_absolute():
-        upload_root = Path(current_app.root_path).parent / upload_root
-    upload_root.mkdir(parents=True, exist_ok=True)
-
-    safe_name = secure_filename(resume.filename)
-    unique_name = f"{uuid4().hex}_{safe_name}"
-    output_path = upload_root / unique_name
-    resume.save(output_path)
+    if resume is not None:
+        if not resume.filename:
+            return jsonify({"error": "resume filename is required"}), 400
+        safe_name = secure_filename(resume.filename)
+        stored = store_upload(resume.stream, resume.filename)
+        resume_path, resume_sha256, deduplicated = str(stored.path), stored.sha256, stored.deduplicated
+    else:
+        # The client checked HEAD /api/resumes/<sha256> and skips sending bytes we already have.
+        blob = find_blob(resume_sha256)
+        if blob is None:
+            return jsonify({"error": "unknown resume_sha256; upload the file instead"}), 400
+        safe_name = secure_filename(request.form.get("resume_filename") or "") or blob.original_filename
+        resume_path, deduplicated = blob.storage_path, True
 
     profile_json = None
     raw_profile = request.form.get("profile_json")
@@ -81,11 +93,14 @@ def upload_candidate_resume():
         email=(request.form.get("email") or None),
         phone=(request.form.get("phone") or None),
         resume_filename=safe_name,
-        resume_path=str(output_path),
+        resume_path=resume_path,
+        resume_sha256=resume_sha256,
         extracted_text=(request.form.get("extracted_text") or None),
         profile_json=profile_json,
     )
     db.session.add(candidate)
+    refresh_candidate_features(candidate)
+    job = enqueue_candidate_processing(candidate)
     db.session.commit()
 
     return (
@@ -94,12 +109,174 @@ def upload_candidate_resume():
                 "message": "resume accepted",
                 "candidate": candidate.to_dict(),
                 "status": "queued",
+                "job": job.to_dict(),
+                "deduplicated": deduplicated,
             }
         ),
         201,
     )
 
 
+@candidates_bp.post("/candidates/bulk-upload")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Candidates"],
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "resume": {
+                                "type": "array",
+                                "items": {"type": "string", "format": "binary"},
+                                "description": "Resume files; .zip archives are expanded",
+                            },
+                        },
+                        "required": ["resume"],
+                    }
+                }
+            },
+        },
+        "responses": {
+            202: {"description": "Batch stored and queued for processing"},
+            400: {"description": "No files uploaded"},
+        },
+    }
+)
+def bulk_upload_candidate_resumes():
+    files = [storage for storage in request.files.getlist("resume") if storage.filename]
+    if not files:
+        return jsonify({"error": "at least one resume file is required"}), 400
+
+    batch = ingest_uploads(files, created_by=g.current_user.id)
+    job = enqueue_upload_batch(batch)
+    db.session.commit()
+
+    return (
+        jsonify(
+            {
+                "batch": batch.to_dict(batch_item_counts(batch.id), job),
+                "items": [item.to_dict() for item in batch.items],
+                "job": job.to_dict(),
+            }
+        ),
+        202,
+        {"Location": f"/api/candidates/bulk-upload/{batch.id}"},
+    )
+
+
+@candidates_bp.get("/candidates/bulk-upload/<int:batch_id>")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Candidates"],
+        "parameters": [
+            {
+                "name": "batch_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "responses": {200: {"description": "Batch progress and per-file outcomes"}, 404: {"description": "Not found"}},
+    }
+)
+def get_upload_batch(batch_id: int):
+    batch = db.session.get(UploadBatch, batch_id)
+    if batch is None:
+        return jsonify({"error": "upload batch not found"}), 404
+    job = latest_batch_job(batch.id)
+    return (
+        jsonify(
+            {
+                "batch": batch.to_dict(batch_item_counts(batch.id), job),
+                "items": [item.to_dict() for item in batch.items],
+                "job": job.to_dict() if job is not None else None,
+            }
+        ),
+        200,
+    )
+
+
+@candidates_bp.get("/candidates/search")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Candidates"],
+        "parameters": [
+            {
+                "name": "q",
+                "in": "query",
+                "required": True,
+                "description": 'Words are ANDed; supports OR, NOT or -word, (groups), "phrases" and prefix*',
+                "schema": {"type": "string", "example": '"machine learning" python -java'},
+            },
+            {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "minimum": 1, "maximum": MAX_SEARCH_LIMIT, "example": DEFAULT_SEARCH_LIMIT},
+            },
+            {
+                "name": "offset",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "minimum": 0, "example": 0},
+            },
+        ],
+        "responses": {
+            200: {"description": "Matching candidates, best match first"},
+            400: {"description": "Missing or malformed query"},
+        },
+    }
+)
+def search_candidate_resumes():
+    query = (request.args.get("q") or "").strip()
+    if not query:
+        return jsonify({"error": "q is required"}), 400
+    try:
+        limit = int(request.args.get("limit", DEFAULT_SEARCH_LIMIT))
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        return jsonify({"error": "limit and offset must be integers"}), 400
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        return jsonify({"error": f"limit must be between 1 and {MAX_SEARCH_LIMIT}"}), 400
+    if offset < 0:
+        return jsonify({"error": "offset must not be negative"}), 400
+
+    try:
+        hits = search_candidates(query, limit=limit, offset=offset)
+    except SearchQueryError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    candidate_ids = [candidate_id for candidate_id, _ in hits]
+    rows = {
+        candidate.id: (candidate, features)
+        for candidate, features in db.session.query(Candidate, CandidateFeatures)
+        .outerjoin(CandidateFeatures, CandidateFeatures.candidate_id == Candidate.id)
+        .filter(Candidate.id.in_(candidate_ids))
+    }
+    results = []
+    for candidate_id, score in hits:
+        if candidate_id not in rows:
+            continue
+        candidate, features = rows[candidate_id]
+        results.append(
+            {
+                "candidate_id": candidate_id,
+                "full_name": candidate.full_name,
+                "email": candidate.email,
+                "skills": features.skills if features is not None else [],
+                "score": score,
+            }
+        )
+
+    return jsonify({"query": query, "limit": limit, "offset": offset, "results": results}), 200
+
+
 @candidates_bp.get("/candidates/<int:candidate_id>")
 @require_auth(roles={"admin", "recruiter"})
 @swag_from(
@@ -148,9 +325,8 @@ def get_candidate(candidate_id: int):
             },
         },
         "responses": {
-            200: {"description": "Candidate processed"},
+            202: {"description": "Processing job queued"},
             404: {"description": "Candidate not found"},
-            500: {"description": "Processing failed"},
         },
     }
 )
@@ -162,40 +338,16 @@ def process_candidate_resume(candidate_id: int):
     payload = request.get_json(silent=True) or {}
     force_reprocess = bool(payload.get("force_reprocess", False))
 
-    job = ProcessingJob(entity_type="candidate", entity_id=candidate_id, status="queued")
-    db.session.add(job)
+    job = enqueue_candidate_processing(candidate, force_reprocess=force_reprocess)
     db.session.commit()
 
-    try:
-        job.status = "processing"
-        job.started_at = datetime.now(UTC)
-        db.session.commit()
-
-        extracted_text = parse_resume_file(candidate.resume_path)
-        profile_json = extract_profile_from_text(extracted_text)
-
-        if force_reprocess or not candidate.extracted_text:
-            candidate.extracted_text = extracted_text
-        if force_reprocess or not candidate.profile_json:
-            candidate.profile_json = profile_json
-
-        job.status = "completed"
-        job.completed_at = datetime.now(UTC)
-        db.session.commit()
-    except Exception as exc:
-        job.status = "failed"
-        job.error_message = str(exc)
-        job.completed_at = datetime.now(UTC)
-        db.session.commit()
-        return jsonify({"error": "processing failed", "job": job.to_dict()}), 500
-
     return (
         jsonify(
             {
-                "message": "candidate processed",
+                "message": "candidate queued for processing",
                 "job": job.to_dict(),
-                "candidate": candidate.to_dict(),
             }
         ),
-        200,
+        202,
+        {"Location": f"/api/processing-jobs/{job.id}"},
     )
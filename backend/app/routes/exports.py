@@ -0,0 +1,156 @@
+from flask import Blueprint, g, jsonify, request, send_file
+from flasgger import swag_from
+
+from app.auth import require_auth
+from app.extensions import db
+from app.models.job_description import JobDescription
+from app.models.report_export import ReportExport
+from app.routes.applications import VALID_STATUSES
+from app.services.exports import EXPORT_FORMATS, create_report_export, export_path, latest_export_job
+
+exports_bp = Blueprint("exports", __name__)
+
+
+def _parse_export_request(data: dict) -> tuple[str, dict]:
+    """``(format, params)`` of an export request; ``ValueError`` with a client message if it is invalid."""
+    export_format = data.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+    jd_ids, department = data.get("jd_ids"), data.get("department")
+    if (jd_ids is None) == (department is None):
+        raise ValueError("provide either jd_ids or department")
+    params: dict = {}
+    if jd_ids is not None:
+        if (
+            not isinstance(jd_ids, list)
+            or not jd_ids
+            or not all(isinstance(jd_id, int) and not isinstance(jd_id, bool) for jd_id in jd_ids)
+        ):
+            raise ValueError("jd_ids must be a non-empty list of integers")
+        params["jd_ids"] = sorted(set(jd_ids))
+        found = {jd_id for (jd_id,) in db.session.query(JobDescription.id).filter(JobDescription.id.in_(jd_ids))}
+        missing = [jd_id for jd_id in params["jd_ids"] if jd_id not in found]
+        if missing:
+            raise ValueError(f"unknown job descriptions: {', '.join(map(str, missing))}")
+    else:
+        if not isinstance(department, str) or not department.strip():
+            raise ValueError("department must be a non-empty string")
+        params["department"] = department.strip()
+        if db.session.query(JobDescription.id).filter(JobDescription.department == params["department"]).first() is None:
+            raise ValueError("no job descriptions in that department")
+
+    if data.get("status") is not None:
+        if data["status"] not in VALID_STATUSES:
+            raise ValueError("invalid status value")
+        params["status"] = data["status"]
+    if data.get("min_score") is not None:
+        if isinstance(data["min_score"], bool) or not isinstance(data["min_score"], (int, float)):
+            raise ValueError("min_score must be a number")
+        params["min_score"] = float(data["min_score"])
+    return export_format, params
+
+
+@exports_bp.post("/exports")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Exports"],
+        "description": "Queues a report of applications with score breakdowns and review notes. "
+        "Poll the export for progress and download the file once it is completed.",
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "format": {"type": "string", "enum": ["csv", "ndjson", "xlsx"], "default": "csv"},
+                            "jd_ids": {"type": "array", "items": {"type": "integer"}},
+                            "department": {"type": "string", "description": "Every JD of the department"},
+                            "status": {"type": "string", "enum": ["new", "reviewed", "shortlisted", "rejected"]},
+                            "min_score": {"type": "number"},
+                        },
+                    }
+                }
+            },
+        },
+        "responses": {
+            202: {"description": "Export queued"},
+            400: {"description": "Invalid export request"},
+        },
+    }
+)
+def create_export():
+    try:
+        export_format, params = _parse_export_request(request.get_json(silent=True) or {})
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    export, job = create_report_export(export_format, params, created_by=g.current_user.id)
+    db.session.commit()
+    return jsonify(export.to_dict(job)), 202, {"Location": f"/api/exports/{export.id}"}
+
+
+@exports_bp.get("/exports/<int:export_id>")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Exports"],
+        "parameters": [
+            {
+                "name": "export_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "responses": {200: {"description": "Export progress and its job"}, 404: {"description": "Not found"}},
+    }
+)
+def get_export(export_id: int):
+    export = db.session.get(ReportExport, export_id)
+    if export is None:
+        return jsonify({"error": "export not found"}), 404
+    return jsonify(export.to_dict(latest_export_job(export.id))), 200
+
+
+@exports_bp.get("/exports/<int:export_id>/download")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Exports"],
+        "description": "Supports Range requests, so interrupted downloads can resume.",
+        "parameters": [
+            {
+                "name": "export_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "responses": {
+            200: {"description": "Export file"},
+            206: {"description": "Requested byte range of the export file"},
+            404: {"description": "Not found"},
+            409: {"description": "Export not completed"},
+            416: {"description": "Range not satisfiable"},
+        },
+    }
+)
+def download_export(export_id: int):
+    export = db.session.get(ReportExport, export_id)
+    if export is None:
+        return jsonify({"error": "export not found"}), 404
+    if export.status != "completed":
+        return jsonify({"error": f"export is {export.to_dict(latest_export_job(export.id))['status']}"}), 409
+    path = export_path(export)
+    if not path.is_file():
+        return jsonify({"error": "export file not found"}), 404
+    return send_file(
+        path,
+        mimetype=EXPORT_FORMATS[export.format][1],
+        as_attachment=True,
+        download_name=path.name,
+        conditional=True,
+    )
@@ -1,9 +1,27 @@
+from datetime import datetime
+
 from flask import Blueprint, jsonify, request
 from flasgger import swag_from
+from sqlalchemy import select
 
 from app.auth import require_auth
 from app.extensions import db
+from app.models.candidate import Candidate
 from app.models.job_description import JobDescription
+from app.services.candidate_index import DEFAULT_TOP_K, MAX_TOP_K, find_top_matches
+from app.services.jd_profiles import get_jd_profile, refresh_jd_profile
+from app.services.minhash import lsh_threshold
+from app.services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    parse_page_args,
+    rows_after,
+)
+from app.services.similarity import find_similar_candidates, get_jd_signature, lsh_settings, minhash_enabled
 
 jd_bp = Blueprint("job_descriptions", __name__)
 
@@ -47,6 +65,7 @@ def create_jd():
         location=payload.get("location"),
         text=payload["text"].strip(),
     )
+    refresh_jd_profile(jd)
     db.session.add(jd)
     db.session.commit()
     return jsonify(jd.to_dict()), 201
@@ -56,11 +75,44 @@ def create_jd():
 @require_auth(roles={"admin", "recruiter"})
 @swag_from({
     "tags": ["Job Descriptions"],
-    "responses": {200: {"description": "List JDs"}},
+    "parameters": [
+        {
+            "name": "limit",
+            "in": "query",
+            "required": False,
+            "schema": {"type": "integer", "minimum": 1, "maximum": MAX_PAGE_SIZE, "example": DEFAULT_PAGE_SIZE},
+        },
+        {"name": "cursor", "in": "query", "required": False, "schema": {"type": "string"}},
+    ],
+    "responses": {
+        200: {
+            "description": "List JDs, newest first",
+            "headers": {NEXT_CURSOR_HEADER: {"description": "Cursor of the next page, absent on the last page"}},
+        },
+        400: {"description": "Invalid limit or cursor"},
+    },
 })
 def list_jds():
-    items = JobDescription.query.order_by(JobDescription.created_at.desc()).all()
-    return jsonify([item.to_dict() for item in items]), 200
+    try:
+        limit, cursor = parse_page_args(request.args)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    keys = [(JobDescription.created_at, True), (JobDescription.id, True)]
+    query = JobDescription.query.order_by(*(column.desc() for column, _ in keys))
+    if cursor:
+        try:
+            query = query.filter(rows_after(keys, decode_cursor(cursor, "jds", datetime.fromisoformat, int)))
+        except InvalidCursor as exc:
+            return jsonify({"error": str(exc)}), 400
+
+    # One extra row tells whether there is a next page.
+    items = query.limit(None if limit is None else limit + 1).all()
+    headers = {}
+    if limit is not None and len(items) > limit:
+        items = items[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor("jds", [items[-1].created_at, items[-1].id])
+    return jsonify([item.to_dict() for item in items]), 200, headers
 
 
 @jd_bp.get("/jds/<int:jd_id>")
@@ -75,3 +127,118 @@ def get_jd(jd_id: int):
     if jd is None:
         return jsonify({"error": "job description not found"}), 404
     return jsonify(jd.to_dict()), 200
+
+
+@jd_bp.get("/jds/<int:jd_id>/matches")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from({
+    "tags": ["Job Descriptions"],
+    "parameters": [
+        {"name": "jd_id", "in": "path", "required": True, "schema": {"type": "integer"}},
+        {"name": "k", "in": "query", "required": False, "schema": {"type": "integer", "example": DEFAULT_TOP_K}},
+    ],
+    "responses": {
+        200: {"description": "Best matching candidates from the whole pool"},
+        400: {"description": "Invalid query parameter"},
+        404: {"description": "Not found"},
+    },
+})
+def get_jd_matches(jd_id: int):
+    jd = db.session.get(JobDescription, jd_id)
+    if jd is None:
+        return jsonify({"error": "job description not found"}), 404
+
+    try:
+        k = int(request.args.get("k", DEFAULT_TOP_K))
+    except ValueError:
+        return jsonify({"error": "k must be an integer"}), 400
+    if not 1 <= k <= MAX_TOP_K:
+        return jsonify({"error": f"k must be between 1 and {MAX_TOP_K}"}), 400
+
+    profile = get_jd_profile(jd)
+    if db.session.is_modified(jd):
+        # Recompiled for the current scorer version: keep it.
+        db.session.commit()
+    search = find_top_matches(profile, k=k)
+
+    candidate_ids = [candidate_id for candidate_id, _ in search.matches]
+    candidates = {
+        candidate.id: candidate
+        for candidate in db.session.scalars(select(Candidate).where(Candidate.id.in_(candidate_ids)))
+    }
+    matches = []
+    for candidate_id, scored in search.matches:
+        candidate = candidates.get(candidate_id)
+        if candidate is None:
+            # Deleted since the index scan.
+            continue
+        matches.append(
+            {
+                "candidate_id": candidate_id,
+                "full_name": candidate.full_name,
+                "email": candidate.email,
+                "total_score": scored.total_score,
+                "score_breakdown_json": scored.breakdown,
+            }
+        )
+
+    return jsonify(
+        {
+            "jd_id": jd_id,
+            "k": k,
+            "matches": matches,
+            "postings_scanned": search.postings,
+            "candidates_scored": search.evaluated,
+            "candidates_scored_from_text": search.scored_from_text,
+        }
+    ), 200
+
+
+@jd_bp.get("/jds/<int:jd_id>/similar-candidates")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from({
+    "tags": ["Job Descriptions"],
+    "parameters": [
+        {"name": "jd_id", "in": "path", "required": True, "schema": {"type": "integer"}},
+        {"name": "threshold", "in": "query", "required": False, "schema": {"type": "number", "example": 0.1}},
+        {"name": "limit", "in": "query", "required": False, "schema": {"type": "integer", "example": 50}},
+    ],
+    "responses": {
+        200: {"description": "Candidates with approximately similar keywords"},
+        400: {"description": "Invalid query parameter or approximate mode disabled"},
+        404: {"description": "Not found"},
+    },
+})
+def get_jd_similar_candidates(jd_id: int):
+    jd = db.session.get(JobDescription, jd_id)
+    if jd is None:
+        return jsonify({"error": "job description not found"}), 404
+    if not minhash_enabled():
+        return jsonify({"error": "approximate similarity is disabled (MINHASH_ENABLED)"}), 400
+
+    try:
+        threshold = float(request.args.get("threshold", 0.1))
+        limit = int(request.args.get("limit", DEFAULT_TOP_K))
+    except ValueError:
+        return jsonify({"error": "threshold must be a number and limit an integer"}), 400
+    if not 0.0 <= threshold <= 1.0:
+        return jsonify({"error": "threshold must be between 0 and 1"}), 400
+    if not 1 <= limit <= MAX_TOP_K:
+        return jsonify({"error": f"limit must be between 1 and {MAX_TOP_K}"}), 400
+
+    signature = get_jd_signature(jd, get_jd_profile(jd))
+    db.session.commit()
+    similar = find_similar_candidates(signature, threshold=threshold, limit=limit)
+
+    num_perm, bands = lsh_settings()
+    return jsonify(
+        {
+            "jd_id": jd_id,
+            "threshold": threshold,
+            "lsh": {"num_perm": num_perm, "bands": bands, "threshold": round(lsh_threshold(num_perm, bands), 4)},
+            "candidates": [
+                {"candidate_id": candidate_id, "estimated_jaccard": round(estimate, 4)}
+                for candidate_id, estimate in similar
+            ],
+        }
+    ), 200
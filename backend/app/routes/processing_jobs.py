@@ -4,6 +4,7 @@ from flasgger import swag_from
 from app.auth import require_auth
 from app.extensions import db
 from app.models.processing_job import ProcessingJob
+from app.services.job_queue import cancel_job, requeue_job
 
 processing_jobs_bp = Blueprint("processing_jobs", __name__)
 
@@ -29,3 +30,61 @@ def get_processing_job(job_id: int):
     if job is None:
         return jsonify({"error": "processing job not found"}), 404
     return jsonify(job.to_dict()), 200
+
+
+@processing_jobs_bp.post("/processing-jobs/<int:job_id>/cancel")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Processing Jobs"],
+        "parameters": [
+            {
+                "name": "job_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "responses": {
+            200: {"description": "Job cancelled, or flagged for cancellation if it is running"},
+            404: {"description": "Not found"},
+            409: {"description": "Job already finished"},
+        },
+    }
+)
+def cancel_processing_job(job_id: int):
+    job = db.session.get(ProcessingJob, job_id)
+    if job is None:
+        return jsonify({"error": "processing job not found"}), 404
+    if not cancel_job(job):
+        return jsonify({"error": f"processing job already {job.reported_status}"}), 409
+    return jsonify(job.to_dict()), 200
+
+
+@processing_jobs_bp.post("/processing-jobs/<int:job_id>/retry")
+@require_auth(roles={"admin"})
+@swag_from(
+    {
+        "tags": ["Processing Jobs"],
+        "parameters": [
+            {
+                "name": "job_id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "integer"},
+            }
+        ],
+        "responses": {
+            200: {"description": "Dead-lettered (failed) job queued again"},
+            404: {"description": "Not found"},
+            409: {"description": "Job is not in the dead-letter (failed) state"},
+        },
+    }
+)
+def retry_processing_job(job_id: int):
+    job = db.session.get(ProcessingJob, job_id)
+    if job is None:
+        return jsonify({"error": "processing job not found"}), 404
+    if not requeue_job(job):
+        return jsonify({"error": "only failed jobs can be retried"}), 409
+    return jsonify(job.to_dict()), 200
@@ -0,0 +1,40 @@
+import re
+
+from flask import Blueprint, jsonify
+from flasgger import swag_from
+
+from app.auth import require_auth
+from app.services.uploads import find_blob
+
+resumes_bp = Blueprint("resumes", __name__)
+SHA256_PATTERN = re.compile(r"[0-9a-fA-F]{64}")
+
+
+@resumes_bp.get("/resumes/<sha256>")
+@require_auth(roles={"admin", "recruiter"})
+@swag_from(
+    {
+        "tags": ["Candidates"],
+        "description": "Also answers HEAD, so clients can check for stored content before uploading it.",
+        "parameters": [
+            {
+                "name": "sha256",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "string", "pattern": "^[0-9a-f]{64}$"},
+            }
+        ],
+        "responses": {
+            200: {"description": "Resume content already stored"},
+            400: {"description": "Not a SHA-256 hex digest"},
+            404: {"description": "Unknown content"},
+        },
+    }
+)
+def get_resume_blob(sha256: str):
+    if not SHA256_PATTERN.fullmatch(sha256):
+        return jsonify({"error": "sha256 must be 64 hex characters"}), 400
+    blob = find_blob(sha256)
+    if blob is None:
+        return jsonify({"error": "resume not found"}), 404
+    return jsonify(blob.to_dict()), 200, {"X-Resume-Size": str(blob.size_bytes)}
@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+from sqlalchemy import or_, select, tuple_, update
+
+from app.extensions import db
+from app.models.application import Application
+
+# Ids per UPDATE: keeps the statement under SQLite's bound-parameter limit.
+STATUS_UPDATE_CHUNK_SIZE = 500
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def set_status_where(criteria: list, status: str, reviewed_by: str | None) -> dict[int, int]:
+    """Set the status of every application matching ``criteria`` in one ``UPDATE`` (not committed).
+
+    Every updated row gets a new ``version``. Returns ``{application id: new version}``.
+    """
+    statement = (
+        update(Application)
+        .where(*criteria)
+        .values(
+            status=status,
+            reviewed_by=reviewed_by,
+            reviewed_at=datetime.now(UTC),
+            version=Application.version + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if db.session.get_bind().dialect.update_returning:
+        return dict(db.session.execute(statement.returning(Application.id, Application.version)).all())
+    # No UPDATE ... RETURNING (MySQL): lock the matching rows first so the ids stay accurate.
+    ids = db.session.execute(select(Application.id).where(*criteria).with_for_update()).scalars().all()
+    if not ids:
+        return {}
+    db.session.execute(statement.where(Application.id.in_(ids)))
+    return dict(db.session.execute(select(Application.id, Application.version).where(Application.id.in_(ids))).all())
+
+
+def set_status_by_id(
+    expected_versions: dict[int, int | None], status: str, reviewed_by: str | None
+) -> list[dict]:
+    """Set the status of the given applications, each only if still at its expected version.
+
+    ``expected_versions`` maps application ids to the ``version`` the caller last
+    saw, or ``None`` to skip the check. Returns one result per id: ``updated``,
+    ``conflict`` (another edit got there first; ``version`` is the current one)
+    or ``not_found``. Not committed.
+    """
+    updated: dict[int, int] = {}
+    for chunk in _chunks(list(expected_versions.items()), STATUS_UPDATE_CHUNK_SIZE):
+        unchecked = [application_id for application_id, version in chunk if version is None]
+        checked = [(application_id, version) for application_id, version in chunk if version is not None]
+        conditions = []
+        if unchecked:
+            conditions.append(Application.id.in_(unchecked))
+        if checked:
+            conditions.append(tuple_(Application.id, Application.version).in_(checked))
+        updated.update(set_status_where([or_(*conditions)], status, reviewed_by))
+
+    current: dict[int, int] = {}
+    missed = [application_id for application_id in expected_versions if application_id not in updated]
+    for chunk in _chunks(missed, STATUS_UPDATE_CHUNK_SIZE):
+        current.update(
+            db.session.execute(select(Application.id, Application.version).where(Application.id.in_(chunk))).all()
+        )
+
+    results = []
+    for application_id in expected_versions:
+        if application_id in updated:
+            results.append({"id": application_id, "result": "updated", "version": updated[application_id]})
+        elif application_id in current:
+            results.append({"id": application_id, "result": "conflict", "version": current[application_id]})
+        else:
+            results.append({"id": application_id, "result": "not_found", "version": None})
+    return results
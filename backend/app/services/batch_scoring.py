@@ -0,0 +1,384 @@
+from dataclasses import dataclass
+from time import perf_counter
+
+import numpy as np
+from sqlalchemy import bindparam, update
+
+from app.extensions import db
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.candidate_features import CandidateFeatures
+from app.models.job_description import JobDescription
+from app.services.bulk import insert_ignore
+from app.services.candidate_features import (
+    is_current,
+    record_from_row,
+    refresh_candidate_features,
+    resolve_profile_term_ids,
+)
+from app.services.jd_profiles import get_jd_profile
+from app.services.scoring import score_features_against_profile
+from app.services.vectorized_scoring import COMPONENTS, breakdown_components, reweight, score_pool
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 5000
+SCORING_ENGINES = ("python", "numpy")
+DEFAULT_TOP_N = 25
+MAX_TOP_N = 1000
+
+
+@dataclass
+class BatchScoreSummary:
+    jd_id: int
+    scored: int
+    chunks: int
+    duration_ms: float
+
+    def to_dict(self):
+        return {
+            "jd_id": self.jd_id,
+            "scored": self.scored,
+            "chunks": self.chunks,
+            "duration_ms": self.duration_ms,
+        }
+
+
+def _score_records(records: list, profile, jd_term_ids, weights: dict | None, engine: str) -> list:
+    if engine == "numpy":
+        pool = score_pool(records, profile, jd_term_ids, weights)
+        return [pool.result(index) for index in range(len(pool))]
+    return [score_features_against_profile(record, profile, jd_term_ids, weights) for record in records]
+
+
+def _update_scores(rows: list[dict]) -> int:
+    """Write the scores in ``rows`` by ``application_id``; returns how many applications were updated.
+
+    A filtered UPDATE per row rather than a bulk update by primary key, which
+    raises StaleDataError when an application was deleted since it was read.
+    """
+    table = Application.__table__
+    result = db.session.execute(update(table).where(table.c.id == bindparam("application_id")), rows)
+    if db.session.get_bind().dialect.supports_sane_multi_rowcount:
+        return result.rowcount
+    # The driver cannot count rows across a batch (psycopg2 execute_batch).
+    return len(rows)
+
+
+def score_applications_for_jd(
+    jd: JobDescription,
+    weights: dict | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    engine: str = "python",
+) -> BatchScoreSummary:
+    """Score every application of ``jd``, committing once per chunk.
+
+    The JD is analyzed a single time and applications are walked in primary-key
+    order so each chunk is an index range scan, independent of how many rows
+    were already scored. Candidates are scored from their stored feature record;
+    missing or outdated records are rebuilt on the way. ``engine="numpy"``
+    scores each chunk with the vectorized pool scorer, which gives identical results.
+    Applications deleted while their chunk is scored are skipped.
+    """
+    if engine not in SCORING_ENGINES:
+        raise ValueError(f"unknown scoring engine: {engine}")
+
+    started = perf_counter()
+    profile = get_jd_profile(jd)
+    jd_term_ids = resolve_profile_term_ids(profile)
+
+    scored = 0
+    chunks = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.session.query(Application.id, Application.candidate_id, CandidateFeatures)
+            .outerjoin(CandidateFeatures, CandidateFeatures.candidate_id == Application.candidate_id)
+            .filter(Application.jd_id == jd.id, Application.id > last_id)
+            .order_by(Application.id.asc())
+            .limit(chunk_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        records = []
+        refreshed = False
+        for application_id, candidate_id, features in rows:
+            if is_current(features):
+                records.append((application_id, record_from_row(features)))
+            else:
+                candidate = db.session.get(Candidate, candidate_id)
+                records.append((application_id, refresh_candidate_features(candidate)))
+                refreshed = True
+
+        # Backfilled candidates may have interned JD terms that were unknown so far.
+        if refreshed and len(jd_term_ids) < len(profile.terms):
+            jd_term_ids = resolve_profile_term_ids(profile)
+
+        results = _score_records([record for _, record in records], profile, jd_term_ids, weights, engine)
+
+        updates = []
+        for (application_id, _), result in zip(records, results):
+            updates.append(
+                {
+                    "application_id": application_id,
+                    "total_score": result.total_score,
+                    "score_breakdown_json": result.breakdown,
+                }
+            )
+
+        scored += _update_scores(updates)
+        db.session.commit()
+
+        chunks += 1
+        last_id = rows[-1][0]
+
+    duration_ms = round((perf_counter() - started) * 1000.0, 2)
+    return BatchScoreSummary(jd_id=jd.id, scored=scored, chunks=chunks, duration_ms=duration_ms)
+
+
+@dataclass
+class BulkLinkSummary:
+    jd_id: int
+    requested: int
+    created: int
+    existing: int
+    missing_candidate_ids: list[int]
+    chunks: int
+    duration_ms: float
+
+    def to_dict(self):
+        return {
+            "jd_id": self.jd_id,
+            "requested": self.requested,
+            "created": self.created,
+            "existing": self.existing,
+            "missing_candidate_ids": self.missing_candidate_ids,
+            "chunks": self.chunks,
+            "duration_ms": self.duration_ms,
+        }
+
+
+def _insert_applications(rows: list[dict]) -> int:
+    """Insert ``rows``, skipping pairs that already applied; returns how many were inserted."""
+    statement = insert_ignore(Application.__table__)
+    if db.session.get_bind().dialect.insert_executemany_returning:
+        return len(db.session.execute(statement.returning(Application.__table__.c.candidate_id), rows).all())
+    # No multi-row INSERT ... RETURNING (MySQL): INSERT IGNORE's row count leaves out ignored rows.
+    return db.session.execute(statement, rows).rowcount
+
+
+def link_candidates_to_jd(
+    jd: JobDescription,
+    candidate_ids: list[int],
+    weights: dict | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    engine: str = "numpy",
+) -> BulkLinkSummary:
+    """Create a scored application of ``jd`` for each candidate, committing once per chunk.
+
+    Each chunk is scored from the stored feature records before it is inserted,
+    so new applications are written once, score included. Candidates that
+    already applied are skipped up front; the unique ``(candidate_id, jd_id)``
+    constraint and an insert-ignore keep a concurrent link of the same pair from
+    creating a duplicate. Unknown candidate ids are reported, not fatal.
+    """
+    if engine not in SCORING_ENGINES:
+        raise ValueError(f"unknown scoring engine: {engine}")
+
+    started = perf_counter()
+    profile = get_jd_profile(jd)
+    jd_term_ids = resolve_profile_term_ids(profile)
+    candidate_ids = list(dict.fromkeys(candidate_ids))
+
+    created = 0
+    missing: list[int] = []
+    chunks = 0
+    for start in range(0, len(candidate_ids), chunk_size):
+        chunk = candidate_ids[start : start + chunk_size]
+        applied = {
+            candidate_id
+            for (candidate_id,) in db.session.query(Application.candidate_id).filter(
+                Application.jd_id == jd.id, Application.candidate_id.in_(chunk)
+            )
+        }
+        rows = (
+            db.session.query(Candidate.id, CandidateFeatures)
+            .outerjoin(CandidateFeatures, CandidateFeatures.candidate_id == Candidate.id)
+            .filter(Candidate.id.in_([candidate_id for candidate_id in chunk if candidate_id not in applied]))
+            .order_by(Candidate.id.asc())
+            .all()
+        )
+        found = {candidate_id for candidate_id, _ in rows}
+        missing.extend(
+            candidate_id for candidate_id in chunk if candidate_id not in applied and candidate_id not in found
+        )
+
+        records = []
+        refreshed = False
+        for candidate_id, features in rows:
+            if is_current(features):
+                records.append((candidate_id, record_from_row(features)))
+            else:
+                records.append((candidate_id, refresh_candidate_features(db.session.get(Candidate, candidate_id))))
+                refreshed = True
+        if refreshed and len(jd_term_ids) < len(profile.terms):
+            jd_term_ids = resolve_profile_term_ids(profile)
+
+        if records:
+            results = _score_records([record for _, record in records], profile, jd_term_ids, weights, engine)
+            created += _insert_applications(
+                [
+                    {
+                        "candidate_id": candidate_id,
+                        "jd_id": jd.id,
+                        "total_score": result.total_score,
+                        "score_breakdown_json": result.breakdown,
+                        "status": "new",
+                    }
+                    for (candidate_id, _), result in zip(records, results)
+                ]
+            )
+        db.session.commit()
+        chunks += 1
+
+    duration_ms = round((perf_counter() - started) * 1000.0, 2)
+    return BulkLinkSummary(
+        jd_id=jd.id,
+        requested=len(candidate_ids),
+        created=created,
+        # Already applied, or linked by a concurrent request first.
+        existing=len(candidate_ids) - created - len(missing),
+        missing_candidate_ids=missing,
+        chunks=chunks,
+        duration_ms=duration_ms,
+    )
+
+
+@dataclass
+class RerankResult:
+    jd_id: int
+    weights: dict
+    ranked: list[dict]
+    reranked: int
+    unscored: int
+    committed: bool
+    duration_ms: float
+
+    def to_dict(self):
+        return {
+            "jd_id": self.jd_id,
+            "weights": self.weights,
+            "ranking": self.ranked,
+            "reranked": self.reranked,
+            "unscored": self.unscored,
+            "committed": self.committed,
+            "duration_ms": self.duration_ms,
+        }
+
+
+def rerank_applications_for_jd(
+    jd: JobDescription,
+    weights: dict | None = None,
+    top_n: int = DEFAULT_TOP_N,
+    commit: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> RerankResult:
+    """Re-rank a JD's scored applications under new weights without re-running the scorer.
+
+    Totals are recomputed from the component scores already stored in
+    ``score_breakdown_json``. Those components are rounded to two decimals, so a
+    recomputed total can differ from a full rescore by a few hundredths.
+    Applications never scored are counted as ``unscored`` and left out. On commit,
+    each total is recomputed from the breakdown re-read with it, so a concurrent
+    rescore never leaves a total that disagrees with its components; applications
+    deleted or unscored meanwhile are skipped and ``reranked`` counts the rows
+    updated.
+    """
+    started = perf_counter()
+
+    application_ids = []
+    candidate_ids = []
+    previous_totals = []
+    components = []
+    unscored = 0
+    rows = (
+        db.session.query(
+            Application.id,
+            Application.candidate_id,
+            Application.total_score,
+            Application.score_breakdown_json,
+        )
+        .filter(Application.jd_id == jd.id)
+        .order_by(Application.id.asc())
+        .yield_per(chunk_size)
+    )
+    for application_id, candidate_id, total_score, breakdown in rows:
+        values = breakdown_components(breakdown)
+        if values is None:
+            unscored += 1
+            continue
+        application_ids.append(application_id)
+        candidate_ids.append(candidate_id)
+        previous_totals.append(total_score)
+        components.append(values)
+
+    matrix = np.array(components, dtype=np.float64).reshape(len(components), len(COMPONENTS))
+    totals, normalized_weights = reweight(matrix, weights)
+
+    top = min(top_n, len(totals))
+    if top:
+        best = np.argpartition(-totals, top - 1)[:top]
+        best = best[np.lexsort((best, -totals[best]))]
+    else:
+        best = np.zeros(0, dtype=np.int64)
+
+    ranked = [
+        {
+            "rank": rank,
+            "application_id": application_ids[index],
+            "candidate_id": candidate_ids[index],
+            "total_score": round(float(totals[index]), 2),
+            "previous_total_score": previous_totals[index],
+        }
+        for rank, index in enumerate(best.tolist(), start=1)
+    ]
+
+    reranked = len(application_ids)
+    if commit and application_ids:
+        reranked = 0
+        weight_vector = np.array([normalized_weights[name] for name in COMPONENTS], dtype=np.float64)
+        for start in range(0, len(application_ids), chunk_size):
+            ids = application_ids[start : start + chunk_size]
+            breakdowns = dict(
+                db.session.query(Application.id, Application.score_breakdown_json).filter(Application.id.in_(ids))
+            )
+            updates = []
+            for application_id in ids:
+                # Deleted or rescored since the ranking was read: score what is stored now.
+                values = breakdown_components(breakdowns.get(application_id))
+                if values is None:
+                    continue
+                breakdown = dict(breakdowns[application_id])
+                breakdown["weights"] = normalized_weights
+                updates.append(
+                    {
+                        "application_id": application_id,
+                        "total_score": round(float(np.dot(values, weight_vector)), 2),
+                        "score_breakdown_json": breakdown,
+                    }
+                )
+            if updates:
+                reranked += _update_scores(updates)
+            db.session.commit()
+
+    duration_ms = round((perf_counter() - started) * 1000.0, 2)
+    return RerankResult(
+        jd_id=jd.id,
+        weights=normalized_weights,
+        ranked=ranked,
+        reranked=reranked,
+        unscored=unscored,
+        committed=bool(commit),
+        duration_ms=duration_ms,
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy import Table, insert
+
+from app.extensions import db
+
+
+def insert_ignore(table: Table):
+    """Return an INSERT for ``table`` that silently skips rows violating a unique constraint."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return insert(table).prefix_with("IGNORE")
+    return dialect_insert(table).on_conflict_do_nothing()
@@ -0,0 +1,259 @@
+import multiprocessing
+import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+from flask import current_app
+from sqlalchemy import func
+from werkzeug.datastructures import FileStorage
+from werkzeug.utils import secure_filename
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.processing_job import ProcessingJob
+from app.models.upload_batch import UploadBatch, UploadBatchItem
+from app.services.candidate_processing import apply_parse_result
+from app.services.job_queue import PermanentJobError, enqueue_job, is_cancel_requested, renew_lease
+from app.services.parse_cache import get_cached_parses, parse_limits, store_parse
+from app.services.parser_sandbox import get_parser_sandbox
+from app.services.resume_parser import parse_resume_file
+from app.services.text_features import extract_text_features
+from app.services.uploads import StoredUpload, UploadTooLarge, store_upload
+
+PROCESS_UPLOAD_BATCH = "process_upload_batch"
+ALLOWED_RESUME_EXTENSIONS = frozenset({".pdf", ".docx", ".txt"})
+DEFAULT_MAX_FILES = 5000
+DEFAULT_MAX_FILE_BYTES = 20 * 1024 * 1024
+DEFAULT_INSERT_BATCH_SIZE = 500
+DEFAULT_PARSE_PROCESSES = 4
+PARSE_CHUNK_SIZE = 50
+
+
+def _config(name: str, default):
+    return current_app.config.get(name, default)
+
+
+def _is_archive(filename: str) -> bool:
+    return filename.lower().endswith(".zip")
+
+
+def _iter_resume_streams(files: Iterable[FileStorage]) -> Iterator[tuple[str, BinaryIO | None, str | None]]:
+    """Yield ``(filename, stream, error)`` for every uploaded resume, expanding ZIP archives.
+
+    Archive members are opened one at a time and read straight from the archive,
+    which werkzeug has already spooled to a temporary file.
+    """
+    for storage in files:
+        filename = storage.filename or ""
+        if not _is_archive(filename):
+            yield filename, storage.stream, None
+            continue
+
+        try:
+            archive = zipfile.ZipFile(storage.stream)
+        except zipfile.BadZipFile:
+            yield filename, None, "not a valid zip archive"
+            continue
+        with archive:
+            for info in archive.infolist():
+                path = PurePosixPath(info.filename)
+                if info.is_dir() or path.name.startswith(".") or "__MACOSX" in path.parts:
+                    continue
+                try:
+                    member = archive.open(info)
+                except (RuntimeError, NotImplementedError, zipfile.BadZipFile) as exc:
+                    yield path.name, None, f"cannot read archive member: {exc}"
+                    continue
+                with member:
+                    yield path.name, member, None
+
+
+def ingest_uploads(files: Iterable[FileStorage], created_by: int | None = None) -> UploadBatch:
+    """Store every uploaded resume and create its candidate, batch item and outcome (not committed).
+
+    Candidates are inserted in multi-row batches. Files that are not resumes, too
+    large or beyond the batch limit are recorded as ``rejected`` items.
+    """
+    max_files = int(_config("BULK_UPLOAD_MAX_FILES", DEFAULT_MAX_FILES))
+    max_bytes = int(_config("BULK_UPLOAD_MAX_FILE_BYTES", DEFAULT_MAX_FILE_BYTES))
+    insert_batch_size = int(_config("BULK_INSERT_BATCH_SIZE", DEFAULT_INSERT_BATCH_SIZE))
+
+    batch = UploadBatch(status="queued", total_files=0, created_by=created_by)
+    db.session.add(batch)
+    db.session.flush()
+
+    stored: list[tuple[str, StoredUpload]] = []
+    rejected: list[UploadBatchItem] = []
+
+    def flush_stored():
+        candidates = [
+            Candidate(
+                resume_filename=secure_filename(filename),
+                resume_path=str(upload.path),
+                resume_sha256=upload.sha256,
+            )
+            for filename, upload in stored
+        ]
+        db.session.add_all(candidates)
+        db.session.flush()
+        db.session.add_all(
+            UploadBatchItem(batch_id=batch.id, filename=filename[:255], status="pending", candidate_id=candidate.id)
+            for (filename, _), candidate in zip(stored, candidates)
+        )
+        stored.clear()
+
+    accepted = 0
+    for filename, stream, error in _iter_resume_streams(files):
+        batch.total_files += 1
+        if error is None and accepted >= max_files:
+            error = f"batch limit of {max_files} files reached"
+        if error is None and Path(filename).suffix.lower() not in ALLOWED_RESUME_EXTENSIONS:
+            error = "unsupported file type"
+        if error is None and not secure_filename(filename):
+            error = "invalid filename"
+        if error is None:
+            try:
+                stored.append((filename, store_upload(stream, filename, max_bytes=max_bytes)))
+                accepted += 1
+            except UploadTooLarge as exc:
+                error = str(exc)
+        if error is not None:
+            rejected.append(
+                UploadBatchItem(
+                    batch_id=batch.id, filename=filename[:255] or "?", status="rejected", error_message=error
+                )
+            )
+        if len(stored) >= insert_batch_size:
+            flush_stored()
+
+    if stored:
+        flush_stored()
+    db.session.add_all(rejected)
+    db.session.flush()
+    return batch
+
+
+def enqueue_upload_batch(batch: UploadBatch) -> ProcessingJob:
+    return enqueue_job(PROCESS_UPLOAD_BATCH, "upload_batch", batch.id)
+
+
+def latest_batch_job(batch_id: int) -> ProcessingJob | None:
+    return (
+        db.session.query(ProcessingJob)
+        .filter(ProcessingJob.entity_type == "upload_batch", ProcessingJob.entity_id == batch_id)
+        .order_by(ProcessingJob.id.desc())
+        .first()
+    )
+
+
+def batch_item_counts(batch_id: int) -> dict[str, int]:
+    return dict(
+        db.session.query(UploadBatchItem.status, func.count(UploadBatchItem.id))
+        .filter(UploadBatchItem.batch_id == batch_id)
+        .group_by(UploadBatchItem.status)
+        .all()
+    )
+
+
+def _parse_safely(path: str, limits: dict) -> tuple[str | None, str | None]:
+    # Runs in the parser pool: report failures as values so one bad file cannot break the batch.
+    try:
+        return parse_resume_file(path, **limits), None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def run_upload_batch_job(job: ProcessingJob):
+    """Parse every pending file of a batch in a process pool, committing progress per chunk.
+
+    Only file parsing happens in the child processes; profile extraction and
+    database writes stay in the worker. With a parser sandbox configured its
+    processes are used instead of a per-job pool, so every file gets the
+    sandbox's timeout and memory cap. Items already processed by an earlier
+    attempt are skipped, so a retried job resumes where it stopped.
+    """
+    batch = db.session.get(UploadBatch, job.entity_id)
+    if batch is None:
+        raise PermanentJobError(f"upload batch {job.entity_id} not found")
+    job_id, worker_id = job.id, job.locked_by
+    batch.status = "processing"
+    db.session.commit()
+
+    pending = (
+        db.session.query(UploadBatchItem.id, Candidate.id, Candidate.resume_path, Candidate.resume_sha256)
+        .join(Candidate, Candidate.id == UploadBatchItem.candidate_id)
+        .filter(UploadBatchItem.batch_id == batch.id, UploadBatchItem.status == "pending")
+        .order_by(UploadBatchItem.id.asc())
+        .all()
+    )
+
+    processes = int(_config("BULK_PARSE_PROCESSES", DEFAULT_PARSE_PROCESSES))
+    limits = parse_limits()
+    sandbox = get_parser_sandbox()
+    pool = None
+    if sandbox is None and processes > 0 and len(pending) > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=min(processes, len(pending)), mp_context=multiprocessing.get_context("spawn")
+        )
+    try:
+        for chunk in _chunks(pending, PARSE_CHUNK_SIZE):
+            if is_cancel_requested(job_id):
+                raise PermanentJobError("cancelled")
+
+            # Each distinct content is parsed at most once: cached results are reused
+            # and duplicates within the chunk share one parse.
+            parses = {
+                content_hash: (row.extracted_text, row.profile_json, None, None)
+                for content_hash, row in get_cached_parses(row[3] for row in chunk if row[3]).items()
+            }
+            to_parse: dict[str, str] = {}
+            for _, candidate_id, resume_path, content_hash in chunk:
+                key = content_hash or f"candidate:{candidate_id}"
+                if key not in parses:
+                    to_parse.setdefault(key, resume_path)
+            paths = list(to_parse.values())
+            if sandbox is not None:
+                results = sandbox.map(paths, **limits)
+            elif pool is not None:
+                results = list(pool.map(_parse_safely, paths, [limits] * len(paths)))
+            else:
+                results = [_parse_safely(path, limits) for path in paths]
+            for key, (extracted_text, error) in zip(to_parse, results):
+                if error is not None:
+                    parses[key] = (None, None, None, error)
+                    continue
+                text_features = extract_text_features(extracted_text)
+                profile_json = text_features.to_profile()
+                parses[key] = (extracted_text, profile_json, text_features, None)
+                if not key.startswith("candidate:"):
+                    store_parse(key, extracted_text, profile_json)
+
+            for item_id, candidate_id, _, content_hash in chunk:
+                key = content_hash or f"candidate:{candidate_id}"
+                extracted_text, profile_json, text_features, error = parses[key]
+                item = db.session.get(UploadBatchItem, item_id)
+                if error is not None:
+                    item.status = "failed"
+                    item.error_message = error
+                    continue
+                candidate = db.session.get(Candidate, candidate_id)
+                apply_parse_result(candidate, extracted_text, profile_json, text_features=text_features)
+                item.status = "processed"
+
+            renew_lease(job_id, worker_id)
+            db.session.commit()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    batch = db.session.get(UploadBatch, job.entity_id)
+    batch.status = "completed"
+    batch.completed_at = datetime.now(UTC)
@@ -0,0 +1,174 @@
+import sys
+from array import array
+from datetime import UTC, datetime
+
+from sqlalchemy import or_
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.candidate_features import CandidateFeatures
+from app.services.candidate_index import index_candidate_skills, index_candidate_terms
+from app.services.candidate_search import index_candidate_document
+from app.services.scoring import (
+    CandidateAnalysis,
+    CandidateFeatureRecord,
+    JDProfile,
+    analyze_candidate,
+    scorer_version,
+)
+from app.services.similarity import index_candidate_signature, minhash_enabled
+from app.services.text_features import TextFeatures, tokenize
+from app.services.vocabulary import intern_terms, lookup_term_ids
+
+
+DEFAULT_REFRESH_CHUNK_SIZE = 500
+
+
+def pack_term_ids(term_ids) -> bytes:
+    packed = array("I", sorted(term_ids))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_term_ids(raw: bytes) -> array:
+    unpacked = array("I")
+    unpacked.frombytes(raw or b"")
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked
+
+
+def record_from_row(row: CandidateFeatures) -> CandidateFeatureRecord:
+    return CandidateFeatureRecord(
+        term_ids=unpack_term_ids(row.term_ids),
+        skills=frozenset(row.skills or []),
+        years_experience=row.years_experience,
+        education_levels=frozenset(row.education_levels or []),
+    )
+
+
+def is_current(row: CandidateFeatures | None) -> bool:
+    return row is not None and row.feature_version == scorer_version()
+
+
+def candidate_analysis(candidate: Candidate, text_features: TextFeatures | None = None) -> CandidateAnalysis:
+    """:func:`analyze_candidate` for a model row; ``text_features`` must come from its ``extracted_text``."""
+    return analyze_candidate(
+        {
+            "full_name": candidate.full_name,
+            "resume_filename": candidate.resume_filename,
+            "extracted_text": candidate.extracted_text,
+            "profile_json": candidate.profile_json,
+        },
+        text_features,
+    )
+
+
+def refresh_candidate_features(
+    candidate: Candidate, text_features: TextFeatures | None = None
+) -> CandidateFeatureRecord:
+    """Analyze ``candidate`` once; store its feature record, index postings and search document (not committed).
+
+    ``text_features`` are the parser's features of ``candidate.extracted_text``, if at hand.
+    """
+    analysis = candidate_analysis(candidate, text_features)
+    term_ids = list(intern_terms(analysis.terms).values())
+
+    row = candidate.features
+    index_candidate_terms(candidate, term_ids, replace=row is not None)
+    index_candidate_skills(candidate, analysis.skills, replace=row is not None)
+    index_candidate_document(candidate, analysis.skills)
+    if row is None:
+        row = CandidateFeatures(candidate=candidate)
+        db.session.add(row)
+    row.feature_version = scorer_version()
+    row.term_ids = pack_term_ids(term_ids)
+    row.term_count = len(analysis.terms)
+    row.skills = sorted(analysis.skills)
+    row.years_experience = analysis.years_experience
+    row.education_levels = sorted(analysis.education_levels)
+    row.updated_at = datetime.now(UTC)
+    if minhash_enabled():
+        index_candidate_signature(candidate, row, analysis.terms)
+    return record_from_row(row)
+
+
+def get_candidate_features(candidate: Candidate) -> CandidateFeatureRecord:
+    """Return the stored feature record, rebuilding it when missing or outdated."""
+    if is_current(candidate.features):
+        return record_from_row(candidate.features)
+    return refresh_candidate_features(candidate)
+
+
+def refresh_stale_features(chunk_size: int = DEFAULT_REFRESH_CHUNK_SIZE) -> int:
+    """Rebuild every missing or outdated feature record, committing once per chunk.
+
+    Used after the scorer version changes, e.g. when a new skill taxonomy is
+    loaded. Returns the number of candidates refreshed.
+    """
+    refreshed = 0
+    last_id = 0
+    while True:
+        version = scorer_version()
+        candidates = (
+            db.session.query(Candidate)
+            .outerjoin(CandidateFeatures, CandidateFeatures.candidate_id == Candidate.id)
+            .filter(
+                Candidate.id > last_id,
+                or_(CandidateFeatures.candidate_id.is_(None), CandidateFeatures.feature_version != version),
+            )
+            .order_by(Candidate.id.asc())
+            .limit(chunk_size)
+            .all()
+        )
+        if not candidates:
+            return refreshed
+        for candidate in candidates:
+            refresh_candidate_features(candidate)
+        db.session.commit()
+        refreshed += len(candidates)
+        last_id = candidates[-1].id
+
+
+def resolve_profile_term_ids(profile: JDProfile) -> dict[str, int]:
+    return lookup_term_ids(profile.terms)
+
+
+def resolve_skill_term_ids(skills) -> dict[str, list[int] | None]:
+    """Map each skill to the ids of its tokens, or ``None`` if any token was never interned."""
+    skill_tokens = {skill: tokenize(skill) for skill in skills}
+    known = lookup_term_ids(token for tokens in skill_tokens.values() for token in tokens)
+
+    resolved = {}
+    for skill, tokens in skill_tokens.items():
+        if tokens and all(token in known for token in tokens):
+            resolved[skill] = [known[token] for token in tokens]
+        else:
+            resolved[skill] = None
+    return resolved
+
+
+def features_match_skills(
+    record: CandidateFeatureRecord, required_skills: set[str], skill_term_ids: dict[str, list[int] | None]
+) -> bool:
+    for skill in required_skills:
+        if skill in record.skills:
+            continue
+        term_ids = skill_term_ids.get(skill)
+        if term_ids and all(record.has_term_id(term_id) for term_id in term_ids):
+            continue
+        return False
+    return True
+
+
+def analysis_matches_skills(analysis: CandidateAnalysis, required_skills: set[str]) -> bool:
+    """:func:`features_match_skills` for an analysis that has not been stored."""
+    for skill in required_skills:
+        if skill in analysis.skills:
+            continue
+        tokens = tokenize(skill)
+        if tokens and all(token in analysis.terms for token in tokens):
+            continue
+        return False
+    return True
@@ -0,0 +1,283 @@
+import heapq
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from sqlalchemy import and_, exists, or_
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.candidate_features import CandidateFeatures
+from app.models.candidate_skill import CandidateSkill
+from app.models.candidate_term import CandidateTerm
+from app.services.scoring import (
+    JDProfile,
+    ScoreResult,
+    _normalize_weights,
+    score_candidate_against_profile,
+    score_matched_terms,
+    scorer_version,
+)
+from app.services.taxonomy import get_skill_taxonomy
+from app.services.vocabulary import lookup_term_ids
+
+DEFAULT_TOP_K = 50
+MAX_TOP_K = 500
+# Totals are rounded to two decimals, so a bound may undershoot a rounded score by this much.
+ROUNDING_SLACK = 0.005
+# Candidate ids read per posting seek, and feature rows loaded per query.
+POSTING_BLOCK_SIZE = 512
+FEATURE_BATCH_SIZE = 256
+
+
+@dataclass
+class MatchSearchResult:
+    matches: list[tuple[int, ScoreResult]]
+    postings: int = 0
+    evaluated: int = 0
+    # Evaluated candidates without a current feature record, scored from their text.
+    scored_from_text: int = 0
+
+
+class _PostingCursor:
+    """Walks the postings of one term in blocks read on demand.
+
+    A block is the next :data:`POSTING_BLOCK_SIZE` candidate ids from a target
+    on, a seek on the ``(term_id, candidate_id)`` primary key, so postings that
+    WAND skips over are never read.
+    """
+
+    def __init__(self, term: str, term_id: int, upper_bound: float):
+        self.term = term
+        self.term_id = term_id
+        self.upper_bound = upper_bound
+        self.block: list[int] = []
+        self.position = 0
+        self.exhausted = False
+        self.read = 0
+        self._read_block(0)
+
+    @property
+    def doc(self) -> int | None:
+        if self.position < len(self.block):
+            return self.block[self.position]
+        return None
+
+    def advance_to(self, target: int):
+        if self.block and target <= self.block[-1]:
+            self.position = bisect_left(self.block, target, lo=self.position)
+        elif self.exhausted:
+            self.position = len(self.block)
+        else:
+            self._read_block(target)
+
+    def _read_block(self, target: int):
+        self.block = [
+            candidate_id
+            for (candidate_id,) in db.session.query(CandidateTerm.candidate_id)
+            .filter(CandidateTerm.term_id == self.term_id, CandidateTerm.candidate_id >= target)
+            .order_by(CandidateTerm.candidate_id)
+            .limit(POSTING_BLOCK_SIZE)
+        ]
+        self.position = 0
+        self.exhausted = len(self.block) < POSTING_BLOCK_SIZE
+        self.read += len(self.block)
+
+
+def index_candidate_terms(candidate: Candidate, term_ids, replace: bool = True):
+    """Replace the postings of ``candidate`` with ``term_ids`` (not committed)."""
+    if candidate.id is None:
+        db.session.flush()
+    if replace:
+        db.session.query(CandidateTerm).filter(CandidateTerm.candidate_id == candidate.id).delete(
+            synchronize_session=False
+        )
+    rows = [{"term_id": term_id, "candidate_id": candidate.id} for term_id in sorted(set(term_ids))]
+    if rows:
+        db.session.execute(CandidateTerm.__table__.insert(), rows)
+
+
+def index_candidate_skills(candidate: Candidate, skills, replace: bool = True):
+    """Replace the materialized skills of ``candidate`` with ``skills`` (not committed)."""
+    if candidate.id is None:
+        db.session.flush()
+    if replace:
+        db.session.query(CandidateSkill).filter(CandidateSkill.candidate_id == candidate.id).delete(
+            synchronize_session=False
+        )
+    rows = [{"candidate_id": candidate.id, "skill": skill} for skill in sorted(set(skills))]
+    if rows:
+        db.session.execute(CandidateSkill.__table__.insert(), rows)
+
+
+def skills_filter(required_skills: set[str], skill_term_ids: dict[str, list[int] | None], candidate_id_column):
+    """SQL predicate equivalent to :func:`~app.services.candidate_features.features_match_skills`.
+
+    Each skill must be one of the candidate's materialized skills or, when all its
+    tokens are known terms, have every token in the candidate's postings. Both are
+    correlated ``EXISTS`` probes on primary keys.
+    """
+    clauses = []
+    for skill in sorted(required_skills):
+        has_skill = exists().where(CandidateSkill.candidate_id == candidate_id_column, CandidateSkill.skill == skill)
+        term_ids = skill_term_ids.get(skill)
+        if term_ids:
+            has_terms = and_(
+                *(
+                    exists().where(CandidateTerm.candidate_id == candidate_id_column, CandidateTerm.term_id == term_id)
+                    for term_id in term_ids
+                )
+            )
+            clauses.append(or_(has_skill, has_terms))
+        else:
+            clauses.append(has_skill)
+    return and_(*clauses)
+
+
+def _upcoming_candidates(cursors: list[_PostingCursor], candidate_id: int) -> list[int]:
+    """``candidate_id`` and the next buffered candidates the cursors may reach, up to a feature batch."""
+    upcoming = {doc for cursor in cursors for doc in cursor.block[cursor.position :] if doc >= candidate_id}
+    return sorted(upcoming)[:FEATURE_BATCH_SIZE]
+
+
+def _load_features(candidate_ids: list[int], feature_version: str) -> dict:
+    """Current feature rows of ``candidate_ids``.
+
+    Candidates whose record is missing or outdated map to their :class:`Candidate`
+    row instead, and deleted ones to ``None``.
+    """
+    features = dict.fromkeys(candidate_ids)
+    rows = db.session.query(
+        CandidateFeatures.candidate_id,
+        CandidateFeatures.term_count,
+        CandidateFeatures.skills,
+        CandidateFeatures.years_experience,
+        CandidateFeatures.education_levels,
+    ).filter(CandidateFeatures.candidate_id.in_(candidate_ids), CandidateFeatures.feature_version == feature_version)
+    for candidate_id, *row in rows:
+        features[candidate_id] = row
+    stale_ids = [candidate_id for candidate_id, row in features.items() if row is None]
+    if stale_ids:
+        for candidate in db.session.query(Candidate).filter(Candidate.id.in_(stale_ids)):
+            features[candidate.id] = candidate
+    return features
+
+
+def _skill_share(profile: JDProfile, weights: dict) -> float:
+    return weights["skills"] * 100.0 / len(profile.skill_terms) if profile.skill_terms else 0.0
+
+
+def _term_upper_bounds(profile: JDProfile, weights: dict, posted_skills: set[str]) -> dict[str, float]:
+    # Keyword overlap / union is at most overlap / |JD terms|, so every matched JD term
+    # adds at most weight / |JD terms|; a skill that only matches through its term
+    # additionally adds its share of the skills component.
+    keyword_share = weights["keywords"] * 100.0 / len(profile.terms) if profile.terms else 0.0
+    skill_share = _skill_share(profile, weights)
+    return {
+        term: keyword_share + (skill_share if term in posted_skills else 0.0) for term in profile.terms
+    }
+
+
+def find_top_matches(profile: JDProfile, k: int = DEFAULT_TOP_K, weights: dict | None = None) -> MatchSearchResult:
+    """Return the ``k`` best-scoring indexed candidates for ``profile`` using WAND.
+
+    Only candidates that share at least one term with the JD are considered. A
+    candidate is fully scored only when the sum of the upper bounds of the terms
+    it may contain, plus the best possible experience and education score, can
+    still beat the current k-th best score. Postings are read in blocks as the
+    cursors advance and feature rows in batches. Candidates without a current
+    feature record are found through the postings they had and scored from their
+    text, as the applications list does.
+    """
+    normalized_weights = _normalize_weights(weights)
+    jd_term_ids = lookup_term_ids(profile.terms)
+    feature_version = scorer_version()
+    # Non-term components are bounded by their full weight, and so are skills that can
+    # match through extracted skills rather than postings: multi-word skills, and
+    # skills with taxonomy aliases (a resume saying "py3" has the skill "python" but
+    # not the term).
+    taxonomy = get_skill_taxonomy()
+    aliased_skills = taxonomy.aliased_skills if taxonomy is not None else frozenset()
+    posted_skills = {skill for skill in profile.skill_terms if skill in profile.terms and skill not in aliased_skills}
+    upper_bounds = _term_upper_bounds(profile, normalized_weights, posted_skills)
+    constant_bound = (
+        (normalized_weights["experience"] + normalized_weights["education"]) * 100.0
+        + (len(profile.skill_terms) - len(posted_skills)) * _skill_share(profile, normalized_weights)
+        + ROUNDING_SLACK
+    )
+
+    all_cursors = [_PostingCursor(term, term_id, upper_bounds[term]) for term, term_id in jd_term_ids.items()]
+    cursors = list(all_cursors)
+    result = MatchSearchResult(matches=[])
+    # Feature rows of the candidates about to be evaluated, loaded in batches.
+    features: dict = {}
+
+    heap: list[tuple[float, int, int, ScoreResult]] = []
+    while True:
+        cursors = [cursor for cursor in cursors if cursor.doc is not None]
+        if not cursors:
+            break
+        cursors.sort(key=lambda cursor: cursor.doc)
+        threshold = heap[0][0] if len(heap) >= k else float("-inf")
+
+        accumulated = constant_bound
+        pivot = None
+        for index, cursor in enumerate(cursors):
+            accumulated += cursor.upper_bound
+            if accumulated > threshold:
+                pivot = index
+                break
+        if pivot is None:
+            break
+
+        pivot_doc = cursors[pivot].doc
+        if cursors[0].doc == pivot_doc:
+            matched_terms = {cursor.term for cursor in cursors if cursor.doc == pivot_doc}
+            if pivot_doc not in features:
+                features = _load_features(_upcoming_candidates(cursors, pivot_doc), feature_version)
+            candidate_features = features[pivot_doc]
+            scored = _score_candidate(candidate_features, profile, matched_terms, normalized_weights)
+            result.evaluated += 1
+            result.scored_from_text += isinstance(candidate_features, Candidate)
+            if scored is not None:
+                entry = (scored.total_score, -pivot_doc, pivot_doc, scored)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+            for cursor in cursors:
+                if cursor.doc == pivot_doc:
+                    cursor.advance_to(pivot_doc + 1)
+        else:
+            for cursor in cursors[:pivot]:
+                cursor.advance_to(pivot_doc)
+
+    result.postings = sum(cursor.read for cursor in all_cursors)
+    ranked = sorted(heap, key=lambda entry: (-entry[0], entry[2]))
+    result.matches = [(candidate_id, scored) for _, _, candidate_id, scored in ranked]
+    return result
+
+
+def _score_candidate(features, profile: JDProfile, matched_terms: set[str], weights: dict) -> ScoreResult | None:
+    if features is None:
+        return None
+    if isinstance(features, Candidate):
+        return score_candidate_against_profile(
+            {
+                "full_name": features.full_name,
+                "resume_filename": features.resume_filename,
+                "extracted_text": features.extracted_text,
+                "profile_json": features.profile_json,
+            },
+            profile,
+            weights,
+        )
+    term_count, skills, years, education_levels = features
+    return score_matched_terms(
+        profile,
+        matched_terms,
+        term_count=term_count,
+        candidate_skills=frozenset(skills or []),
+        candidate_years=years,
+        education_levels=frozenset(education_levels or []),
+        weights=weights,
+    )
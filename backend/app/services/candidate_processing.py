@@ -0,0 +1,71 @@
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.processing_job import ProcessingJob
+from app.services.candidate_features import refresh_candidate_features
+from app.services.job_queue import PermanentJobError, enqueue_job
+from app.services.parse_cache import parse_resume
+from app.services.parser_sandbox import ParserCrashed, ParserError
+from app.services.text_features import TextFeatures
+
+PROCESS_CANDIDATE = "process_candidate"
+
+
+def enqueue_candidate_processing(candidate: Candidate, force_reprocess: bool = False) -> ProcessingJob:
+    """Queue parsing for ``candidate``, reusing a job that is still waiting in the queue."""
+    pending = (
+        ProcessingJob.query.filter_by(
+            job_type=PROCESS_CANDIDATE, entity_type="candidate", entity_id=candidate.id, status="queued"
+        )
+        .order_by(ProcessingJob.id.asc())
+        .first()
+    )
+    if pending is not None:
+        if force_reprocess and not (pending.payload_json or {}).get("force_reprocess"):
+            pending.payload_json = {"force_reprocess": True}
+        return pending
+    return enqueue_job(PROCESS_CANDIDATE, "candidate", candidate.id, payload={"force_reprocess": force_reprocess})
+
+
+def process_candidate(candidate: Candidate, force_reprocess: bool = False) -> Candidate:
+    """Fill in text, profile and features from the stored resume (not committed).
+
+    Parsing is skipped when identical content was parsed before by the same parser version.
+    """
+    extracted_text, profile_json, text_features = parse_resume(candidate.resume_path, candidate.resume_sha256)
+    return apply_parse_result(candidate, extracted_text, profile_json, force_reprocess, text_features)
+
+
+def apply_parse_result(
+    candidate: Candidate,
+    extracted_text: str,
+    profile_json: dict | None,
+    force_reprocess: bool = False,
+    text_features: TextFeatures | None = None,
+) -> Candidate:
+    """Store a parse result and rebuild the feature record (not committed).
+
+    ``text_features`` of ``extracted_text`` are reused for the feature record when
+    that text is the one stored, so the resume is scanned only once.
+    """
+    if force_reprocess or not candidate.extracted_text:
+        candidate.extracted_text = extracted_text
+    if force_reprocess or not candidate.profile_json:
+        candidate.profile_json = profile_json
+    refresh_candidate_features(candidate, text_features if candidate.extracted_text is extracted_text else None)
+    return candidate
+
+
+def run_process_candidate_job(job: ProcessingJob):
+    candidate = db.session.get(Candidate, job.entity_id)
+    if candidate is None:
+        raise PermanentJobError(f"candidate {job.entity_id} not found")
+    try:
+        process_candidate(candidate, force_reprocess=bool((job.payload_json or {}).get("force_reprocess")))
+    except FileNotFoundError as exc:
+        raise PermanentJobError(str(exc)) from exc
+    except ParserCrashed:
+        # Possibly transient (the OS killed the child); let the queue retry it.
+        raise
+    except ParserError as exc:
+        # Timeouts and memory-limit or parse failures repeat on every attempt.
+        raise PermanentJobError(str(exc)) from exc
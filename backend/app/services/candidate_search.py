@@ -0,0 +1,244 @@
+import re
+import unicodedata
+from collections.abc import Iterable
+
+from sqlalchemy import text
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.candidate_search import SEARCH_TABLE
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_LENGTH = 500
+
+# FTS5 bm25() column weights: full_name, email, skills, body.
+SQLITE_BM25_WEIGHTS = (10.0, 10.0, 4.0, 1.0)
+# ts_rank_cd() normalization 1 divides by 1 + log(document length), like BM25's length term.
+POSTGRES_RANK_NORMALIZATION = 1
+
+LEXEME_PATTERN = re.compile(r"[^\W_]+")
+QUERY_TOKEN_PATTERN = re.compile(r'\s*(?:"(?P<phrase>[^"]*)"?|(?P<paren>[()])|(?P<word>[^\s()"]+))')
+
+
+class SearchQueryError(ValueError):
+    """The search query cannot be parsed."""
+
+
+def lexemes(value: str | None) -> list[str]:
+    """Lowercased words of ``value`` without diacritics, split on anything that is not a letter or digit.
+
+    Documents and queries both go through this on both backends, so "Node.js" and
+    "node js" index and match alike on SQLite and PostgreSQL.
+    """
+    decomposed = unicodedata.normalize("NFKD", (value or "").lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return LEXEME_PATTERN.findall(stripped)
+
+
+# Query trees: ("term", lexemes, prefix), ("and", positive nodes, negated nodes), ("or", nodes).
+
+
+def _tokenize_query(query: str) -> list[tuple[str, str]]:
+    tokens = []
+    for match in QUERY_TOKEN_PATTERN.finditer(query):
+        if match.group("phrase") is not None:
+            tokens.append(("phrase", match.group("phrase")))
+        elif match.group("paren"):
+            tokens.append((match.group("paren"), match.group("paren")))
+        elif match.group("word"):
+            word = match.group("word")
+            if word.startswith("-"):
+                tokens.append(("word", "NOT"))
+                word = word[1:]
+            if word:
+                tokens.append(("word", word))
+    return tokens
+
+
+class _QueryParser:
+    def __init__(self, tokens: list[tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def parse(self):
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise SearchQueryError("unbalanced parentheses")
+        return node
+
+    def parse_or(self):
+        branches = [self.parse_and()]
+        while self.peek() == ("word", "OR"):
+            self.position += 1
+            branches.append(self.parse_and())
+        branches = [branch for branch in branches if branch is not None]
+        if len(branches) > 1:
+            return ("or", branches)
+        return branches[0] if branches else None
+
+    def parse_and(self):
+        positive, negated = [], []
+        while (token := self.peek()) is not None and token[0] != ")" and token != ("word", "OR"):
+            if token == ("word", "AND"):
+                self.position += 1
+                continue
+            negate = token == ("word", "NOT")
+            if negate:
+                self.position += 1
+            node = self.parse_atom()
+            if node is not None:
+                (negated if negate else positive).append(node)
+        if not positive:
+            if negated:
+                raise SearchQueryError("a query needs at least one term that is not negated")
+            return None
+        if len(positive) == 1 and not negated:
+            return positive[0]
+        return ("and", positive, negated)
+
+    def parse_atom(self):
+        token = self.peek()
+        if token is None:
+            return None
+        self.position += 1
+        kind, value = token
+        if kind == "(":
+            node = self.parse_or()
+            if self.peek() is not None and self.peek()[0] == ")":
+                self.position += 1
+            return node
+        prefix = kind == "word" and value.endswith("*")
+        words = lexemes(value)
+        return ("term", tuple(words), prefix) if words else None
+
+
+def parse_search_query(query: str):
+    """Parse ``query`` into a tree; ``SearchQueryError`` if it is malformed or matches nothing.
+
+    Words are ANDed; ``OR`` and ``NOT`` (or a leading ``-``) combine them, parentheses
+    group, ``"quoted words"`` match as a phrase and a trailing ``*`` matches a prefix.
+    """
+    if len(query) > MAX_QUERY_LENGTH:
+        raise SearchQueryError(f"query must be at most {MAX_QUERY_LENGTH} characters")
+    node = _QueryParser(_tokenize_query(query)).parse()
+    if node is None:
+        raise SearchQueryError("query has no searchable words")
+    return node
+
+
+def _fts5_match(node) -> str:
+    kind = node[0]
+    if kind == "term":
+        _, words, prefix = node
+        return '"' + " ".join(words) + '"' + ("*" if prefix else "")
+    if kind == "or":
+        return " OR ".join(f"({_fts5_match(branch)})" for branch in node[1])
+    _, positive, negated = node
+    expression = " AND ".join(f"({_fts5_match(item)})" for item in positive)
+    for item in negated:
+        # FTS5's NOT is binary: "a NOT b" is a and not b.
+        expression = f"({expression}) NOT ({_fts5_match(item)})"
+    return expression
+
+
+def _tsquery(node) -> str:
+    kind = node[0]
+    if kind == "term":
+        _, words, prefix = node
+        quoted = [f"'{word}'" for word in words]
+        if prefix:
+            quoted[-1] += ":*"
+        return " <-> ".join(quoted)
+    if kind == "or":
+        return " | ".join(f"({_tsquery(branch)})" for branch in node[1])
+    _, positive, negated = node
+    parts = [f"({_tsquery(item)})" for item in positive] + [f"!({_tsquery(item)})" for item in negated]
+    return " & ".join(parts)
+
+
+def _is_postgres() -> bool:
+    return db.engine.dialect.name == "postgresql"
+
+
+def index_candidate_document(candidate: Candidate, skills: Iterable[str]):
+    """Replace the full-text document of ``candidate`` (not committed)."""
+    if candidate.id is None:
+        db.session.flush()
+    fields = {
+        "candidate_id": candidate.id,
+        "full_name": " ".join(lexemes(candidate.full_name)),
+        "email": " ".join(lexemes(candidate.email)),
+        "skills": " ".join(lexemes(" ".join(sorted(skills)))),
+        "body": " ".join(lexemes(candidate.extracted_text)),
+    }
+    if _is_postgres():
+        db.session.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} (candidate_id, document) VALUES (:candidate_id, "
+                "setweight(to_tsvector('simple', :full_name), 'A') || setweight(to_tsvector('simple', :email), 'A')"
+                " || setweight(to_tsvector('simple', :skills), 'B') || setweight(to_tsvector('simple', :body), 'C')) "
+                "ON CONFLICT (candidate_id) DO UPDATE SET document = EXCLUDED.document"
+            ),
+            fields,
+        )
+        return
+    db.session.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :candidate_id"), fields)
+    db.session.execute(
+        text(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, full_name, email, skills, body) "
+            "VALUES (:candidate_id, :full_name, :email, :skills, :body)"
+        ),
+        fields,
+    )
+
+
+def search_candidates(query: str, limit: int = DEFAULT_SEARCH_LIMIT, offset: int = 0) -> list[tuple[int, float]]:
+    """``(candidate_id, score)`` of the best matches for ``query``, highest score first.
+
+    SQLite ranks with FTS5's BM25; PostgreSQL, which has no BM25, with
+    ``ts_rank_cd`` over a weighted tsvector (name and email above skills above
+    resume text). Ties are ordered by candidate id. Raises :class:`SearchQueryError`.
+    """
+    node = parse_search_query(query)
+    params = {"limit": limit, "offset": offset}
+    if _is_postgres():
+        params["query"] = _tsquery(node)
+        statement = text(
+            f"SELECT s.candidate_id, ts_rank_cd(s.document, q, {POSTGRES_RANK_NORMALIZATION}) AS score "
+            f"FROM {SEARCH_TABLE} s, to_tsquery('simple', :query) q WHERE s.document @@ q "
+            "ORDER BY score DESC, s.candidate_id LIMIT :limit OFFSET :offset"
+        )
+    else:
+        params["query"] = _fts5_match(node)
+        weights = ", ".join(str(weight) for weight in SQLITE_BM25_WEIGHTS)
+        # bm25() is lower for better matches.
+        statement = text(
+            f"SELECT rowid, -bm25({SEARCH_TABLE}, {weights}) AS score FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH :query ORDER BY score DESC, rowid LIMIT :limit OFFSET :offset"
+        )
+    return [(candidate_id, float(score)) for candidate_id, score in db.session.execute(statement, params)]
+
+
+def search_candidate_ids(query: str, limit: int) -> list[int]:
+    """Ids of up to ``limit`` candidates matching ``query``, unranked and in id order.
+
+    For bulk operations on every match, where ranking would only cost time.
+    Raises :class:`SearchQueryError`.
+    """
+    node = parse_search_query(query)
+    if _is_postgres():
+        statement = text(
+            f"SELECT candidate_id FROM {SEARCH_TABLE} WHERE document @@ to_tsquery('simple', :query) "
+            "ORDER BY candidate_id LIMIT :limit"
+        )
+        params = {"query": _tsquery(node), "limit": limit}
+    else:
+        statement = text(
+            f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :query ORDER BY rowid LIMIT :limit"
+        )
+        params = {"query": _fts5_match(node), "limit": limit}
+    return list(db.session.execute(statement, params).scalars())
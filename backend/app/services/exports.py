@@ -0,0 +1,303 @@
+import csv
+import gzip
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+from flask import current_app
+from sqlalchemy import func, update
+
+from app.extensions import db
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.models.processing_job import ProcessingJob
+from app.models.report_export import ReportExport
+from app.models.review_note import ReviewNote
+from app.services.job_queue import PermanentJobError, enqueue_job, is_cancel_requested, renew_lease
+from app.services.scoring import DEFAULT_WEIGHTS
+from app.services.xlsx import MAX_ROWS as XLSX_MAX_ROWS
+from app.services.xlsx import XlsxWriter
+
+EXPORT_REPORT = "export_report"
+EXPORT_ENTITY = "report_export"
+EXPORT_CHUNK_ROWS = 1000
+GZIP_LEVEL = 6
+
+# format -> (file suffix, download mimetype). XLSX is a deflated zip already.
+EXPORT_FORMATS = {
+    "csv": (".csv.gz", "application/gzip"),
+    "ndjson": (".ndjson.gz", "application/gzip"),
+    "xlsx": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+COMPONENTS = tuple(DEFAULT_WEIGHTS)
+REPORT_COLUMNS = [
+    "jd_id",
+    "jd_title",
+    "department",
+    "application_id",
+    "candidate_id",
+    "full_name",
+    "email",
+    "phone",
+    "total_score",
+    "status",
+    *(f"{component}_score" for component in COMPONENTS),
+    *(f"{component}_weight" for component in COMPONENTS),
+    "matched_skills",
+    "missing_skills",
+    "required_years",
+    "candidate_years",
+    "required_education",
+    "reviewed_by",
+    "reviewed_at",
+    "applied_at",
+    "note_count",
+    "notes",
+]
+
+
+def export_root() -> Path:
+    root = Path(current_app.config.get("EXPORT_DIR", "exports"))
+    if not root.is_absolute():
+        root = Path(current_app.root_path).parent / root
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def export_path(export: ReportExport) -> Path:
+    return export_root() / f"report_{export.id}{EXPORT_FORMATS[export.format][0]}"
+
+
+def create_report_export(export_format: str, params: dict, created_by: int | None = None):
+    """Add an export and its job to the session; ``(export, job)``, visible to workers on commit."""
+    export = ReportExport(format=export_format, params_json=params, status="queued", created_by=created_by)
+    db.session.add(export)
+    db.session.flush()
+    return export, enqueue_job(EXPORT_REPORT, EXPORT_ENTITY, export.id)
+
+
+def latest_export_job(export_id: int) -> ProcessingJob | None:
+    return (
+        db.session.query(ProcessingJob)
+        .filter(ProcessingJob.entity_type == EXPORT_ENTITY, ProcessingJob.entity_id == export_id)
+        .order_by(ProcessingJob.id.desc())
+        .first()
+    )
+
+
+def _selected_jds(params: dict) -> list:
+    query = db.session.query(JobDescription.id, JobDescription.title, JobDescription.department)
+    if params.get("jd_ids"):
+        query = query.filter(JobDescription.id.in_(params["jd_ids"]))
+    else:
+        query = query.filter(JobDescription.department == params["department"])
+    return query.order_by(JobDescription.id.asc()).all()
+
+
+def _application_filters(params: dict) -> list:
+    criteria = []
+    if params.get("status"):
+        criteria.append(Application.status == params["status"])
+    if params.get("min_score") is not None:
+        criteria.append(Application.total_score >= params["min_score"])
+    return criteria
+
+
+def _application_chunk(jd_id: int, after_id: int, criteria: list) -> list:
+    # Keyset chunks by application id: every chunk is a fresh, index-backed query,
+    # so progress can be committed between chunks without holding a cursor open.
+    return (
+        db.session.query(
+            Application.id,
+            Application.candidate_id,
+            Application.total_score,
+            Application.status,
+            Application.score_breakdown_json,
+            Application.reviewed_by,
+            Application.reviewed_at,
+            Application.created_at,
+            Candidate.full_name,
+            Candidate.email,
+            Candidate.phone,
+        )
+        .join(Candidate, Candidate.id == Application.candidate_id)
+        .filter(Application.jd_id == jd_id, Application.id > after_id, *criteria)
+        .order_by(Application.id.asc())
+        .limit(EXPORT_CHUNK_ROWS)
+        .all()
+    )
+
+
+def _notes_by_application(application_ids: list[int]) -> dict[int, list[dict]]:
+    notes: dict[int, list[dict]] = {}
+    rows = (
+        db.session.query(ReviewNote.application_id, ReviewNote.author_name, ReviewNote.note_text, ReviewNote.created_at)
+        .filter(ReviewNote.application_id.in_(application_ids))
+        .order_by(ReviewNote.application_id, ReviewNote.created_at, ReviewNote.id)
+    )
+    for application_id, author_name, note_text, created_at in rows:
+        notes.setdefault(application_id, []).append(
+            {"author_name": author_name, "note_text": note_text, "created_at": created_at.isoformat()}
+        )
+    return notes
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _report_record(jd, row, notes: list[dict]) -> dict:
+    return {
+        "jd": {"id": jd.id, "title": jd.title, "department": jd.department},
+        "application_id": row.id,
+        "candidate": {"id": row.candidate_id, "full_name": row.full_name, "email": row.email, "phone": row.phone},
+        "total_score": row.total_score,
+        "status": row.status,
+        "score_breakdown": row.score_breakdown_json,
+        "reviewed_by": row.reviewed_by,
+        "reviewed_at": _isoformat(row.reviewed_at),
+        "applied_at": _isoformat(row.created_at),
+        "notes": notes,
+    }
+
+
+def _component(breakdown: dict, name: str) -> dict:
+    value = breakdown.get(name)
+    return value if isinstance(value, dict) else {}
+
+
+def _report_columns(record: dict) -> list:
+    """One flat row of :data:`REPORT_COLUMNS` for the tabular formats."""
+    breakdown = record["score_breakdown"] if isinstance(record["score_breakdown"], dict) else {}
+    weights = breakdown.get("weights") if isinstance(breakdown.get("weights"), dict) else {}
+    skills = _component(breakdown, "skills")
+    experience = _component(breakdown, "experience")
+    notes = record["notes"]
+    return [
+        record["jd"]["id"],
+        record["jd"]["title"],
+        record["jd"]["department"],
+        record["application_id"],
+        record["candidate"]["id"],
+        record["candidate"]["full_name"],
+        record["candidate"]["email"],
+        record["candidate"]["phone"],
+        record["total_score"],
+        record["status"],
+        *(_component(breakdown, component).get("score") for component in COMPONENTS),
+        *(weights.get(component) for component in COMPONENTS),
+        ", ".join(skills.get("matched") or []),
+        ", ".join(skills.get("missing") or []),
+        experience.get("required_years"),
+        experience.get("candidate_years"),
+        _component(breakdown, "education").get("required"),
+        record["reviewed_by"],
+        record["reviewed_at"],
+        record["applied_at"],
+        len(notes),
+        "\n".join(f"[{note['created_at']}] {note['author_name']}: {note['note_text']}" for note in notes),
+    ]
+
+
+class _CsvReport:
+    def __init__(self, path: Path):
+        self._file = gzip.open(path, "wt", compresslevel=GZIP_LEVEL, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(REPORT_COLUMNS)
+
+    def write(self, record: dict):
+        self._writer.writerow(["" if value is None else value for value in _report_columns(record)])
+
+    def close(self):
+        self._file.close()
+
+
+class _NdjsonReport:
+    def __init__(self, path: Path):
+        self._file = gzip.open(path, "wt", compresslevel=GZIP_LEVEL, encoding="utf-8")
+
+    def write(self, record: dict):
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class _XlsxReport:
+    def __init__(self, path: Path):
+        self._writer = XlsxWriter(path, sheet_name="Report")
+        self._writer.writerow(REPORT_COLUMNS)
+
+    def write(self, record: dict):
+        self._writer.writerow(_report_columns(record))
+
+    def close(self):
+        self._writer.close()
+
+
+REPORT_WRITERS = {"csv": _CsvReport, "ndjson": _NdjsonReport, "xlsx": _XlsxReport}
+
+
+def run_report_export_job(job: ProcessingJob):
+    """Write an export's report file chunk by chunk, committing progress after each chunk.
+
+    Applications are read per JD in keyset chunks of :data:`EXPORT_CHUNK_ROWS`
+    together with their notes, and written straight to a compressed file, so
+    memory does not grow with the size of the report. The file is written under a
+    ``.part`` name and renamed once complete; a retried job starts over.
+    """
+    export = db.session.get(ReportExport, job.entity_id)
+    if export is None:
+        raise PermanentJobError(f"report export {job.entity_id} not found")
+    job_id, worker_id = job.id, job.locked_by
+    export_id, params = export.id, export.params_json
+    jds = _selected_jds(params)
+    criteria = _application_filters(params)
+    total_rows = (
+        db.session.query(func.count(Application.id))
+        .filter(Application.jd_id.in_([jd.id for jd in jds]), *criteria)
+        .scalar()
+    )
+    if export.format == "xlsx" and total_rows >= XLSX_MAX_ROWS:
+        raise PermanentJobError(f"{total_rows:,} rows do not fit in one XLSX sheet; use csv or ndjson")
+    export.status = "processing"
+    export.total_rows = total_rows
+    export.rows_written = 0
+    db.session.commit()
+
+    path = export_path(export)
+    partial = path.with_name(path.name + ".part")
+    writer = REPORT_WRITERS[export.format](partial)
+    rows_written = 0
+    try:
+        for jd in jds:
+            after_id = 0
+            while rows := _application_chunk(jd.id, after_id, criteria):
+                notes = _notes_by_application([row.id for row in rows])
+                for row in rows:
+                    writer.write(_report_record(jd, row, notes.get(row.id, [])))
+                after_id = rows[-1].id
+                rows_written += len(rows)
+
+                if is_cancel_requested(job_id):
+                    raise PermanentJobError("cancelled")
+                db.session.execute(
+                    update(ReportExport).where(ReportExport.id == export_id).values(rows_written=rows_written)
+                )
+                renew_lease(job_id, worker_id)
+                db.session.commit()
+        writer.close()
+    except BaseException:
+        writer.close()
+        partial.unlink(missing_ok=True)
+        raise
+    os.replace(partial, path)
+
+    export = db.session.get(ReportExport, export_id, populate_existing=True)
+    export.status = "completed"
+    export.rows_written = rows_written
+    export.file_name = path.name
+    export.size_bytes = path.stat().st_size
+    export.completed_at = datetime.now(UTC)
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+
+from flask import Flask, current_app
+
+from app.models.job_description import JobDescription
+from app.services.scoring import JDProfile, compile_jd_profile, jd_text_hash, scorer_version
+from app.services.similarity import get_jd_signature, minhash_enabled
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class JDProfileCache:
+    """Bounded LRU of compiled JD profiles, shared by the threads of one worker."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = max(int(maxsize), 0)
+        self._items: OrderedDict[tuple, JDProfile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> JDProfile | None:
+        with self._lock:
+            profile = self._items.get(key)
+            if profile is not None:
+                self._items.move_to_end(key)
+            return profile
+
+    def put(self, key: tuple, profile: JDProfile):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._items[key] = profile
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+def init_jd_profile_cache(app: Flask):
+    maxsize = app.config.get("JD_PROFILE_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+    app.extensions["jd_profile_cache"] = JDProfileCache(maxsize)
+
+
+def _cache() -> JDProfileCache:
+    return current_app.extensions["jd_profile_cache"]
+
+
+def refresh_jd_profile(jd: JobDescription) -> JDProfile:
+    """Compile the scoring profile for ``jd`` and store it on the row (not committed)."""
+    profile = compile_jd_profile(jd.text)
+    jd.scoring_profile_json = profile.to_dict()
+    jd.text_hash = jd_text_hash(jd.text)
+    jd.scorer_version = scorer_version()
+    jd.minhash_signature = None
+    if minhash_enabled():
+        get_jd_signature(jd, profile)
+    return profile
+
+
+def get_jd_profile(jd: JobDescription) -> JDProfile:
+    """Return the compiled profile for ``jd`` from the LRU, the row, or a fresh compile.
+
+    Rows compiled by an older scorer version or another skill taxonomy are recompiled and updated in place;
+    the caller's next commit persists the refreshed profile.
+    """
+    current_version = scorer_version()
+    key = (jd.id, jd.text_hash, jd.scorer_version)
+    if jd.id is not None and jd.scorer_version == current_version:
+        cached = _cache().get(key)
+        if cached is not None:
+            return cached
+
+    if jd.scorer_version == current_version and isinstance(jd.scoring_profile_json, dict):
+        profile = JDProfile.from_dict(jd.scoring_profile_json)
+    else:
+        profile = refresh_jd_profile(jd)
+        key = (jd.id, jd.text_hash, jd.scorer_version)
+
+    if jd.id is not None:
+        _cache().put(key, profile)
+    return profile
@@ -0,0 +1,261 @@
+from datetime import UTC, datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import and_, or_, select, update
+
+from app.extensions import db
+from app.models.processing_job import ProcessingJob
+
+QUEUED = "queued"
+PROCESSING = "processing"
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+# Dead-letter state: the job failed permanently or ran out of attempts. The API
+# reports it as "failed" (ProcessingJob.reported_status).
+DEAD = "dead"
+TERMINAL_STATUSES = frozenset({COMPLETED, CANCELLED, DEAD})
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_SECONDS = 10
+DEFAULT_BACKOFF_MAX_SECONDS = 600
+
+
+class PermanentJobError(Exception):
+    """Raised by a job handler when retrying cannot help; the job goes straight to the dead-letter state."""
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _config(name: str, default):
+    return current_app.config.get(name, default)
+
+
+def enqueue_job(
+    job_type: str,
+    entity_type: str,
+    entity_id: int,
+    payload: dict | None = None,
+    max_attempts: int | None = None,
+) -> ProcessingJob:
+    """Add a queued job to the session; it becomes visible to workers on commit."""
+    job = ProcessingJob(
+        job_type=job_type,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        payload_json=payload,
+        status=QUEUED,
+        attempts=0,
+        max_attempts=max_attempts or int(_config("JOB_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)),
+        run_after=_now(),
+    )
+    db.session.add(job)
+    return job
+
+
+def _update():
+    # Stored timestamps are naive UTC, so let the database evaluate the criteria
+    # rather than SQLAlchemy comparing them in Python; commits expire the session anyway.
+    return update(ProcessingJob).execution_options(synchronize_session=False)
+
+
+def _claimable(now: datetime):
+    # Queued jobs that are due, plus jobs whose worker died holding an expired lease.
+    return or_(
+        and_(ProcessingJob.status == QUEUED, ProcessingJob.run_after <= now),
+        and_(ProcessingJob.status == PROCESSING, ProcessingJob.lease_expires_at < now),
+    )
+
+
+def claim_next_job(worker_id: str, lease_seconds: int | None = None) -> ProcessingJob | None:
+    """Lease the next due job to ``worker_id`` and commit the claim.
+
+    PostgreSQL uses ``SELECT ... FOR UPDATE SKIP LOCKED`` so concurrent workers
+    never wait on each other's rows. Elsewhere the claim is a compare-and-set
+    ``UPDATE ... WHERE status = <seen status>``: if another worker got there first
+    the update matches no row and the next candidate is tried.
+    """
+    lease_seconds = lease_seconds or int(_config("JOB_LEASE_SECONDS", DEFAULT_LEASE_SECONDS))
+    now = _now()
+    claim_values = {
+        "status": PROCESSING,
+        "locked_by": worker_id,
+        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+        "started_at": now,
+        "attempts": ProcessingJob.attempts + 1,
+    }
+    base = (
+        select(ProcessingJob.id, ProcessingJob.status)
+        .where(_claimable(now), ProcessingJob.attempts < ProcessingJob.max_attempts)
+        .order_by(ProcessingJob.run_after.asc(), ProcessingJob.id.asc())
+    )
+
+    if db.engine.dialect.name == "postgresql":
+        row = db.session.execute(base.limit(1).with_for_update(skip_locked=True)).first()
+        if row is None:
+            db.session.rollback()
+            return None
+        db.session.execute(_update().where(ProcessingJob.id == row.id).values(**claim_values))
+        db.session.commit()
+        return db.session.get(ProcessingJob, row.id, populate_existing=True)
+
+    for _ in range(5):
+        rows = db.session.execute(base.limit(5)).all()
+        if not rows:
+            db.session.rollback()
+            return None
+        for job_id, seen_status in rows:
+            result = db.session.execute(
+                _update()
+                .where(ProcessingJob.id == job_id, ProcessingJob.status == seen_status, _claimable(now))
+                .values(**claim_values)
+            )
+            if result.rowcount == 1:
+                db.session.commit()
+                return db.session.get(ProcessingJob, job_id, populate_existing=True)
+        db.session.rollback()
+    return None
+
+
+def _owned(job_id: int, worker_id: str):
+    return _update().where(
+        ProcessingJob.id == job_id,
+        ProcessingJob.status == PROCESSING,
+        ProcessingJob.locked_by == worker_id,
+    )
+
+
+def complete_job(job_id: int, worker_id: str) -> str:
+    """Mark a claimed job completed in the caller's transaction and commit it.
+
+    The handler's own changes are committed together with the new status. If the
+    job was cancelled while running (or its lease was taken over), those changes
+    are rolled back instead. Returns the job's final status.
+    """
+    now = _now()
+    result = db.session.execute(
+        _owned(job_id, worker_id)
+        .where(ProcessingJob.cancel_requested.is_(False))
+        .values(status=COMPLETED, completed_at=now, locked_by=None, lease_expires_at=None, error_message=None)
+    )
+    if result.rowcount == 1:
+        db.session.commit()
+        return COMPLETED
+
+    db.session.rollback()
+    db.session.execute(
+        _owned(job_id, worker_id).values(status=CANCELLED, completed_at=now, locked_by=None, lease_expires_at=None)
+    )
+    db.session.commit()
+    return db.session.get(ProcessingJob, job_id, populate_existing=True).status
+
+
+def renew_lease(job_id: int, worker_id: str, lease_seconds: int | None = None) -> bool:
+    """Extend the lease of a long-running job; ``False`` if the worker no longer owns it."""
+    lease_seconds = lease_seconds or int(_config("JOB_LEASE_SECONDS", DEFAULT_LEASE_SECONDS))
+    result = db.session.execute(
+        _owned(job_id, worker_id).values(lease_expires_at=_now() + timedelta(seconds=lease_seconds))
+    )
+    return result.rowcount == 1
+
+
+def is_cancel_requested(job_id: int) -> bool:
+    return bool(db.session.execute(select(ProcessingJob.cancel_requested).where(ProcessingJob.id == job_id)).scalar())
+
+
+def retry_delay(attempts: int) -> float:
+    base = float(_config("JOB_RETRY_BACKOFF_SECONDS", DEFAULT_BACKOFF_SECONDS))
+    cap = float(_config("JOB_RETRY_BACKOFF_MAX_SECONDS", DEFAULT_BACKOFF_MAX_SECONDS))
+    return min(base * 2 ** max(attempts - 1, 0), cap)
+
+
+def fail_job(job_id: int, worker_id: str, error: str, permanent: bool = False) -> str:
+    """Record a failed attempt: requeue with exponential backoff, or dead-letter the job.
+
+    Call after rolling back the handler's changes. Returns the job's new status.
+    """
+    job = db.session.get(ProcessingJob, job_id, populate_existing=True)
+    if job is None or job.status != PROCESSING or job.locked_by != worker_id:
+        db.session.rollback()
+        return job.status if job is not None else DEAD
+
+    now = _now()
+    if job.cancel_requested:
+        status = CANCELLED
+        values = {"completed_at": now}
+    elif permanent or job.attempts >= job.max_attempts:
+        status = DEAD
+        values = {"completed_at": now}
+    else:
+        status = QUEUED
+        values = {"run_after": now + timedelta(seconds=retry_delay(job.attempts))}
+
+    db.session.execute(
+        _owned(job_id, worker_id).values(
+            status=status, error_message=error, locked_by=None, lease_expires_at=None, **values
+        )
+    )
+    db.session.commit()
+    return status
+
+
+def cancel_job(job: ProcessingJob) -> bool:
+    """Cancel a queued job now, or flag a running one so its worker discards the result.
+
+    Returns ``False`` if the job had already finished.
+    """
+    if job.status in TERMINAL_STATUSES:
+        return False
+    if job.status == QUEUED:
+        result = db.session.execute(
+            _update()
+            .where(ProcessingJob.id == job.id, ProcessingJob.status == QUEUED)
+            .values(status=CANCELLED, completed_at=_now(), cancel_requested=True)
+        )
+        if result.rowcount == 1:
+            db.session.commit()
+            db.session.refresh(job)
+            return True
+        db.session.refresh(job)
+        if job.status in TERMINAL_STATUSES:
+            return False
+
+    job.cancel_requested = True
+    db.session.commit()
+    return True
+
+
+def requeue_job(job: ProcessingJob) -> bool:
+    """Give a dead-lettered job a fresh set of attempts."""
+    if job.status != DEAD:
+        return False
+    job.status = QUEUED
+    job.attempts = 0
+    job.run_after = _now()
+    job.completed_at = None
+    db.session.commit()
+    return True
+
+
+def reap_expired_jobs() -> int:
+    """Dead-letter running jobs whose lease expired after their last allowed attempt."""
+    now = _now()
+    result = db.session.execute(
+        _update()
+        .where(
+            ProcessingJob.status == PROCESSING,
+            ProcessingJob.lease_expires_at < now,
+            ProcessingJob.attempts >= ProcessingJob.max_attempts,
+        )
+        .values(
+            status=DEAD,
+            completed_at=now,
+            locked_by=None,
+            lease_expires_at=None,
+            error_message="lease expired on the last attempt",
+        )
+    )
+    db.session.commit()
+    return result.rowcount
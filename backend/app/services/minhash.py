@@ -0,0 +1,74 @@
+import hashlib
+from collections.abc import Iterable
+from functools import lru_cache
+
+import numpy as np
+
+MERSENNE_PRIME = (1 << 31) - 1
+SIGNATURE_SEED = 1
+DEFAULT_NUM_PERM = 128
+DEFAULT_LSH_BANDS = 64
+
+
+def term_hash(term: str) -> int:
+    return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    """Fixed-size MinHash signatures over term strings.
+
+    Uses ``num_perm`` universal hash functions ``(a * x + b) mod p`` with a fixed
+    seed, so signatures computed by different workers or releases are comparable
+    as long as ``num_perm`` does not change.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = SIGNATURE_SEED):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, terms: Iterable[str]) -> np.ndarray:
+        hashes = np.fromiter((term_hash(term) for term in terms), dtype=np.uint64)
+        if not len(hashes):
+            return np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint32)
+        hashes %= MERSENNE_PRIME
+        # a < 2**31 and x < 2**31, so the products fit in 64 bits.
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME
+        return permuted.min(axis=0).astype(np.uint32)
+
+
+@lru_cache(maxsize=8)
+def get_minhasher(num_perm: int = DEFAULT_NUM_PERM) -> MinHasher:
+    return MinHasher(num_perm)
+
+
+def pack_signature(signature: np.ndarray) -> bytes:
+    return signature.astype("<u4").tobytes()
+
+
+def unpack_signature(raw: bytes) -> np.ndarray:
+    return np.frombuffer(raw, dtype="<u4")
+
+
+def estimate_jaccard(left: np.ndarray, right: np.ndarray) -> float:
+    if len(left) != len(right) or not len(left):
+        return 0.0
+    return float(np.count_nonzero(left == right)) / len(left)
+
+
+def band_keys(signature: np.ndarray, bands: int) -> list[int]:
+    """Hash each of the ``bands`` slices of ``signature`` to a signed 64-bit bucket key."""
+    rows = len(signature) // bands
+    keys = []
+    for band in range(bands):
+        chunk = signature[band * rows : (band + 1) * rows].astype("<u4").tobytes()
+        digest = hashlib.blake2b(chunk, digest_size=8, person=band.to_bytes(4, "little")).digest()
+        keys.append(int.from_bytes(digest, "little", signed=True))
+    return keys
+
+
+def lsh_threshold(num_perm: int, bands: int) -> float:
+    """Similarity at which a pair becomes a candidate with ~50% probability."""
+    rows = num_perm // bands
+    return (1.0 / bands) ** (1.0 / rows)
@@ -0,0 +1,92 @@
+from collections.abc import Callable, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    """The cursor was not issued by this listing, or has been tampered with."""
+
+
+def _serializer() -> URLSafeSerializer:
+    return URLSafeSerializer(current_app.config["SECRET_KEY"], salt="page-cursor")
+
+
+def _dump(value):
+    if isinstance(value, datetime):
+        # Stored timestamps are naive UTC; freshly created rows may still carry a timezone.
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(scope: str, values: Sequence) -> str:
+    """Opaque token for the sort ``values`` of the last row of a page of ``scope``."""
+    return _serializer().dumps([scope, *(_dump(value) for value in values)])
+
+
+def decode_cursor(token: str, scope: str, *parsers: Callable[[Any], Any]) -> list:
+    """Sort values of ``token``, each converted by its parser; ``InvalidCursor`` if unusable.
+
+    ``scope`` must match the one the cursor was issued for, so a cursor from one
+    listing (or one sort order) cannot be replayed against another.
+    """
+    try:
+        data = _serializer().loads(token)
+    except BadSignature as exc:
+        raise InvalidCursor("invalid cursor") from exc
+    if not isinstance(data, list) or len(data) != len(parsers) + 1 or data[0] != scope:
+        raise InvalidCursor("invalid cursor")
+    try:
+        return [parse(value) for parse, value in zip(parsers, data[1:])]
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursor("invalid cursor") from exc
+
+
+def parse_page_args(
+    args: Mapping[str, str], default_limit: int = DEFAULT_PAGE_SIZE
+) -> tuple[int | None, str | None]:
+    """``(limit, cursor)`` from the query string; ``ValueError`` with a client message if invalid.
+
+    Without ``limit`` or ``cursor`` the limit is ``None``: the whole listing, as
+    before pagination existed.
+    """
+    cursor = args.get("cursor") or None
+    if "limit" not in args and cursor is None:
+        return None, None
+    try:
+        limit = int(args.get("limit", default_limit))
+    except ValueError:
+        raise ValueError("limit must be an integer") from None
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit, cursor
+
+
+def rows_after(keys: Sequence[tuple[ColumnElement, bool]], values: Sequence) -> ColumnElement:
+    """Rows that come strictly after ``values`` in the order of ``keys``.
+
+    ``keys`` are ``(column, descending)`` pairs ending with a unique column, and
+    none of the columns may be NULL. Besides the exact row-value comparison, the
+    first key gets a plain range bound so an index on it is seeked rather than
+    walked from the start: every page costs the same however deep it is.
+    """
+    def beyond(column, descending, value):
+        return column < value if descending else column > value
+
+    first_column, first_descending = keys[0]
+    leading_bound = first_column <= values[0] if first_descending else first_column >= values[0]
+    branches = []
+    for position, (column, descending) in enumerate(keys):
+        equal = [keys[index][0] == values[index] for index in range(position)]
+        branches.append(and_(*equal, beyond(column, descending, values[position])))
+    return and_(leading_bound, or_(*branches))
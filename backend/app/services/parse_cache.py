@@ -0,0 +1,94 @@
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from flask import current_app
+
+from app.extensions import db
+from app.models.resume_blob import ResumeParse
+from app.services.bulk import insert_ignore
+from app.services.parser_sandbox import get_parser_sandbox
+from app.services.resume_parser import PARSER_VERSION, parse_resume_with_features
+from app.services.skill_matcher import get_skill_matcher
+from app.services.text_features import TextFeatures, extract_text_features
+
+LOOKUP_CHUNK_SIZE = 500
+
+
+def parser_version() -> str:
+    """:data:`PARSER_VERSION` qualified by the parse limits and the skill taxonomy.
+
+    Both shape the cached result: the limits decide how much text is extracted,
+    the taxonomy which skills the profile holds. Unlimited counts as 0.
+    """
+    limits = parse_limits()
+    version = f"{PARSER_VERSION}+p{limits['max_pages'] or 0}c{limits['max_chars'] or 0}"
+    taxonomy_version = get_skill_matcher().version
+    if taxonomy_version is None:
+        return version
+    return f"{version}+{taxonomy_version}"
+
+
+def parse_limits() -> dict:
+    """Page and character budget for parsing resumes, from ``PDF_MAX_PAGES`` and ``PDF_MAX_CHARS``.
+
+    Both are off unless configured; ``None`` or 0 disables a limit.
+    """
+    max_pages = current_app.config.get("PDF_MAX_PAGES")
+    max_chars = current_app.config.get("PDF_MAX_CHARS")
+    return {"max_pages": int(max_pages) if max_pages else None, "max_chars": int(max_chars) if max_chars else None}
+
+
+def get_cached_parses(content_hashes: Iterable[str]) -> dict[str, ResumeParse]:
+    hashes = sorted(set(content_hashes))
+    version = parser_version()
+    cached: dict[str, ResumeParse] = {}
+    for start in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+        rows = ResumeParse.query.filter(
+            ResumeParse.parser_version == version,
+            ResumeParse.content_sha256.in_(hashes[start : start + LOOKUP_CHUNK_SIZE]),
+        )
+        cached.update((row.content_sha256, row) for row in rows)
+    return cached
+
+
+def store_parse(content_sha256: str, extracted_text: str, profile_json: dict | None):
+    """Cache a parse result (not committed); an existing entry for the same key wins."""
+    db.session.execute(
+        insert_ignore(ResumeParse.__table__).values(
+            content_sha256=content_sha256,
+            parser_version=parser_version(),
+            extracted_text=extracted_text,
+            profile_json=profile_json,
+            created_at=datetime.now(UTC),
+        )
+    )
+
+
+def parse_resume(
+    resume_path: str, content_sha256: str | None = None
+) -> tuple[str, dict, TextFeatures | None]:
+    """Extracted text, profile and text features for a resume.
+
+    Content parsed before comes from the cache, which keeps text and profile
+    only, so its features are ``None``. With a parser sandbox configured the file
+    is parsed in one of its processes, so its errors
+    (:class:`~app.services.parser_sandbox.ParserError`) can surface here.
+    """
+    if content_sha256:
+        cached = get_cached_parses([content_sha256]).get(content_sha256)
+        if cached is not None:
+            return cached.extracted_text, cached.profile_json, None
+
+    sandbox = get_parser_sandbox()
+    if sandbox is not None:
+        # Features are extracted here, where the configured skill taxonomy is available.
+        extracted_text = sandbox.parse(resume_path, **parse_limits())
+        text_features = extract_text_features(extracted_text)
+    else:
+        extracted_text, text_features = parse_resume_with_features(
+            resume_path, workers=int(current_app.config.get("PDF_PARSE_WORKERS", 0)), **parse_limits()
+        )
+    profile_json = text_features.to_profile()
+    if content_sha256:
+        store_parse(content_sha256, extracted_text, profile_json)
+    return extracted_text, profile_json, text_features
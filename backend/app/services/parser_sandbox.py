@@ -0,0 +1,222 @@
+import atexit
+import multiprocessing
+import queue
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from flask import Flask, current_app
+
+from app.services.resume_parser import parse_resume_file
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+DEFAULT_TIMEOUT_SECONDS = 60.0
+DEFAULT_MEMORY_LIMIT_MB = 1024
+STARTUP_TIMEOUT_SECONDS = 60.0
+
+
+class ParserError(RuntimeError):
+    """Parsing failed inside the sandbox."""
+
+
+class ParseTimeout(ParserError):
+    """The parser ran longer than the sandbox timeout and was killed."""
+
+
+class ParserCrashed(ParserError):
+    """The parser process died while parsing, for example killed by the OS."""
+
+
+def _serve(conn, memory_limit_bytes: int | None):
+    # Child process loop: parse one request at a time until the parent closes the pipe.
+    if memory_limit_bytes and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    conn.send(("ready", None))
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        path, options = request
+        try:
+            conn.send(("ok", parse_resume_file(path, **options)))
+        except MemoryError:
+            conn.send(("memory", None))
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+class _Child:
+    def __init__(self, context, memory_limit_bytes: int | None):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child_conn, memory_limit_bytes), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    def wait_ready(self):
+        # Start-up (interpreter and imports) must not count towards the parse timeout.
+        if self.ready:
+            return
+        if not self.conn.poll(STARTUP_TIMEOUT_SECONDS):
+            raise EOFError("parser process did not start")
+        self.conn.recv()
+        self.ready = True
+
+    def kill(self):
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+
+
+class ParserSandbox:
+    """A reusable pool of parser processes with a wall-clock timeout and a memory cap per parse.
+
+    Each child parses one file at a time under ``RLIMIT_AS``; a child that runs
+    past ``timeout`` seconds is killed, and a killed or crashed child is replaced
+    before the next parse. Children are started on first use, so processes that
+    never parse (API servers) never spawn any.
+    """
+
+    def __init__(
+        self, processes: int, timeout: float = DEFAULT_TIMEOUT_SECONDS, memory_limit_bytes: int | None = None
+    ):
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        self.processes = processes
+        self.timeout = timeout
+        self.memory_limit_bytes = memory_limit_bytes
+        # Spawned rather than forked: the callers are threaded workers.
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: queue.LifoQueue[_Child] = queue.LifoQueue()
+        self._started = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def parse(self, path: str, **options) -> str:
+        """Text of the resume at ``path``; ``options`` are passed to :func:`parse_resume_file`.
+
+        Raises :class:`ParseTimeout`, :class:`ParserCrashed` or :class:`ParserError`;
+        a missing file raises ``FileNotFoundError`` without involving a child.
+        """
+        if not Path(path).exists():
+            raise FileNotFoundError(f"resume file not found: {path}")
+
+        child = self._acquire()
+        try:
+            child.wait_ready()
+            child.conn.send((path, options))
+            if not child.conn.poll(self.timeout):
+                child.kill()
+                child = None
+                raise ParseTimeout(f"resume parsing timed out after {self.timeout:g}s")
+            status, value = child.conn.recv()
+        except (EOFError, OSError) as exc:
+            if child is not None:
+                child.kill()
+                child = None
+            raise ParserCrashed("resume parser process exited unexpectedly") from exc
+        finally:
+            self._release(child)
+
+        if status == "memory":
+            if self.memory_limit_bytes:
+                limit_mb = self.memory_limit_bytes // (1024 * 1024)
+                raise ParserError(f"resume parsing exceeded the {limit_mb} MB memory limit")
+            raise ParserError("resume parsing ran out of memory")
+        if status == "error":
+            raise ParserError(value)
+        return value
+
+    def map(self, paths: Iterable[str], **options) -> list[tuple[str | None, str | None]]:
+        """Parse many files concurrently; one ``(text, error)`` pair per path, in order."""
+        def parse_one(path):
+            try:
+                return self.parse(path, **options), None
+            except ParserError as exc:
+                return None, str(exc)
+            except OSError as exc:
+                return None, f"{type(exc).__name__}: {exc}"
+
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=min(self.processes, len(paths) or 1)) as executor:
+            return list(executor.map(parse_one, paths))
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+    def _acquire(self) -> _Child:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._closed:
+                raise ParserError("parser sandbox is closed")
+            start = self._started < self.processes
+            if start:
+                self._started += 1
+        if not start:
+            return self._idle.get()
+        try:
+            return _Child(self._context, self.memory_limit_bytes)
+        except Exception:
+            with self._lock:
+                self._started -= 1
+            raise
+
+    def _release(self, child: _Child | None):
+        if child is None:
+            # Replace the killed child right away so the pool keeps its size.
+            try:
+                child = _Child(self._context, self.memory_limit_bytes)
+            except Exception:
+                with self._lock:
+                    self._started -= 1
+                return
+        if self._closed:
+            child.stop()
+            return
+        self._idle.put(child)
+
+
+def init_parser_sandbox(app: Flask):
+    processes = int(app.config.get("PARSER_SANDBOX_PROCESSES", 0))
+    if processes <= 0:
+        app.extensions["parser_sandbox"] = None
+        return
+    memory_limit_mb = int(app.config.get("PARSER_MEMORY_LIMIT_MB", DEFAULT_MEMORY_LIMIT_MB))
+    sandbox = ParserSandbox(
+        processes,
+        timeout=float(app.config.get("PARSER_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS)),
+        memory_limit_bytes=memory_limit_mb * 1024 * 1024 if memory_limit_mb > 0 else None,
+    )
+    atexit.register(sandbox.close)
+    app.extensions["parser_sandbox"] = sandbox
+
+
+def get_parser_sandbox() -> ParserSandbox | None:
+    """The sandbox configured for the current app, or ``None`` to parse in-process."""
+    return current_app.extensions.get("parser_sandbox")
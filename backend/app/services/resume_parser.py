@@ -1,72 +1,149 @@
-import re
+import multiprocessing
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-COMMON_SKILLS = {
-    "python",
-    "flask",
-    "django",
-    "postgresql",
-    "mysql",
-    "sql",
-    "react",
-    "javascript",
-    "typescript",
-    "aws",
-    "docker",
-    "kubernetes",
-    "git",
-}
-
-
-def parse_resume_file(file_path: str) -> str:
+from app.services.skill_matcher import DEFAULT_SKILLS
+from app.services.text_features import FeatureExtractor, TextFeatures, extract_text_features
+
+COMMON_SKILLS = DEFAULT_SKILLS
+
+# Bump whenever parsing or profile extraction changes so cached parse results are ignored.
+PARSER_VERSION = "2"
+
+# PDFs shorter than this are extracted in the calling process: handing pages to
+# the pool costs more than it saves.
+PARALLEL_MIN_PAGES = 8
+
+_pdf_pools: dict[int, ProcessPoolExecutor] = {}
+_pdf_pools_lock = threading.Lock()
+
+
+def parse_resume_file(
+    file_path: str,
+    *,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    workers: int = 0,
+) -> str:
+    """Text of a resume; see :func:`iter_resume_text` for the limits and ``workers``."""
+    return "\n".join(iter_resume_text(file_path, max_pages=max_pages, max_chars=max_chars, workers=workers)).strip()
+
+
+def parse_resume_with_features(
+    file_path: str,
+    *,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    workers: int = 0,
+) -> tuple[str, TextFeatures]:
+    """Text and text features of a resume, extracting features while later pages are still parsed."""
+    parts = []
+    extractor = FeatureExtractor()
+    for part in iter_resume_text(file_path, max_pages=max_pages, max_chars=max_chars, workers=workers):
+        parts.append(part)
+        extractor.feed(part)
+    return "\n".join(parts).strip(), extractor.result()
+
+
+def iter_resume_text(
+    file_path: str,
+    *,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    workers: int = 0,
+) -> Iterator[str]:
+    """Yield the text of a resume piece by piece: one piece per PDF page, one for other formats.
+
+    At most ``max_pages`` PDF pages are read and at most ``max_chars`` characters
+    are yielded overall; ``None`` means no limit. PDFs of at least
+    :data:`PARALLEL_MIN_PAGES` pages are split into page ranges extracted by
+    ``workers`` processes when ``workers`` is above one.
+    """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"resume file not found: {file_path}")
 
     ext = path.suffix.lower()
-    if ext == ".txt":
-        return path.read_text(encoding="utf-8", errors="ignore")
     if ext == ".pdf":
-        return _parse_pdf(path)
-    if ext == ".docx":
-        return _parse_docx(path)
-
-    return path.read_text(encoding="utf-8", errors="ignore")
+        parts = _iter_pdf_pages(path, max_pages, workers)
+    elif ext == ".docx":
+        parts = iter([_parse_docx(path)])
+    else:
+        parts = iter([path.read_text(encoding="utf-8", errors="ignore")])
+    yield from _limit_chars(parts, max_chars)
 
 
 def extract_profile_from_text(text: str) -> dict:
-    lowered = (text or "").lower()
-    found_skills = sorted([skill for skill in COMMON_SKILLS if skill in lowered])
-
-    years = None
-    years_match = re.search(r"(\d{1,2})\s*\+?\s*years?", lowered)
-    if years_match:
-        years = int(years_match.group(1))
+    return extract_text_features(text).to_profile()
 
-    education = None
-    for level in ["phd", "master", "bachelor"]:
-        if level in lowered:
-            education = level
-            break
 
-    return {
-        "skills": found_skills,
-        "years_experience": years,
-        "education": education,
-    }
+def _limit_chars(parts: Iterable[str], max_chars: int | None) -> Iterator[str]:
+    remaining = max_chars
+    for part in parts:
+        if remaining is not None:
+            if remaining <= 0:
+                break
+            part = part[:remaining]
+            remaining -= len(part)
+        yield part
 
 
-def _parse_pdf(path: Path) -> str:
+def _pdf_reader(path: Path):
     try:
         from pypdf import PdfReader
     except ImportError as exc:
         raise RuntimeError("pypdf is required to parse PDF resumes") from exc
-
-    reader = PdfReader(str(path))
-    parts = []
-    for page in reader.pages:
-        parts.append(page.extract_text() or "")
-    return "\n".join(parts).strip()
+    return PdfReader(str(path))
+
+
+def _iter_pdf_pages(path: Path, max_pages: int | None, workers: int) -> Iterator[str]:
+    reader = _pdf_reader(path)
+    page_count = len(reader.pages)
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+
+    if workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+        yield from _iter_pdf_pages_parallel(path, page_count, workers)
+        return
+    for index in range(page_count):
+        yield reader.pages[index].extract_text() or ""
+
+
+def _iter_pdf_pages_parallel(path: Path, page_count: int, workers: int) -> Iterator[str]:
+    # Two ranges per worker keeps every process busy when pages differ in cost;
+    # ranges are yielded in page order as soon as each one is done, and the ones
+    # not started yet are dropped when the caller stops early.
+    range_size = max(2, -(-page_count // (workers * 2)))
+    pool = _pdf_pool(workers)
+    futures = [
+        pool.submit(_extract_page_range, str(path), start, min(start + range_size, page_count))
+        for start in range(0, page_count, range_size)
+    ]
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list[str]:
+    # Runs in the PDF pool: each process opens the file itself, pypdf readers are not picklable.
+    reader = _pdf_reader(Path(path))
+    return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+def _pdf_pool(workers: int) -> ProcessPoolExecutor:
+    """Long-lived pool per worker count, so process start-up is paid once rather than per resume."""
+    with _pdf_pools_lock:
+        pool = _pdf_pools.get(workers)
+        if pool is None or getattr(pool, "_broken", False):
+            # Spawned rather than forked: callers run in threaded workers and servers.
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pdf_pools[workers] = pool
+        return pool
 
 
 def _parse_docx(path: Path) -> str:
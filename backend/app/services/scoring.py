@@ -1,7 +1,17 @@
+import hashlib
 import json
-import re
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
 
+from app.models.candidate_skill import MAX_SKILL_LENGTH
+from app.services.skill_matcher import get_skill_matcher
+from app.services.taxonomy import canonical_skill
+from app.services.text_features import TextFeatures, extract_text_features, tokenize
+
+# Bump whenever JD or candidate analysis changes so persisted profiles are recompiled.
+SCORER_VERSION = "3"
+
 DEFAULT_WEIGHTS = {
     "skills": 0.45,
     "experience": 0.25,
@@ -9,29 +19,6 @@ DEFAULT_WEIGHTS = {
     "keywords": 0.20,
 }
 
-STOP_WORDS = {
-    "a",
-    "an",
-    "and",
-    "are",
-    "as",
-    "at",
-    "be",
-    "by",
-    "for",
-    "from",
-    "in",
-    "is",
-    "it",
-    "of",
-    "on",
-    "or",
-    "that",
-    "the",
-    "to",
-    "with",
-}
-
 
 @dataclass
 class ScoreResult:
@@ -39,6 +26,59 @@ class ScoreResult:
     breakdown: dict
 
 
+@dataclass(frozen=True)
+class JDProfile:
+    terms: frozenset[str]
+    skill_terms: tuple[str, ...]
+    required_years: int | None
+    required_education: str | None
+
+    def to_dict(self):
+        return {
+            "terms": sorted(self.terms),
+            "skill_terms": list(self.skill_terms),
+            "required_years": self.required_years,
+            "required_education": self.required_education,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JDProfile":
+        return cls(
+            terms=frozenset(data.get("terms") or []),
+            skill_terms=tuple(data.get("skill_terms") or []),
+            required_years=data.get("required_years"),
+            required_education=data.get("required_education"),
+        )
+
+
+@dataclass(frozen=True)
+class CandidateAnalysis:
+    terms: frozenset[str]
+    skills: frozenset[str]
+    years_experience: int | None
+    education_levels: frozenset[str]
+
+
+@dataclass(frozen=True)
+class CandidateFeatureRecord:
+    term_ids: array
+    skills: frozenset[str]
+    years_experience: int | None
+    education_levels: frozenset[str]
+
+    def has_term_id(self, term_id: int) -> bool:
+        index = bisect_left(self.term_ids, term_id)
+        return index < len(self.term_ids) and self.term_ids[index] == term_id
+
+
+def scorer_version() -> str:
+    """:data:`SCORER_VERSION` qualified by the skill taxonomy in use, if one is configured."""
+    taxonomy_version = get_skill_matcher().version
+    if taxonomy_version is None:
+        return SCORER_VERSION
+    return f"{SCORER_VERSION}+{taxonomy_version}"
+
+
 def _normalize_weights(weights: dict | None) -> dict:
     base = dict(DEFAULT_WEIGHTS)
     if weights:
@@ -53,52 +93,41 @@ def _normalize_weights(weights: dict | None) -> dict:
     return {k: v / total for k, v in base.items()}
 
 
-def _tokenize(text: str) -> list[str]:
-    tokens = re.findall(r"[a-zA-Z0-9+#.]+", (text or "").lower())
-    return [t for t in tokens if t not in STOP_WORDS and len(t) > 1]
-
-
-def _extract_years(text: str) -> int | None:
-    match = re.search(r"(\d{1,2})\s*\+?\s*years?", (text or "").lower())
-    if not match:
-        return None
-    return int(match.group(1))
-
-
 def _skills_from_profile(profile_json: dict | None) -> set[str]:
     if not isinstance(profile_json, dict):
         return set()
 
     skills = profile_json.get("skills")
-    if isinstance(skills, list):
-        return {str(skill).strip().lower() for skill in skills if str(skill).strip()}
-    return set()
-
-
-def _build_candidate_text(candidate: dict) -> str:
-    parts = [
-        candidate.get("full_name") or "",
-        candidate.get("resume_filename") or "",
-        candidate.get("extracted_text") or "",
-    ]
+    if not isinstance(skills, list):
+        return set()
+    # Longer values cannot be materialized as skills; they still count through the profile text.
+    canonical = (canonical_skill(skill) for skill in skills if str(skill).strip())
+    return {skill for skill in canonical if len(skill) <= MAX_SKILL_LENGTH}
 
-    profile_json = candidate.get("profile_json")
-    if isinstance(profile_json, dict):
-        parts.extend(profile_json.get("skills", []))
-        years = profile_json.get("years_experience")
-        if years is not None:
-            parts.append(f"{years} years")
-        education = profile_json.get("education")
-        if education is not None:
-            parts.append(str(education))
 
+def _profile_text(profile_json: dict | None) -> str:
+    """Profile fields as text, so they count as terms of the candidate."""
+    if not isinstance(profile_json, dict):
+        return ""
+    skills = profile_json.get("skills")
+    parts = list(skills) if isinstance(skills, list) else []
+    years = profile_json.get("years_experience")
+    if years is not None:
+        parts.append(f"{years} years")
+    education = profile_json.get("education")
+    if education is not None:
+        parts.append(str(education))
     return " ".join(str(part) for part in parts)
 
 
-def _extract_jd_skill_terms(jd_text: str, limit: int = 20) -> list[str]:
+def _extract_jd_skill_terms(jd_text: str, features: TextFeatures, limit: int = 20) -> list[str]:
+    if features.skills:
+        return list(features.skills[:limit])
+
+    # No known skill in the JD: fall back to its first distinct tokens.
     terms = []
     seen = set()
-    for token in _tokenize(jd_text):
+    for token in tokenize(jd_text):
         if token in seen:
             continue
         seen.add(token)
@@ -118,36 +147,155 @@ def _load_json(raw: str | None) -> dict | None:
     return loaded if isinstance(loaded, dict) else None
 
 
+def jd_text_hash(jd_text: str) -> str:
+    return hashlib.sha256((jd_text or "").encode("utf-8")).hexdigest()
+
+
+def compile_jd_profile(jd_text: str) -> JDProfile:
+    jd_text = jd_text or ""
+    features = extract_text_features(jd_text)
+    return JDProfile(
+        terms=features.terms,
+        skill_terms=tuple(_extract_jd_skill_terms(jd_text, features)),
+        required_years=features.years_experience,
+        required_education=features.education,
+    )
+
+
 def score_candidate_against_jd(candidate: dict, jd: dict, weights: dict | None = None) -> ScoreResult:
-    normalized_weights = _normalize_weights(weights)
+    profile = compile_jd_profile(jd.get("text") or "")
+    return score_candidate_against_profile(candidate, profile, weights)
 
-    jd_text = jd.get("text") or ""
-    candidate_text = _build_candidate_text(candidate)
-    candidate_terms = set(_tokenize(candidate_text))
-    jd_terms = set(_tokenize(jd_text))
-    jd_skill_terms = _extract_jd_skill_terms(jd_text)
 
-    matched_skills = [skill for skill in jd_skill_terms if skill in candidate_terms]
-    missing_skills = [skill for skill in jd_skill_terms if skill not in candidate_terms]
-    skill_score = (len(matched_skills) / len(jd_skill_terms) * 100.0) if jd_skill_terms else 0.0
+def analyze_candidate(candidate: dict, text_features: TextFeatures | None = None) -> CandidateAnalysis:
+    """Terms, skills, years and education of a candidate.
 
+    The resume text, the name and file name, and the stored profile are each
+    scanned once and the results merged. Pass ``text_features`` when they were
+    already extracted from ``candidate["extracted_text"]`` (by the parser), so
+    the resume text is not scanned again.
+    """
     profile_json = candidate.get("profile_json")
     if isinstance(profile_json, str):
         profile_json = _load_json(profile_json)
 
-    profile_skills = _skills_from_profile(profile_json)
-    if profile_skills and jd_skill_terms:
-        profile_matches = len([s for s in jd_skill_terms if s in profile_skills])
-        profile_skill_score = profile_matches / len(jd_skill_terms) * 100.0
-        skill_score = max(skill_score, profile_skill_score)
+    if text_features is None:
+        text_features = extract_text_features(candidate.get("extracted_text") or "")
+    header = extract_text_features(f"{candidate.get('full_name') or ''} {candidate.get('resume_filename') or ''}")
+    profile = extract_text_features(_profile_text(profile_json))
+    parts = (header, text_features, profile)
 
-    required_years = _extract_years(jd_text)
-    candidate_years = None
+    years = None
     if isinstance(profile_json, dict) and isinstance(profile_json.get("years_experience"), (int, float)):
-        candidate_years = int(profile_json["years_experience"])
-    if candidate_years is None:
-        candidate_years = _extract_years(candidate_text)
+        years = int(profile_json["years_experience"])
+    if years is None:
+        years = next((part.years_experience for part in parts if part.years_experience is not None), None)
+
+    skills = _skills_from_profile(profile_json)
+    for part in parts:
+        skills.update(part.skills)
+    return CandidateAnalysis(
+        terms=frozenset().union(*(part.terms for part in parts)),
+        skills=frozenset(skills),
+        years_experience=years,
+        education_levels=frozenset().union(*(part.education_levels for part in parts)),
+    )
+
+
+def score_candidate_against_profile(
+    candidate: dict, profile: JDProfile, weights: dict | None = None
+) -> ScoreResult:
+    analysis = analyze_candidate(candidate)
+    return score_matched_terms(
+        profile,
+        set(profile.terms.intersection(analysis.terms)),
+        term_count=len(analysis.terms),
+        candidate_skills=analysis.skills,
+        candidate_years=analysis.years_experience,
+        education_levels=analysis.education_levels,
+        weights=weights,
+    )
+
+
+def score_features_against_profile(
+    features: CandidateFeatureRecord,
+    profile: JDProfile,
+    jd_term_ids: dict[str, int],
+    weights: dict | None = None,
+) -> ScoreResult:
+    """Score a stored candidate feature record; ``jd_term_ids`` maps JD terms to interned ids.
+
+    JD terms missing from ``jd_term_ids`` have never been seen in any resume, so
+    they can only count towards the keyword union, never the overlap.
+    """
+    matched_terms = set()
+    for term in profile.terms:
+        term_id = jd_term_ids.get(term)
+        if term_id is not None and features.has_term_id(term_id):
+            matched_terms.add(term)
+
+    return score_matched_terms(
+        profile,
+        matched_terms,
+        term_count=len(features.term_ids),
+        candidate_skills=features.skills,
+        candidate_years=features.years_experience,
+        education_levels=features.education_levels,
+        weights=weights,
+    )
+
+
+def score_matched_terms(
+    profile: JDProfile,
+    matched_terms: set[str],
+    *,
+    term_count: int,
+    candidate_skills: frozenset[str],
+    candidate_years: int | None,
+    education_levels: frozenset[str],
+    weights: dict | None = None,
+) -> ScoreResult:
+    """Score a candidate known only by which JD terms it contains and its vocabulary size.
+
+    A JD skill counts as matched when it is one of the candidate's terms or one of
+    its extracted skills; the latter covers multi-word skills such as "ci/cd".
+    """
+    matched_skills = []
+    missing_skills = []
+    for skill in profile.skill_terms:
+        (matched_skills if skill in matched_terms or skill in candidate_skills else missing_skills).append(skill)
+    keyword_overlap = len(matched_terms)
+    keyword_union = len(profile.terms) + term_count - keyword_overlap
+
+    return _combine_components(
+        profile,
+        weights,
+        matched_skills=matched_skills,
+        missing_skills=missing_skills,
+        candidate_years=candidate_years,
+        education_levels=education_levels,
+        keyword_overlap=keyword_overlap,
+        keyword_union=keyword_union,
+    )
+
+
+def _combine_components(
+    profile: JDProfile,
+    weights: dict | None,
+    *,
+    matched_skills: list[str],
+    missing_skills: list[str],
+    candidate_years: int | None,
+    education_levels: frozenset[str],
+    keyword_overlap: int,
+    keyword_union: int,
+) -> ScoreResult:
+    normalized_weights = _normalize_weights(weights)
+    jd_skill_terms = profile.skill_terms
 
+    skill_score = (len(matched_skills) / len(jd_skill_terms) * 100.0) if jd_skill_terms else 0.0
+
+    required_years = profile.required_years
     if required_years is None:
         experience_score = 100.0
     elif candidate_years is None:
@@ -155,21 +303,13 @@ def score_candidate_against_jd(candidate: dict, jd: dict, weights: dict | None =
     else:
         experience_score = min(candidate_years / required_years, 1.0) * 100.0
 
-    jd_lower = jd_text.lower()
-    candidate_lower = candidate_text.lower()
-    required_education = None
-    for level in ["phd", "master", "bachelor"]:
-        if level in jd_lower:
-            required_education = level
-            break
-
+    required_education = profile.required_education
     if required_education is None:
         education_score = 100.0
     else:
-        education_score = 100.0 if required_education in candidate_lower else 0.0
+        education_score = 100.0 if required_education in education_levels else 0.0
 
-    union = jd_terms.union(candidate_terms)
-    keyword_score = (len(jd_terms.intersection(candidate_terms)) / len(union) * 100.0) if union else 0.0
+    keyword_score = (keyword_overlap / keyword_union * 100.0) if keyword_union else 0.0
 
     total_score = (
         normalized_weights["skills"] * skill_score
@@ -178,7 +318,33 @@ def score_candidate_against_jd(candidate: dict, jd: dict, weights: dict | None =
         + normalized_weights["keywords"] * keyword_score
     )
 
-    breakdown = {
+    breakdown = build_breakdown(
+        profile,
+        normalized_weights,
+        matched_skills=matched_skills,
+        missing_skills=missing_skills,
+        candidate_years=candidate_years,
+        skill_score=skill_score,
+        experience_score=experience_score,
+        education_score=education_score,
+        keyword_score=keyword_score,
+    )
+    return ScoreResult(total_score=round(total_score, 2), breakdown=breakdown)
+
+
+def build_breakdown(
+    profile: JDProfile,
+    normalized_weights: dict,
+    *,
+    matched_skills: list[str],
+    missing_skills: list[str],
+    candidate_years: int | None,
+    skill_score: float,
+    experience_score: float,
+    education_score: float,
+    keyword_score: float,
+) -> dict:
+    return {
         "weights": normalized_weights,
         "skills": {
             "score": round(skill_score, 2),
@@ -187,16 +353,14 @@ def score_candidate_against_jd(candidate: dict, jd: dict, weights: dict | None =
         },
         "experience": {
             "score": round(experience_score, 2),
-            "required_years": required_years,
+            "required_years": profile.required_years,
             "candidate_years": candidate_years,
         },
         "education": {
             "score": round(education_score, 2),
-            "required": required_education,
+            "required": profile.required_education,
         },
         "keywords": {
             "score": round(keyword_score, 2),
         },
     }
-
-    return ScoreResult(total_score=round(total_score, 2), breakdown=breakdown)
@@ -0,0 +1,95 @@
+from collections.abc import Iterable
+
+from flask import current_app
+from sqlalchemy import tuple_
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.candidate_features import CandidateFeatures
+from app.models.job_description import JobDescription
+from app.models.lsh_bucket import LshBucket
+from app.services.minhash import (
+    DEFAULT_LSH_BANDS,
+    DEFAULT_NUM_PERM,
+    band_keys,
+    estimate_jaccard,
+    get_minhasher,
+    pack_signature,
+    unpack_signature,
+)
+from app.services.scoring import JDProfile
+
+LOAD_CHUNK_SIZE = 500
+
+
+def minhash_enabled() -> bool:
+    return bool(current_app.config.get("MINHASH_ENABLED", False))
+
+
+def lsh_settings() -> tuple[int, int]:
+    num_perm = int(current_app.config.get("MINHASH_NUM_PERM", DEFAULT_NUM_PERM))
+    bands = int(current_app.config.get("LSH_BANDS", DEFAULT_LSH_BANDS))
+    if bands <= 0 or num_perm % bands:
+        raise ValueError("MINHASH_NUM_PERM must be a positive multiple of LSH_BANDS")
+    return num_perm, bands
+
+
+def index_candidate_signature(candidate: Candidate, features: CandidateFeatures, terms: Iterable[str]):
+    """Store the MinHash signature of ``terms`` and refresh the LSH buckets (not committed)."""
+    num_perm, bands = lsh_settings()
+    signature = get_minhasher(num_perm).signature(terms)
+    features.minhash = pack_signature(signature)
+
+    if candidate.id is None:
+        db.session.flush()
+    db.session.query(LshBucket).filter(LshBucket.candidate_id == candidate.id).delete(
+        synchronize_session=False
+    )
+    db.session.execute(
+        LshBucket.__table__.insert(),
+        [
+            {"band": band, "bucket": bucket, "candidate_id": candidate.id}
+            for band, bucket in enumerate(band_keys(signature, bands))
+        ],
+    )
+
+
+def get_jd_signature(jd: JobDescription, profile: JDProfile):
+    """Return the JD's MinHash signature, (re)computing it when missing or sized differently."""
+    num_perm, _ = lsh_settings()
+    if jd.minhash_signature is not None and len(jd.minhash_signature) == num_perm * 4:
+        return unpack_signature(jd.minhash_signature)
+    signature = get_minhasher(num_perm).signature(profile.terms)
+    jd.minhash_signature = pack_signature(signature)
+    return signature
+
+
+def find_similar_candidates(signature, threshold: float, limit: int) -> list[tuple[int, float]]:
+    """Candidates whose estimated Jaccard similarity with ``signature`` is at least ``threshold``.
+
+    Only candidates that collide with the query in at least one LSH band are
+    compared, so the cost depends on the bucket sizes rather than the pool size.
+    Results are ordered by estimated similarity, then candidate id.
+    """
+    _, bands = lsh_settings()
+    keys = [(band, bucket) for band, bucket in enumerate(band_keys(signature, bands))]
+    candidate_ids = [
+        candidate_id
+        for (candidate_id,) in db.session.query(LshBucket.candidate_id)
+        .filter(tuple_(LshBucket.band, LshBucket.bucket).in_(keys))
+        .distinct()
+    ]
+
+    similar = []
+    for start in range(0, len(candidate_ids), LOAD_CHUNK_SIZE):
+        chunk = candidate_ids[start : start + LOAD_CHUNK_SIZE]
+        rows = db.session.query(CandidateFeatures.candidate_id, CandidateFeatures.minhash).filter(
+            CandidateFeatures.candidate_id.in_(chunk), CandidateFeatures.minhash.isnot(None)
+        )
+        for candidate_id, raw in rows:
+            estimate = estimate_jaccard(signature, unpack_signature(raw))
+            if estimate >= threshold:
+                similar.append((candidate_id, estimate))
+
+    similar.sort(key=lambda item: (-item[1], item[0]))
+    return similar[:limit]
@@ -0,0 +1,169 @@
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+
+from app.services.taxonomy import (
+    ASCII_SIZE,
+    SkillAutomaton,
+    SkillTaxonomy,
+    build_automaton,
+    get_skill_taxonomy,
+    normalize_skill,
+)
+
+DEFAULT_SKILLS = frozenset(
+    {
+        "python",
+        "flask",
+        "django",
+        "postgresql",
+        "mysql",
+        "sql",
+        "react",
+        "javascript",
+        "typescript",
+        "aws",
+        "docker",
+        "kubernetes",
+        "git",
+        "machine learning",
+        "ci/cd",
+        "node.js",
+    }
+)
+
+# Characters that continue a word: a match must not be preceded or followed by one,
+# so "sql" does not match inside "postgresql" and "c" does not match inside "c++".
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#")
+# Character class marking whitespace; never a real class.
+_SPACE = -1
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every known skill in one pass over a text.
+
+    Patterns are matched case-insensitively on word boundaries, and any run of
+    whitespace in the text matches a single space in a multi-word pattern. A
+    matcher for a compiled taxonomy walks the tables in the taxonomy's memory
+    mapping; one built from patterns holds its own.
+    """
+
+    def __init__(self, patterns: Mapping[str, str], version: str | None = None):
+        # Identifies the skill list for persisted analyses; ``None`` for the built-in list.
+        self.version = version
+        self.taxonomy: SkillTaxonomy | None = None
+        names = sorted(set(patterns.values()))
+        index_of = {name: index for index, name in enumerate(names)}
+        normalized = {normalize_skill(pattern): index_of[canonical] for pattern, canonical in patterns.items()}
+        normalized.pop("", None)
+        self._use(build_automaton(normalized), names.__getitem__)
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[str]) -> "SkillMatcher":
+        return cls({normalize_skill(skill): normalize_skill(skill) for skill in skills})
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy: SkillTaxonomy) -> "SkillMatcher":
+        matcher = cls({}, version=taxonomy.checksum[:12])
+        matcher.taxonomy = taxonomy
+        matcher._use(taxonomy.automaton, taxonomy.skill)
+        return matcher
+
+    def _use(self, automaton: SkillAutomaton, skill_name: Callable[[int], str]):
+        self._automaton = automaton
+        self._skill_name = skill_name
+        # Class of each ASCII character, with _SPACE for whitespace (collapsed into " ").
+        self._ascii_classes = [
+            _SPACE if chr(code).isspace() else automaton.ascii_classes[code] for code in range(ASCII_SIZE)
+        ]
+        self._space_class = automaton.ascii_classes[ord(" ")]
+
+    def _extra_class(self, code: int) -> int:
+        if chr(code).isspace():
+            return _SPACE
+        extra_chars = self._automaton.extra_chars
+        index = bisect_left(extra_chars, code)
+        if index < len(extra_chars) and extra_chars[index] == code:
+            return self._automaton.extra_classes[index]
+        return 0
+
+    def find(self, text: str) -> list[str]:
+        """Canonical skills found in ``text``, deduplicated, in order of first occurrence."""
+        lowered = (text or "").lower()
+        automaton = self._automaton
+        ascii_classes = self._ascii_classes
+        space_class = self._space_class
+        transitions = automaton.transitions
+        width = automaton.width
+        output_offsets = automaton.output_offsets
+        output_lengths = automaton.output_lengths
+        output_skills = automaton.output_skills
+
+        ascii_size, space = ASCII_SIZE, _SPACE
+        found: dict[int, None] = {}
+        row = 0
+        previous_space = True
+        # One code point per character, without a Python call per character.
+        codes = memoryview(lowered.encode("utf-32-le", "surrogatepass")).cast("I")
+        for position, code in enumerate(codes):
+            char_class = ascii_classes[code] if code < ascii_size else self._extra_class(code)
+            if char_class == space:
+                if previous_space:
+                    continue
+                char_class = space_class
+                previous_space = True
+            else:
+                previous_space = False
+
+            transition = transitions[row + char_class]
+            row = transition >> 1
+            if not transition & 1:
+                continue
+
+            end = position + 1
+            if end < len(lowered) and lowered[end] in _WORD_CHARS:
+                continue
+            state = row // width
+            for output in range(output_offsets[state], output_offsets[state + 1]):
+                start = _match_start(lowered, position, output_lengths[output])
+                if start > 0 and lowered[start - 1] in _WORD_CHARS:
+                    continue
+                found.setdefault(output_skills[output], None)
+        return [self._skill_name(skill) for skill in found]
+
+
+def _match_start(lowered: str, last: int, length: int) -> int:
+    """Position of the first of the ``length`` characters fed up to ``last``.
+
+    A whitespace run was fed as one space, at its first character.
+    """
+    position = last
+    for _ in range(length - 1):
+        position -= 1
+        while position > 0 and lowered[position].isspace() and lowered[position - 1].isspace():
+            position -= 1
+    return position
+
+
+@lru_cache(maxsize=1)
+def _default_matcher() -> SkillMatcher:
+    return SkillMatcher.from_skills(DEFAULT_SKILLS)
+
+
+# Matcher of the taxonomy in service. Replaced, not added to, when the taxonomy is
+# reloaded, so the previous taxonomy's mapping is released once its readers finish.
+_taxonomy_matcher: SkillMatcher | None = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Matcher for the configured skill taxonomy, swapped when the taxonomy is reloaded."""
+    global _taxonomy_matcher
+    taxonomy = get_skill_taxonomy()
+    if taxonomy is None:
+        return _default_matcher()
+    matcher = _taxonomy_matcher
+    if matcher is None or matcher.taxonomy is not taxonomy:
+        # Building one only wraps the mapped tables, so a race costs nothing.
+        matcher = SkillMatcher.from_taxonomy(taxonomy)
+        _taxonomy_matcher = matcher
+    return matcher
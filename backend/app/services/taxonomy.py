@@ -0,0 +1,443 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from flask import Flask, current_app, has_app_context
+
+MAGIC = b"SKTX"
+FORMAT_VERSION = 2
+# magic, format version, flags, skill count, alias count, content checksum,
+# then the matcher's sizes: states, character classes, non-ASCII characters
+# and outputs
+_HEADER = struct.Struct("<4sHHII8sIIII")
+_U32 = struct.Struct("<I")
+ASCII_SIZE = 128
+
+
+class TaxonomyError(ValueError):
+    pass
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).lower().split())
+
+
+def load_taxonomy_source(source_path: str) -> dict[str, set[str]]:
+    """Read a JSON taxonomy: ``{"skills": [{"name": ..., "aliases": [...]}, ...]}``.
+
+    Entries may also be plain strings (a skill without aliases).
+    """
+    with open(source_path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    entries = data.get("skills") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise TaxonomyError("taxonomy source must contain a list of skills")
+
+    skills: dict[str, set[str]] = {}
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict) or not normalize_skill(entry.get("name") or ""):
+            raise TaxonomyError(f"invalid taxonomy entry: {entry!r}")
+        name = normalize_skill(entry["name"])
+        aliases = skills.setdefault(name, set())
+        aliases.update(normalize_skill(alias) for alias in entry.get("aliases") or [] if normalize_skill(alias))
+    return skills
+
+
+@dataclass(frozen=True)
+class SkillAutomaton:
+    """Tables of an Aho-Corasick automaton with every failure link already followed.
+
+    Characters map to a class (``0`` for characters in no pattern): ASCII through
+    ``ascii_classes``, the rest by binary search of ``extra_chars``. States are
+    referred to by the offset of their row, ``state * width``, and a transition
+    ``transitions[row + class]`` holds the next state's row shifted left by one,
+    with the low bit set when a match ends in that state. Those matches are
+    entries ``output_offsets[state]`` up to ``output_offsets[state + 1]`` of
+    ``output_lengths`` (pattern length) and ``output_skills`` (skill index).
+
+    The tables are flat ``uint32`` sequences: in-memory arrays when built here,
+    views straight into the memory-mapped file for a compiled taxonomy.
+    """
+
+    ascii_classes: Sequence[int]
+    extra_chars: Sequence[int]
+    extra_classes: Sequence[int]
+    transitions: Sequence[int]
+    output_offsets: Sequence[int]
+    output_lengths: Sequence[int]
+    output_skills: Sequence[int]
+    width: int
+
+    @property
+    def state_count(self) -> int:
+        return len(self.output_offsets) - 1
+
+    def tables(self) -> tuple[Sequence[int], ...]:
+        """The tables in file order."""
+        return (
+            self.ascii_classes,
+            self.extra_chars,
+            self.extra_classes,
+            self.transitions,
+            self.output_offsets,
+            self.output_lengths,
+            self.output_skills,
+        )
+
+
+def build_automaton(patterns: Mapping[str, int]) -> SkillAutomaton:
+    """Automaton finding every pattern of ``patterns`` (normalized pattern -> skill index)."""
+    chars = sorted({char for pattern in patterns for char in pattern})
+    class_of = {char: index for index, char in enumerate(chars, start=1)}
+    width = len(chars) + 1
+
+    goto: list[dict[int, int]] = [{}]
+    outputs: list[list[tuple[int, int]]] = [[]]
+    for pattern, skill in patterns.items():
+        state = 0
+        for char in pattern:
+            next_state = goto[state].get(class_of[char])
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][class_of[char]] = next_state
+                goto.append({})
+                outputs.append([])
+            state = next_state
+        outputs[state].append((len(pattern), skill))
+
+    # Breadth-first, so a state's failure target is complete before the state itself.
+    delta = [0] * (width * len(goto))
+    fail = [0] * len(goto)
+    for char_class, next_state in goto[0].items():
+        delta[char_class] = next_state
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        outputs[state].extend(outputs[fail[state]])
+        row, fallback_row = state * width, fail[state] * width
+        for char_class in range(1, width):
+            next_state = goto[state].get(char_class)
+            if next_state is None:
+                delta[row + char_class] = delta[fallback_row + char_class]
+                continue
+            delta[row + char_class] = next_state
+            fail[next_state] = delta[fallback_row + char_class]
+            queue.append(next_state)
+    transitions = array("I", ((state * width) << 1 | bool(outputs[state]) for state in delta))
+
+    ascii_classes = array("I", bytes(4 * ASCII_SIZE))
+    extra = [(ord(char), class_of[char]) for char in chars if ord(char) >= ASCII_SIZE]
+    for char in chars:
+        if ord(char) < ASCII_SIZE:
+            ascii_classes[ord(char)] = class_of[char]
+    output_offsets = array("I", [0])
+    output_lengths, output_skills = array("I"), array("I")
+    for items in outputs:
+        for length, skill in items:
+            output_lengths.append(length)
+            output_skills.append(skill)
+        output_offsets.append(len(output_lengths))
+    return SkillAutomaton(
+        ascii_classes=ascii_classes,
+        extra_chars=array("I", (code for code, _ in extra)),
+        extra_classes=array("I", (char_class for _, char_class in extra)),
+        transitions=transitions,
+        output_offsets=output_offsets,
+        output_lengths=output_lengths,
+        output_skills=output_skills,
+        width=width,
+    )
+
+
+def _little_endian(table: array) -> bytes:
+    if sys.byteorder == "little":
+        return table.tobytes()
+    swapped = array(table.typecode, table)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def compile_taxonomy(skills: dict[str, set[str]], output_path: str) -> str:
+    """Write ``skills`` (canonical name -> aliases) as a binary taxonomy file.
+
+    The file is written next to ``output_path`` and atomically renamed into place,
+    so readers never observe a partially written taxonomy. Returns the checksum.
+    """
+    names = sorted(skills)
+    index_of = {name: index for index, name in enumerate(names)}
+    alias_targets: dict[str, int] = {}
+    for name, aliases in skills.items():
+        for alias in aliases:
+            if alias in index_of or alias == name:
+                continue
+            if alias in alias_targets and alias_targets[alias] != index_of[name]:
+                raise TaxonomyError(f"alias {alias!r} maps to more than one skill")
+            alias_targets[alias] = index_of[name]
+    aliases = sorted(alias_targets)
+
+    def string_table(values: list[str]) -> tuple[bytes, bytes]:
+        offsets = [0]
+        encoded = [value.encode("utf-8") for value in values]
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+        return struct.pack(f"<{len(offsets)}I", *offsets), b"".join(encoded)
+
+    skill_offsets, skill_blob = string_table(names)
+    alias_offsets, alias_blob = string_table(aliases)
+    targets = struct.pack(f"<{len(aliases)}I", *(alias_targets[alias] for alias in aliases))
+    # The matcher's tables go first, so they stay 4-byte aligned in the mapping.
+    patterns = {name: index for index, name in enumerate(names)}
+    patterns.update(alias_targets)
+    automaton = build_automaton(patterns)
+    tables = b"".join(_little_endian(table) for table in automaton.tables())
+    body = tables + skill_offsets + alias_offsets + targets + skill_blob + alias_blob
+    checksum = hashlib.blake2b(body, digest_size=8).digest()
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        len(names),
+        len(aliases),
+        checksum,
+        automaton.state_count,
+        automaton.width,
+        len(automaton.extra_chars),
+        len(automaton.output_lengths),
+    )
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header)
+            handle.write(body)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, output)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return checksum.hex()
+
+
+class SkillTaxonomy:
+    """Read-only view of a compiled taxonomy file, memory-mapped and shared between processes.
+
+    Strings are decoded on access and the matcher walks its tables in place
+    (:attr:`automaton`), so a worker only touches the pages it reads and keeps
+    no private copy of the taxonomy.
+    """
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        with open(self.path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                _,
+                skill_count,
+                alias_count,
+                checksum,
+                state_count,
+                width,
+                extra_count,
+                output_count,
+            ) = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error as exc:
+            raise TaxonomyError(f"truncated taxonomy file: {self.path}") from exc
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise TaxonomyError(f"not a compiled skill taxonomy: {self.path}")
+
+        self.skill_count = skill_count
+        self.alias_count = alias_count
+        self.checksum = checksum.hex()
+        sizes = (
+            ASCII_SIZE,
+            extra_count,
+            extra_count,
+            state_count * width,
+            state_count + 1,
+            output_count,
+            output_count,
+        )
+        position = _HEADER.size
+        table_bounds = []
+        for size in sizes:
+            table_bounds.append((position, position + size * 4))
+            position += size * 4
+        if len(self._mmap) < position:
+            raise TaxonomyError(f"corrupt taxonomy file: {self.path}")
+
+        self._skill_offsets = position
+        self._alias_offsets = self._skill_offsets + (skill_count + 1) * 4
+        self._alias_targets = self._alias_offsets + (alias_count + 1) * 4
+        self._skill_blob = self._alias_targets + alias_count * 4
+        self._alias_blob = self._skill_blob + self._offset(self._skill_offsets, skill_count)
+        expected_size = self._alias_blob + self._offset(self._alias_offsets, alias_count)
+        if len(self._mmap) != expected_size:
+            raise TaxonomyError(f"corrupt taxonomy file: {self.path}")
+        self.automaton = SkillAutomaton(*(self._table(start, end) for start, end in table_bounds), width=width)
+
+    def _table(self, start: int, end: int) -> Sequence[int]:
+        if sys.byteorder == "little":
+            return memoryview(self._mmap)[start:end].cast("I")
+        table = array("I", self._mmap[start:end])
+        table.byteswap()
+        return table
+
+    def _offset(self, table: int, index: int) -> int:
+        return _U32.unpack_from(self._mmap, table + index * 4)[0]
+
+    def _string(self, table: int, blob: int, index: int) -> str:
+        start = self._offset(table, index)
+        end = self._offset(table, index + 1)
+        return self._mmap[blob + start : blob + end].decode("utf-8")
+
+    def _search(self, table: int, blob: int, count: int, value: str) -> int | None:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            current = self._string(table, blob, middle)
+            if current < value:
+                low = middle + 1
+            else:
+                high = middle
+        if low < count and self._string(table, blob, low) == value:
+            return low
+        return None
+
+    def __len__(self):
+        return self.skill_count
+
+    def skill(self, index: int) -> str:
+        return self._string(self._skill_offsets, self._skill_blob, index)
+
+    def skills(self) -> Iterator[str]:
+        for index in range(self.skill_count):
+            yield self.skill(index)
+
+    def aliases(self) -> Iterator[tuple[str, str]]:
+        for index in range(self.alias_count):
+            alias = self._string(self._alias_offsets, self._alias_blob, index)
+            target = self._offset(self._alias_targets, index)
+            yield alias, self.skill(target)
+
+    @cached_property
+    def aliased_skills(self) -> frozenset[str]:
+        """Canonical skills that have at least one alias."""
+        return frozenset(self.skill(self._offset(self._alias_targets, index)) for index in range(self.alias_count))
+
+    def canonical(self, name: str) -> str | None:
+        """Canonical skill for a skill name or alias, or ``None`` if unknown."""
+        value = normalize_skill(name)
+        if self._search(self._skill_offsets, self._skill_blob, self.skill_count, value) is not None:
+            return value
+        index = self._search(self._alias_offsets, self._alias_blob, self.alias_count, value)
+        if index is None:
+            return None
+        return self.skill(self._offset(self._alias_targets, index))
+
+    def patterns(self) -> dict[str, str]:
+        """Every skill name and alias mapped to its canonical skill."""
+        patterns = {name: name for name in self.skills()}
+        patterns.update(self.aliases())
+        return patterns
+
+
+class TaxonomyStore:
+    """Holds the current :class:`SkillTaxonomy` and swaps it when the file is replaced.
+
+    The file is stat'ed at most once per ``check_interval`` seconds. A changed file
+    is opened and validated before it replaces the current taxonomy, so a bad or
+    missing file leaves the previous one in service (or none, before the first load).
+    """
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        self.path = str(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._taxonomy: SkillTaxonomy | None = None
+        self._signature = None
+        self._checked_at = None
+        self.error: str | None = None
+
+    def _check(self):
+        try:
+            stat = os.stat(self.path)
+            signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if signature == self._signature:
+                return
+            taxonomy = SkillTaxonomy(self.path)
+        except (OSError, TaxonomyError) as exc:
+            self.error = str(exc)
+            return
+        # Readers holding the previous taxonomy keep using it; its mapping is
+        # released once the last reference is dropped.
+        self._taxonomy = taxonomy
+        self._signature = signature
+        self.error = None
+
+    def current(self) -> SkillTaxonomy | None:
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.check_interval:
+            with self._lock:
+                if self._checked_at is None or now - self._checked_at >= self.check_interval:
+                    self._check()
+                    self._checked_at = now
+        return self._taxonomy
+
+
+def configured_taxonomy_path(app: Flask) -> str | None:
+    path = app.config.get("SKILL_TAXONOMY_PATH")
+    if not path:
+        return None
+    if not os.path.isabs(path):
+        path = os.path.join(Path(app.root_path).parent, path)
+    return path
+
+
+def init_skill_taxonomy(app: Flask):
+    path = configured_taxonomy_path(app)
+    if path is None:
+        app.extensions["skill_taxonomy"] = None
+        return
+    interval = float(app.config.get("SKILL_TAXONOMY_CHECK_INTERVAL", 5.0))
+    store = TaxonomyStore(path, check_interval=interval)
+    if store.current() is None:
+        app.logger.warning("skill taxonomy not loaded, using built-in skills: %s", store.error)
+    app.extensions["skill_taxonomy"] = store
+
+
+def get_skill_taxonomy() -> SkillTaxonomy | None:
+    """The taxonomy configured for the current app, or ``None`` for the built-in skill list."""
+    if not has_app_context():
+        return None
+    store = current_app.extensions.get("skill_taxonomy")
+    return store.current() if store is not None else None
+
+
+def canonical_skill(name: str) -> str:
+    """``name`` mapped through the configured taxonomy's aliases, or just normalized."""
+    skill = normalize_skill(name)
+    taxonomy = get_skill_taxonomy()
+    if taxonomy is None:
+        return skill
+    return taxonomy.canonical(skill) or skill
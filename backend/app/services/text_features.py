@@ -0,0 +1,118 @@
+import re
+from dataclasses import dataclass
+
+from app.services.skill_matcher import get_skill_matcher
+
+EDUCATION_LEVELS = ("phd", "master", "bachelor")
+
+STOP_WORDS = {
+    "a",
+    "an",
+    "and",
+    "are",
+    "as",
+    "at",
+    "be",
+    "by",
+    "for",
+    "from",
+    "in",
+    "is",
+    "it",
+    "of",
+    "on",
+    "or",
+    "that",
+    "the",
+    "to",
+    "with",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9+#.]+")
+YEARS_PATTERN = re.compile(r"(\d{1,2})\s*\+?\s*years?")
+
+
+@dataclass(frozen=True)
+class TextFeatures:
+    """Everything the parser, the scorer and the list filters read from a piece of text."""
+
+    terms: frozenset[str]
+    skills: tuple[str, ...]
+    years_experience: int | None
+    education_levels: frozenset[str]
+
+    @property
+    def education(self) -> str | None:
+        """The highest education level mentioned."""
+        return next((level for level in EDUCATION_LEVELS if level in self.education_levels), None)
+
+    def to_profile(self) -> dict:
+        return {
+            "skills": sorted(self.skills),
+            "years_experience": self.years_experience,
+            "education": self.education,
+        }
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased tokens of ``text`` in order, without stop words and one-character tokens."""
+    tokens = TOKEN_PATTERN.findall((text or "").lower())
+    return [t for t in tokens if t not in STOP_WORDS and len(t) > 1]
+
+
+def extract_years(text: str) -> int | None:
+    """The number in the first "N years" / "N+ years" phrase of ``text``."""
+    match = YEARS_PATTERN.search((text or "").lower())
+    return int(match.group(1)) if match else None
+
+
+def extract_text_features(text: str) -> TextFeatures:
+    """Terms, skills, years and education of ``text``, lowercasing and scanning it once."""
+    extractor = FeatureExtractor()
+    extractor.feed(text or "")
+    return extractor.result()
+
+
+class FeatureExtractor:
+    """Builds :class:`TextFeatures` from text that arrives in pieces, such as PDF pages.
+
+    Feeding pieces gives the same result as :func:`extract_text_features` on the
+    pieces joined with newlines: the end of the previous piece, cut back to a
+    word boundary, is scanned again with the next one so skills and "N years"
+    spanning a page break are still found.
+    """
+
+    OVERLAP = 128
+
+    def __init__(self):
+        self._matcher = get_skill_matcher()
+        self._terms: set[str] = set()
+        self._skills: dict[str, None] = {}
+        self._years: int | None = None
+        self._levels: set[str] = set()
+        self._tail: str | None = None
+
+    def feed(self, text: str):
+        lowered = text.lower()
+        window = lowered if self._tail is None else f"{self._tail}\n{lowered}"
+        self._terms.update(t for t in TOKEN_PATTERN.findall(window) if len(t) > 1 and t not in STOP_WORDS)
+        self._skills.update(dict.fromkeys(self._matcher.find(window)))
+        if self._years is None:
+            years_match = YEARS_PATTERN.search(window)
+            if years_match:
+                self._years = int(years_match.group(1))
+        self._levels.update(level for level in EDUCATION_LEVELS if level in window)
+
+        tail = window[-self.OVERLAP :]
+        if len(window) > self.OVERLAP:
+            boundary = re.search(r"\s", tail)
+            tail = tail[boundary.end() :] if boundary else ""
+        self._tail = tail
+
+    def result(self) -> TextFeatures:
+        return TextFeatures(
+            terms=frozenset(self._terms),
+            skills=tuple(self._skills),
+            years_experience=self._years,
+            education_levels=frozenset(self._levels),
+        )
@@ -0,0 +1,100 @@
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from flask import current_app
+from werkzeug.utils import secure_filename
+
+from app.extensions import db
+from app.models.resume_blob import ResumeBlob
+from app.services.bulk import insert_ignore
+
+COPY_CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    path: Path
+    sha256: str
+    size_bytes: int
+    deduplicated: bool
+
+
+def upload_root() -> Path:
+    configured_upload = current_app.config.get("UPLOAD_DIR", "uploads")
+    root = Path(configured_upload)
+    if not root.is_absolute():
+        root = Path(current_app.root_path).parent / root
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def blob_path(sha256: str, filename: str) -> Path:
+    # Fan out by hash prefix; the extension is kept because the parser dispatches on it.
+    suffix = Path(secure_filename(filename)).suffix.lower()
+    return upload_root() / "sha256" / sha256[:2] / f"{sha256}{suffix}"
+
+
+def find_blob(sha256: str) -> ResumeBlob | None:
+    return db.session.get(ResumeBlob, sha256.lower())
+
+
+def store_upload(stream: BinaryIO, filename: str, max_bytes: int | None = None) -> StoredUpload:
+    """Stream ``stream`` to disk while hashing it, storing each distinct content once.
+
+    The bytes go to a temporary file in the upload directory and are renamed to
+    their content address, or dropped if that content is already stored. With
+    ``max_bytes`` the copy stops as soon as the limit is passed; the size a client
+    or archive claims is never trusted. The blob row is added to the session.
+    """
+    root = upload_root()
+    digest = hashlib.sha256()
+    written = 0
+    fd, temp_name = tempfile.mkstemp(dir=root, prefix=".upload-")
+    try:
+        with os.fdopen(fd, "wb") as output:
+            while chunk := stream.read(COPY_CHUNK_SIZE):
+                written += len(chunk)
+                if max_bytes is not None and written > max_bytes:
+                    raise UploadTooLarge(f"file exceeds {max_bytes} bytes")
+                digest.update(chunk)
+                output.write(chunk)
+
+        sha256 = digest.hexdigest()
+        blob = find_blob(sha256)
+        if blob is not None and Path(blob.storage_path).exists():
+            os.remove(temp_name)
+            return StoredUpload(Path(blob.storage_path), sha256, written, deduplicated=True)
+
+        path = blob_path(sha256, filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+    if blob is not None:
+        # The stored copy had gone missing; this upload restores it.
+        blob.storage_path = str(path)
+    else:
+        # Concurrent uploads of the same content race harmlessly: the renamed files
+        # are identical and only the first blob row is kept.
+        db.session.execute(
+            insert_ignore(ResumeBlob.__table__).values(
+                sha256=sha256,
+                storage_path=str(path),
+                size_bytes=written,
+                original_filename=secure_filename(filename)[:255],
+                created_at=datetime.now(UTC),
+            )
+        )
+    return StoredUpload(path, sha256, written, deduplicated=False)
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.services.scoring import (
+    CandidateFeatureRecord,
+    JDProfile,
+    ScoreResult,
+    _normalize_weights,
+    build_breakdown,
+)
+
+COMPONENTS = ("skills", "experience", "education", "keywords")
+
+
+@dataclass
+class PoolScores:
+    """Component and total scores for a candidate pool, one row per input record."""
+
+    profile: JDProfile
+    weights: dict
+    components: np.ndarray
+    totals: np.ndarray
+    skill_hits: np.ndarray
+    years: list[int | None]
+
+    def __len__(self):
+        return len(self.totals)
+
+    def result(self, index: int) -> ScoreResult:
+        matched = []
+        missing = []
+        for column, skill in enumerate(self.profile.skill_terms):
+            (matched if self.skill_hits[index, column] else missing).append(skill)
+
+        skill_score, experience_score, education_score, keyword_score = (
+            float(value) for value in self.components[index]
+        )
+        breakdown = build_breakdown(
+            self.profile,
+            dict(self.weights),
+            matched_skills=matched,
+            missing_skills=missing,
+            candidate_years=self.years[index],
+            skill_score=skill_score,
+            experience_score=experience_score,
+            education_score=education_score,
+            keyword_score=keyword_score,
+        )
+        return ScoreResult(total_score=round(float(self.totals[index]), 2), breakdown=breakdown)
+
+    def top_k(self, k: int) -> list[int]:
+        """Indexes of the ``k`` best rows by total score; ties keep input order."""
+        if k <= 0 or not len(self):
+            return []
+        k = min(k, len(self))
+        order = np.argsort(-self.totals, kind="stable")
+        return order[:k].tolist()
+
+
+def score_pool(
+    records: list[CandidateFeatureRecord],
+    profile: JDProfile,
+    jd_term_ids: dict[str, int],
+    weights: dict | None = None,
+) -> PoolScores:
+    """Score many feature records against one JD profile with array operations.
+
+    Results are identical to :func:`app.services.scoring.score_features_against_profile`:
+    every component uses the same floating point operations in the same order.
+    """
+    normalized_weights = _normalize_weights(weights)
+    count = len(records)
+    jd_terms = sorted(profile.terms)
+    column_of = {term: column for column, term in enumerate(jd_terms)}
+
+    # Candidate x JD-term incidence matrix, built from the CSR layout of the records.
+    hits = np.zeros((count, len(jd_terms)), dtype=bool)
+    lengths = np.fromiter((len(record.term_ids) for record in records), dtype=np.int64, count=count)
+    known_terms = [term for term in jd_terms if term in jd_term_ids]
+    if known_terms and lengths.sum():
+        indices = np.frombuffer(b"".join(record.term_ids for record in records), dtype=np.uint32)
+        row_starts = np.cumsum(lengths) - lengths
+
+        # Dense term-id -> JD column lookup; ids past the largest JD id map to the -1 sentinel.
+        jd_ids = np.fromiter((jd_term_ids[term] for term in known_terms), dtype=np.int64)
+        max_id = int(jd_ids.max())
+        column_lookup = np.full(max_id + 2, -1, dtype=np.int64)
+        column_lookup[jd_ids] = [column_of[term] for term in known_terms]
+        columns = column_lookup[np.minimum(indices, max_id + 1)]
+        positions = np.flatnonzero(columns >= 0)
+        rows = np.searchsorted(row_starts, positions, side="right") - 1
+        hits[rows, columns[positions]] = True
+
+    # A JD skill is matched through the candidate's terms or its extracted skills;
+    # multi-word skills are never terms, so only the second applies to them.
+    skill_count = len(profile.skill_terms)
+    skill_hits = np.zeros((count, skill_count), dtype=bool)
+    for column, skill in enumerate(profile.skill_terms):
+        if skill in column_of:
+            skill_hits[:, column] = hits[:, column_of[skill]]
+    if skill_count:
+        skill_index = {skill: column for column, skill in enumerate(profile.skill_terms)}
+        for row, record in enumerate(records):
+            for skill in record.skills:
+                column = skill_index.get(skill)
+                if column is not None:
+                    skill_hits[row, column] = True
+        skill_scores = skill_hits.sum(axis=1) / skill_count * 100.0
+    else:
+        skill_scores = np.zeros(count)
+
+    years = [record.years_experience for record in records]
+    if profile.required_years is None:
+        experience_scores = np.full(count, 100.0)
+    else:
+        year_values = np.array([np.nan if value is None else value for value in years], dtype=np.float64)
+        experience_scores = np.minimum(year_values / profile.required_years, 1.0) * 100.0
+        experience_scores = np.nan_to_num(experience_scores, nan=0.0)
+
+    if profile.required_education is None:
+        education_scores = np.full(count, 100.0)
+    else:
+        education_scores = np.fromiter(
+            (100.0 if profile.required_education in record.education_levels else 0.0 for record in records),
+            dtype=np.float64,
+            count=count,
+        )
+
+    overlap = hits.sum(axis=1)
+    union = len(profile.terms) + lengths - overlap
+    with np.errstate(divide="ignore", invalid="ignore"):
+        keyword_scores = np.where(union > 0, overlap / union * 100.0, 0.0)
+
+    components = np.column_stack([skill_scores, experience_scores, education_scores, keyword_scores])
+    components = components.astype(np.float64, copy=False).reshape(count, len(COMPONENTS))
+    weight_vector = np.array([normalized_weights[name] for name in COMPONENTS], dtype=np.float64)
+
+    # Equivalent to components @ weight_vector, but accumulated column by column in the
+    # scalar scorer's order; BLAS may reorder or fuse the additions and change the
+    # last bit, which would flip some scores across a rounding boundary.
+    totals = components[:, 0] * weight_vector[0]
+    for column in range(1, len(COMPONENTS)):
+        totals = totals + components[:, column] * weight_vector[column]
+
+    return PoolScores(
+        profile=profile,
+        weights=normalized_weights,
+        components=components,
+        totals=totals,
+        skill_hits=skill_hits,
+        years=years,
+    )
+
+
+def breakdown_components(breakdown: dict | None) -> list[float] | None:
+    """Component scores stored in a ``score_breakdown_json``, in :data:`COMPONENTS` order."""
+    if not isinstance(breakdown, dict):
+        return None
+    values = []
+    for name in COMPONENTS:
+        component = breakdown.get(name)
+        score = component.get("score") if isinstance(component, dict) else None
+        if not isinstance(score, (int, float)):
+            return None
+        values.append(float(score))
+    return values
+
+
+def reweight(components: np.ndarray, weights: dict | None) -> tuple[np.ndarray, dict]:
+    """Totals of stored component scores under new ``weights``, as one matrix-vector product."""
+    normalized_weights = _normalize_weights(weights)
+    weight_vector = np.array([normalized_weights[name] for name in COMPONENTS], dtype=np.float64)
+    if not len(components):
+        return np.zeros(0), normalized_weights
+    return components @ weight_vector, normalized_weights
@@ -0,0 +1,31 @@
+from collections.abc import Iterable
+
+from app.extensions import db
+from app.models.term import Term
+from app.services.bulk import insert_ignore
+
+LOOKUP_CHUNK_SIZE = 500
+
+
+def lookup_term_ids(terms: Iterable[str]) -> dict[str, int]:
+    """Map already interned ``terms`` to their ids; unknown terms are left out."""
+    unique_terms = sorted(set(terms))
+    found: dict[str, int] = {}
+    for start in range(0, len(unique_terms), LOOKUP_CHUNK_SIZE):
+        chunk = unique_terms[start : start + LOOKUP_CHUNK_SIZE]
+        rows = db.session.query(Term.text, Term.id).filter(Term.text.in_(chunk)).all()
+        found.update(rows)
+    return found
+
+
+def intern_terms(terms: Iterable[str]) -> dict[str, int]:
+    """Map ``terms`` to stable ids, inserting the ones seen for the first time."""
+    unique_terms = set(terms)
+    found = lookup_term_ids(unique_terms)
+    missing = sorted(unique_terms.difference(found))
+    if missing:
+        for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+            chunk = missing[start : start + LOOKUP_CHUNK_SIZE]
+            db.session.execute(insert_ignore(Term.__table__), [{"text": term} for term in chunk])
+        found.update(lookup_term_ids(missing))
+    return found
@@ -0,0 +1,110 @@
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+
+from flask import Flask
+
+from app.extensions import db
+from app.models.processing_job import ProcessingJob
+from app.services.bulk_upload import PROCESS_UPLOAD_BATCH, run_upload_batch_job
+from app.services.candidate_processing import PROCESS_CANDIDATE, run_process_candidate_job
+from app.services.exports import EXPORT_REPORT, run_report_export_job
+from app.services.job_queue import PermanentJobError, claim_next_job, complete_job, fail_job, reap_expired_jobs
+
+DEFAULT_POLL_INTERVAL = 1.0
+REAP_INTERVAL = 60.0
+
+JOB_HANDLERS: dict[str, Callable[[ProcessingJob], None]] = {
+    PROCESS_CANDIDATE: run_process_candidate_job,
+    PROCESS_UPLOAD_BATCH: run_upload_batch_job,
+    EXPORT_REPORT: run_report_export_job,
+}
+
+
+def execute_job(job: ProcessingJob, worker_id: str) -> str:
+    """Run the handler for a claimed job and record the outcome; returns the job's final status."""
+    handler = JOB_HANDLERS.get(job.job_type)
+    job_id = job.id
+    try:
+        if handler is None:
+            raise PermanentJobError(f"unknown job type: {job.job_type}")
+        handler(job)
+    except PermanentJobError as exc:
+        db.session.rollback()
+        return fail_job(job_id, worker_id, str(exc), permanent=True)
+    except Exception as exc:
+        db.session.rollback()
+        return fail_job(job_id, worker_id, f"{type(exc).__name__}: {exc}")
+    return complete_job(job_id, worker_id)
+
+
+def run_pending_jobs(worker_id: str = "inline", limit: int | None = None) -> int:
+    """Run due jobs in the current thread until the queue is empty; returns how many ran."""
+    ran = 0
+    while limit is None or ran < limit:
+        job = claim_next_job(worker_id)
+        if job is None:
+            break
+        execute_job(job, worker_id)
+        ran += 1
+    return ran
+
+
+class Worker:
+    """Drains the job queue with ``concurrency`` threads, each with its own app context and session.
+
+    With ``burst`` the threads exit once no job is due; otherwise they poll every
+    ``poll_interval`` seconds until :meth:`stop` is called.
+    """
+
+    def __init__(self, app: Flask, concurrency: int = 1, poll_interval: float = DEFAULT_POLL_INTERVAL, burst=False):
+        self.app = app
+        self.concurrency = max(int(concurrency), 1)
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.processed = 0
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def stop(self):
+        self._stopping.set()
+
+    def _loop(self, index: int):
+        worker_id = f"{self.name}:{index}"
+        with self.app.app_context():
+            reaped_at = None
+            while not self._stopping.is_set():
+                if index == 0 and (reaped_at is None or time.monotonic() - reaped_at >= REAP_INTERVAL):
+                    reap_expired_jobs()
+                    reaped_at = time.monotonic()
+                job = claim_next_job(worker_id)
+                if job is None:
+                    if self.burst:
+                        break
+                    self._stopping.wait(self.poll_interval)
+                    continue
+                status = execute_job(job, worker_id)
+                self.app.logger.info("job %s (%s) %s", job.id, job.job_type, status)
+                with self._lock:
+                    self.processed += 1
+            db.session.remove()
+
+    def run(self) -> int:
+        threads = [
+            threading.Thread(target=self._loop, args=(index,), name=f"job-worker-{index}", daemon=True)
+            for index in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            self.stop()
+            for thread in threads:
+                thread.join()
+        return self.processed
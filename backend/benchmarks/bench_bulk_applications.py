@@ -0,0 +1,65 @@
+"""Time to link a candidate pool to a new JD, scoring every new application.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_bulk_applications --candidates 10000
+
+Builds a throwaway SQLite database of synthetic candidates with feature records,
+then links the whole pool to a fresh JD with each scoring engine, and once more to
+show that re-linking an already linked pool only checks for existing pairs.
+"""
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.services.batch_scoring import SCORING_ENGINES, link_candidates_to_jd
+from app.services.candidate_features import refresh_candidate_features
+from app.services.jd_profiles import refresh_jd_profile
+from benchmarks.corpus import generate_jd, generate_pool
+from benchmarks.run import _benchmark_app
+
+INSERT_BATCH_SIZE = 2_000
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(17)
+    with tempfile.TemporaryDirectory() as work_dir:
+        app = _benchmark_app(str(Path(work_dir) / "link.db"), work_dir)
+        with app.app_context():
+            db.create_all()
+            remaining = args.candidates
+            while remaining:
+                batch = generate_pool(rng, min(remaining, INSERT_BATCH_SIZE), mix={"small": 0.7, "median": 0.3})
+                for synthetic in batch:
+                    candidate = Candidate(**synthetic.to_dict(), resume_path="")
+                    db.session.add(candidate)
+                    refresh_candidate_features(candidate)
+                db.session.commit()
+                remaining -= len(batch)
+            candidate_ids = [candidate_id for (candidate_id,) in db.session.query(Candidate.id)]
+
+            print(f"{'run':<24} {'created':>8} {'existing':>9} {'seconds':>8}")
+            for engine in SCORING_ENGINES:
+                jd_data = generate_jd(rng)
+                jd = JobDescription(title=jd_data.title, text=jd_data.text)
+                refresh_jd_profile(jd)
+                db.session.add(jd)
+                db.session.commit()
+                for label in (f"link ({engine})", f"re-link ({engine})"):
+                    started = perf_counter()
+                    summary = link_candidates_to_jd(jd, candidate_ids, engine=engine)
+                    seconds = perf_counter() - started
+                    print(f"{label:<24} {summary.created:>8,} {summary.existing:>9,} {seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
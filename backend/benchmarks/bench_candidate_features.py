@@ -0,0 +1,73 @@
+"""Compare scoring from raw resume text with scoring from a stored feature record.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_candidate_features
+"""
+import random
+from array import array
+from timeit import repeat
+
+from app.services.scoring import (
+    CandidateFeatureRecord,
+    analyze_candidate,
+    compile_jd_profile,
+    score_candidate_against_profile,
+    score_features_against_profile,
+)
+
+WORDS = (
+    "python flask django postgresql mysql react javascript typescript aws docker kubernetes git "
+    "designed built led migrated scaled services pipelines customers latency throughput team "
+    "delivered platform reliability observability billing payments search analytics mentoring"
+).split()
+JD_TEXT = "Backend engineer: Python, Flask, PostgreSQL, Docker, AWS. 5 years experience. Bachelor degree."
+
+
+def _resume(rng: random.Random, size_bytes: int) -> str:
+    parts = []
+    length = 0
+    while length < size_bytes:
+        word = rng.choice(WORDS) if rng.random() < 0.7 else f"term{rng.randrange(50_000)}"
+        parts.append(word)
+        length += len(word) + 1
+    return "Jane Doe 6 years Bachelor " + " ".join(parts)
+
+
+def _record(candidate: dict, vocabulary: dict[str, int]) -> CandidateFeatureRecord:
+    analysis = analyze_candidate(candidate)
+    term_ids = sorted(vocabulary.setdefault(term, len(vocabulary) + 1) for term in analysis.terms)
+    return CandidateFeatureRecord(
+        term_ids=array("I", term_ids),
+        skills=analysis.skills,
+        years_experience=analysis.years_experience,
+        education_levels=analysis.education_levels,
+    )
+
+
+def main():
+    rng = random.Random(42)
+    profile = compile_jd_profile(JD_TEXT)
+    vocabulary: dict[str, int] = {}
+
+    print(f"{'resume size':>12} {'text ops/s':>12} {'features ops/s':>15} {'speedup':>8}")
+    for size in (2_000, 20_000, 60_000):
+        candidate = {"extracted_text": _resume(rng, size), "profile_json": {"skills": ["python"]}}
+        record = _record(candidate, vocabulary)
+        jd_term_ids = {term: vocabulary[term] for term in profile.terms if term in vocabulary}
+        assert score_features_against_profile(record, profile, jd_term_ids) == score_candidate_against_profile(
+            candidate, profile
+        )
+
+        number = 50
+        text_best = min(repeat(lambda: score_candidate_against_profile(candidate, profile), number=number, repeat=5))
+        feature_best = min(
+            repeat(lambda: score_features_against_profile(record, profile, jd_term_ids), number=number, repeat=5)
+        )
+        text_ops = number / text_best
+        feature_ops = number / feature_best
+        print(f"{size:>12,} {text_ops:>12,.0f} {feature_ops:>15,.0f} {feature_ops / text_ops:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Latency of full-text candidate search against a substring scan of every resume.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_candidate_search --candidates 100000
+
+Builds a throwaway SQLite database of synthetic candidates, indexes them the way
+processing does, then times ``search_candidates`` for a few query shapes and a
+``LIKE '%...%'`` scan over ``extracted_text`` for comparison.
+"""
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy import text
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.services.candidate_search import index_candidate_document, search_candidates
+from benchmarks.corpus import generate_pool
+from benchmarks.run import _benchmark_app
+
+QUERIES = ("kubernetes", '"machine learning" python', "post* -django", "(react OR typescript) aws", "term123")
+INSERT_BATCH_SIZE = 2_000
+
+
+def _best_ms(function, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        function()
+        best = min(best, perf_counter() - started)
+    return best * 1000
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as work_dir:
+        app = _benchmark_app(str(Path(work_dir) / "search.db"), work_dir)
+        with app.app_context():
+            db.create_all()
+            started = perf_counter()
+            remaining = args.candidates
+            while remaining:
+                batch = generate_pool(rng, min(remaining, INSERT_BATCH_SIZE), mix={"small": 0.7, "median": 0.3})
+                for synthetic in batch:
+                    candidate = Candidate(**synthetic.to_dict(), resume_path="")
+                    db.session.add(candidate)
+                    index_candidate_document(candidate, synthetic.profile_json["skills"])
+                db.session.commit()
+                remaining -= len(batch)
+            print(f"indexed {args.candidates:,} candidates in {perf_counter() - started:.1f} s")
+
+            print(f"{'query':<32} {'matches':>8} {'top 20 ms':>10}")
+            for query in QUERIES:
+                matches = len(search_candidates(query, limit=args.candidates))
+                milliseconds = _best_ms(lambda: search_candidates(query, limit=20))
+                print(f"{query:<32} {matches:>8,} {milliseconds:>10.2f}")
+
+            scan = text("SELECT id FROM candidates WHERE extracted_text LIKE :pattern LIMIT 20")
+            milliseconds = _best_ms(lambda: db.session.execute(scan, {"pattern": "%term123 %"}).all())
+            print(f"{'LIKE scan for term123':<32} {'':>8} {milliseconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
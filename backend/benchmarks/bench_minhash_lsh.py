@@ -0,0 +1,76 @@
+"""Recall and speed of MinHash/LSH keyword similarity against exact Jaccard.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_minhash_lsh
+"""
+import random
+from collections import defaultdict
+from time import perf_counter
+
+from app.services.minhash import MinHasher, band_keys, estimate_jaccard, lsh_threshold
+
+POOL_SIZE = 10_000
+TOPICS = 40
+TOPIC_VOCABULARY = 80
+THRESHOLD = 0.3
+CONFIGS = [(64, 32), (128, 64), (128, 32), (256, 64)]
+
+
+def _documents(rng: random.Random) -> tuple[list[set[str]], set[str]]:
+    topics = [[f"t{topic}_{index}" for index in range(TOPIC_VOCABULARY)] for topic in range(TOPICS)]
+    documents = []
+    for _ in range(POOL_SIZE):
+        topic = rng.choice(topics)
+        terms = set(rng.sample(topic, rng.randrange(20, 60)))
+        terms.update(f"noise{rng.randrange(100_000)}" for _ in range(rng.randrange(0, 20)))
+        documents.append(terms)
+    query = set(rng.sample(topics[0], 40))
+    return documents, query
+
+
+def main():
+    rng = random.Random(3)
+    documents, query = _documents(rng)
+
+    started = perf_counter()
+    exact = {
+        index
+        for index, terms in enumerate(documents)
+        if len(terms & query) / len(terms | query) >= THRESHOLD
+    }
+    exact_seconds = perf_counter() - started
+    print(f"pool size {POOL_SIZE:,}, threshold {THRESHOLD}, true matches {len(exact)}")
+    print(f"exact Jaccard scan: {exact_seconds * 1000:.1f} ms")
+    # "bucket recall": true matches that collide with the query in at least one band;
+    # "recall": true matches that also pass the MinHash estimate >= threshold check.
+    print(f"{'perm':>5} {'bands':>6} {'lsh t':>6} {'bucket recall':>14} {'recall':>7} {'compared':>9} {'query ms':>9}")
+
+    for num_perm, bands in CONFIGS:
+        hasher = MinHasher(num_perm)
+        signatures = [hasher.signature(terms) for terms in documents]
+        buckets = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            for band, key in enumerate(band_keys(signature, bands)):
+                buckets[(band, key)].append(index)
+
+        started = perf_counter()
+        query_signature = hasher.signature(query)
+        candidates = set()
+        for band, key in enumerate(band_keys(query_signature, bands)):
+            candidates.update(buckets.get((band, key), ()))
+        found = {
+            index for index in candidates if estimate_jaccard(query_signature, signatures[index]) >= THRESHOLD
+        }
+        query_ms = (perf_counter() - started) * 1000
+
+        bucket_recall = len(candidates & exact) / len(exact) if exact else 1.0
+        recall = len(found & exact) / len(exact) if exact else 1.0
+        print(
+            f"{num_perm:>5} {bands:>6} {lsh_threshold(num_perm, bands):>6.3f} {bucket_recall:>14.3f} {recall:>7.3f} "
+            f"{len(candidates):>9,} {query_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
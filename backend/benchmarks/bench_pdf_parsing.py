@@ -0,0 +1,60 @@
+"""Compare serial and page-parallel PDF text extraction on multi-page resumes.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_pdf_parsing --workers 4
+
+Each row parses the same generated PDF serially and with ``--workers`` processes
+(the pool is warmed up first, as it is in a long-running worker). The speedup
+depends on the number of cores available.
+"""
+import argparse
+import os
+import random
+import tempfile
+from timeit import repeat
+
+from app.services.resume_parser import PARALLEL_MIN_PAGES, parse_resume_file, parse_resume_with_features
+from benchmarks.corpus import generate_pdf_resume
+
+PAGE_COUNTS = (4, 16, 48, 120)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 8))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-pages", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"{'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+        for pages in PAGE_COUNTS:
+            path = os.path.join(work_dir, f"resume_{pages}.pdf")
+            with open(path, "wb") as handle:
+                handle.write(generate_pdf_resume(rng, pages))
+
+            serial = parse_resume_with_features(path, max_pages=args.max_pages)
+            parallel = parse_resume_with_features(path, max_pages=args.max_pages, workers=args.workers)
+            assert serial == parallel
+
+            serial_best = min(
+                repeat(lambda: parse_resume_file(path, max_pages=args.max_pages), number=1, repeat=args.repeat)
+            )
+            parallel_best = min(
+                repeat(
+                    lambda: parse_resume_file(path, max_pages=args.max_pages, workers=args.workers),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            note = "" if pages >= PARALLEL_MIN_PAGES else "  (below PARALLEL_MIN_PAGES, serial)"
+            print(
+                f"{pages:>6} {serial_best * 1000:>10.1f} {parallel_best * 1000:>12.1f} "
+                f"{serial_best / parallel_best:>7.1f}x{note}"
+            )
+
+
+if __name__ == "__main__":
+    main()
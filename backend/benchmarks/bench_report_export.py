@@ -0,0 +1,130 @@
+"""Peak memory and time of background report exports as the report grows.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_report_export --rows 10000 100000 --formats csv ndjson xlsx
+
+Seeds one department of four JDs with scored applications (a note on every third)
+and runs an ``export_report`` job inline for each format.
+"""
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+
+from app.extensions import db
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.models.review_note import ReviewNote
+from app.services.exports import EXPORT_FORMATS, create_report_export, export_path
+from app.services.worker import run_pending_jobs
+from benchmarks.run import _benchmark_app
+
+INSERT_BATCH_SIZE = 5_000
+JD_COUNT = 4
+BREAKDOWN = {
+    "weights": {"skills": 0.45, "experience": 0.25, "education": 0.1, "keywords": 0.2},
+    "skills": {"score": 66.67, "matched": ["python", "sql"], "missing": ["aws"]},
+    "experience": {"score": 100.0, "required_years": 3, "candidate_years": 5},
+    "education": {"score": 50.0, "required": "bachelor"},
+    "keywords": {"score": 41.2},
+}
+
+
+def _seed(app, rows: int):
+    with app.app_context():
+        db.create_all()
+        jds = [
+            JobDescription(title=f"Role {index}", department="Engineering", text="Python SQL")
+            for index in range(JD_COUNT)
+        ]
+        db.session.add_all(jds)
+        db.session.commit()
+        now = datetime.now(UTC)
+        for start in range(0, rows, INSERT_BATCH_SIZE):
+            ids = range(start + 1, min(start + INSERT_BATCH_SIZE, rows) + 1)
+            db.session.execute(
+                Candidate.__table__.insert(),
+                [
+                    {
+                        "id": index,
+                        "full_name": f"Candidate {index}",
+                        "email": f"candidate{index}@example.com",
+                        "resume_filename": "resume.pdf",
+                        "resume_path": "",
+                        "created_at": now,
+                    }
+                    for index in ids
+                ],
+            )
+            db.session.execute(
+                Application.__table__.insert(),
+                [
+                    {
+                        "id": index,
+                        "candidate_id": index,
+                        "jd_id": jds[index % JD_COUNT].id,
+                        "total_score": (index * 37) % 1000 / 10,
+                        "score_breakdown_json": BREAKDOWN,
+                        "status": "reviewed",
+                        "created_at": now,
+                    }
+                    for index in ids
+                ],
+            )
+            db.session.execute(
+                ReviewNote.__table__.insert(),
+                [
+                    {
+                        "application_id": index,
+                        "author_name": "admin",
+                        "note_text": "Solid SQL, weak on AWS",
+                        "created_at": now,
+                    }
+                    for index in ids
+                    if index % 3 == 0
+                ],
+            )
+        db.session.commit()
+
+
+def _measure(function) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = perf_counter()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return perf_counter() - started, peak / 1024 / 1024
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--formats", nargs="+", choices=list(EXPORT_FORMATS), default=list(EXPORT_FORMATS))
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>8} {'format':>7} {'seconds':>8} {'peak MiB':>9} {'file MiB':>9}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as work_dir:
+            app = _benchmark_app(str(Path(work_dir) / "report.db"), work_dir)
+            _seed(app, rows)
+            for export_format in args.formats:
+                with app.app_context():
+                    export, _ = create_report_export(export_format, {"department": "Engineering"})
+                    db.session.commit()
+                    seconds, peak = _measure(run_pending_jobs)
+                    export = db.session.get(type(export), export.id, populate_existing=True)
+                    assert export.status == "completed" and export.rows_written == rows
+                    size = export_path(export).stat().st_size
+                print(f"{rows:>8,} {export_format:>7} {seconds:>8.2f} {peak:>9.1f} {size / 1024 / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Peak memory and time of the streamed shortlist CSV export as the shortlist grows.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_shortlist_export --rows 2000 20000 200000
+
+"streamed" drains the response chunk by chunk, as a client does; "buffered"
+collects the whole body first, which is what the export used to hold in memory
+(twice over) before sending the first byte.
+"""
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+
+from app.extensions import db
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.models.user import User
+from app.services.auth import generate_access_token
+from benchmarks.run import _benchmark_app
+
+INSERT_BATCH_SIZE = 5_000
+
+
+def _seed(app, rows: int) -> tuple[int, str]:
+    with app.app_context():
+        db.create_all()
+        admin = User(username="admin", role="admin", is_active=True)
+        admin.set_password("admin123")
+        jd = JobDescription(title="Backend", text="Python SQL")
+        db.session.add_all([admin, jd])
+        db.session.commit()
+        now = datetime.now(UTC)
+        for start in range(0, rows, INSERT_BATCH_SIZE):
+            ids = range(start + 1, min(start + INSERT_BATCH_SIZE, rows) + 1)
+            db.session.execute(
+                Candidate.__table__.insert(),
+                [
+                    {
+                        "id": index,
+                        "full_name": f"Candidate {index}",
+                        "email": f"candidate{index}@example.com",
+                        "phone": "555-0100",
+                        "resume_filename": "resume.pdf",
+                        "resume_path": "",
+                        "created_at": now,
+                    }
+                    for index in ids
+                ],
+            )
+            db.session.execute(
+                Application.__table__.insert(),
+                [
+                    {
+                        "candidate_id": index,
+                        "jd_id": jd.id,
+                        "total_score": (index * 37) % 1000 / 10,
+                        "status": "shortlisted",
+                        "reviewed_by": "admin",
+                        "reviewed_at": now,
+                        "created_at": now,
+                    }
+                    for index in ids
+                ],
+            )
+        db.session.commit()
+        return jd.id, generate_access_token(user_id=admin.id, role="admin")
+
+
+def _measure(function) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = perf_counter()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return perf_counter() - started, peak / 1024 / 1024
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[2_000, 20_000, 200_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>8} {'csv MiB':>8} {'streamed s':>11} {'peak MiB':>9} {'buffered s':>11} {'peak MiB':>9}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as work_dir:
+            app = _benchmark_app(str(Path(work_dir) / "export.db"), work_dir)
+            jd_id, token = _seed(app, rows)
+            client = app.test_client()
+            client.environ_base["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+            url = f"/api/jds/{jd_id}/shortlist/export.csv"
+            size = 0
+
+            def streamed():
+                nonlocal size
+                size = sum(len(chunk) for chunk in client.get(url).iter_encoded())
+
+            def buffered():
+                client.get(url).get_data()
+
+            streamed_seconds, streamed_peak = _measure(streamed)
+            buffered_seconds, buffered_peak = _measure(buffered)
+            print(
+                f"{rows:>8,} {size / 1024 / 1024:>8.1f} {streamed_seconds:>11.2f} {streamed_peak:>9.1f} "
+                f"{buffered_seconds:>11.2f} {buffered_peak:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""CPU per candidate for processing a resume before and after the shared text extractor.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_text_features
+
+Two earlier pipelines are kept here as baselines. "substring" is the original
+one: the parser's profile extraction with a substring test per known skill,
+then a candidate analysis that joins name, file name, resume text and profile
+into one string and tokenizes and searches it again. "matcher" is the same
+pipeline after skills moved to the Aho-Corasick matcher, which also matches
+skills in the joined text. "shared" extracts the text features once and hands
+them to both. The substring test also finds skills inside other words ("sql" in
+"postgresql"), so only its years and education are checked to agree.
+"""
+import random
+import re
+from timeit import repeat
+
+from app.services.scoring import analyze_candidate
+from app.services.skill_matcher import DEFAULT_SKILLS, get_skill_matcher
+from app.services.taxonomy import canonical_skill
+from app.services.text_features import EDUCATION_LEVELS, STOP_WORDS, YEARS_PATTERN, extract_text_features
+from benchmarks.corpus import RESUME_SIZES, generate_resume
+
+
+def _previous_profile(text: str, find_skills) -> dict:
+    # extract_profile_from_text before the shared extractor.
+    lowered = text.lower()
+    years_match = YEARS_PATTERN.search(lowered)
+    return {
+        "skills": sorted(set(find_skills(lowered))),
+        "years_experience": int(years_match.group(1)) if years_match else None,
+        "education": next((level for level in EDUCATION_LEVELS if level in lowered), None),
+    }
+
+
+def _substring_skills(lowered: str) -> list[str]:
+    return [skill for skill in DEFAULT_SKILLS if skill in lowered]
+
+
+def _previous_tokenize(text: str) -> list[str]:
+    tokens = re.findall(r"[a-zA-Z0-9+#.]+", (text or "").lower())
+    return [t for t in tokens if t not in STOP_WORDS and len(t) > 1]
+
+
+def _previous_candidate_text(candidate: dict) -> str:
+    parts = [
+        candidate.get("full_name") or "",
+        candidate.get("resume_filename") or "",
+        candidate.get("extracted_text") or "",
+    ]
+    profile_json = candidate["profile_json"]
+    parts.extend(profile_json.get("skills", []))
+    if profile_json.get("years_experience") is not None:
+        parts.append(f"{profile_json['years_experience']} years")
+    if profile_json.get("education") is not None:
+        parts.append(str(profile_json["education"]))
+    return " ".join(str(part) for part in parts)
+
+
+def _previous_analysis(candidate: dict, match_text: bool) -> tuple:
+    # analyze_candidate built on _build_candidate_text and _tokenize; the original
+    # only took skills from the profile, the matcher version also from the text.
+    candidate_text = _previous_candidate_text(candidate)
+    profile_json = candidate["profile_json"]
+    years = profile_json.get("years_experience")
+    if years is None:
+        match = re.search(r"(\d{1,2})\s*\+?\s*years?", candidate_text.lower())
+        years = int(match.group(1)) if match else None
+    candidate_lower = candidate_text.lower()
+    skills = {canonical_skill(skill) for skill in profile_json.get("skills", []) if str(skill).strip()}
+    if match_text:
+        skills.update(get_skill_matcher().find(candidate_lower))
+    return (
+        frozenset(_previous_tokenize(candidate_text)),
+        frozenset(skills),
+        years,
+        frozenset(level for level in EDUCATION_LEVELS if level in candidate_lower),
+    )
+
+
+def substring(candidate: dict):
+    profile = _previous_profile(candidate["extracted_text"], _substring_skills)
+    return profile, _previous_analysis({**candidate, "profile_json": profile}, match_text=False)
+
+
+def matcher(candidate: dict):
+    profile = _previous_profile(candidate["extracted_text"], get_skill_matcher().find)
+    return profile, _previous_analysis({**candidate, "profile_json": profile}, match_text=True)
+
+
+def shared(candidate: dict):
+    features = extract_text_features(candidate["extracted_text"])
+    profile = features.to_profile()
+    return profile, analyze_candidate({**candidate, "profile_json": profile}, features)
+
+
+def _best(pipeline, candidate: dict, number: int) -> float:
+    return min(repeat(lambda: pipeline(candidate), number=number, repeat=5)) / number
+
+
+def main():
+    rng = random.Random(5)
+    print(
+        f"{'resume':>8} {'substring us':>13} {'matcher us':>11} {'shared us':>10} "
+        f"{'shared/substring':>17} {'shared/matcher':>15}"
+    )
+    for size in RESUME_SIZES:
+        candidate = generate_resume(rng, size).to_dict()
+        after_profile, after = shared(candidate)
+        matcher_profile, (_, matcher_skills, matcher_years, _) = matcher(candidate)
+        assert matcher_profile == after_profile
+        assert (matcher_skills, matcher_years) == (after.skills, after.years_experience)
+        substring_profile, (_, _, substring_years, substring_education) = substring(candidate)
+        assert substring_profile["years_experience"] == after_profile["years_experience"]
+        assert substring_profile["education"] == after_profile["education"]
+        assert (substring_years, substring_education) == (after.years_experience, after.education_levels)
+
+        number = 200 if size != "large" else 5
+        substring_best = _best(substring, candidate, number)
+        matcher_best = _best(matcher, candidate, number)
+        shared_best = _best(shared, candidate, number)
+        print(
+            f"{size:>8} {substring_best * 1e6:>13,.0f} {matcher_best * 1e6:>11,.0f} {shared_best * 1e6:>10,.0f} "
+            f"{shared_best / substring_best:>16.1f}x {shared_best / matcher_best:>14.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Seeded synthetic resumes and job descriptions for the benchmark suite.
+
+The same seed always produces the same corpus, so timings from different runs
+measure the code, not the input.
+"""
+import random
+from dataclasses import dataclass
+
+# Approximate sizes of a short, a typical and an unusually long resume (bytes of text).
+RESUME_SIZES = {
+    "small": 1_500,
+    "median": 6_000,
+    "large": 200_000,
+}
+
+SKILLS = (
+    "python",
+    "flask",
+    "django",
+    "postgresql",
+    "mysql",
+    "sql",
+    "react",
+    "javascript",
+    "typescript",
+    "aws",
+    "docker",
+    "kubernetes",
+    "git",
+    "machine learning",
+    "ci/cd",
+    "node.js",
+)
+EDUCATION = ("bachelor", "master", "phd")
+FILLER = (
+    "designed built led migrated scaled owned shipped services pipelines customers latency "
+    "throughput team delivered platform reliability observability billing payments search "
+    "analytics mentoring reviewed improved reduced incidents on-call roadmap stakeholders "
+    "architecture data warehouse dashboards automation testing deployments release"
+).split()
+FIRST_NAMES = ("Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie")
+LAST_NAMES = ("Nguyen", "Smith", "Garcia", "Kim", "Okafor", "Rossi", "Novak", "Silva")
+
+
+@dataclass(frozen=True)
+class SyntheticCandidate:
+    full_name: str
+    resume_filename: str
+    extracted_text: str
+    profile_json: dict
+
+    def to_dict(self) -> dict:
+        return {
+            "full_name": self.full_name,
+            "resume_filename": self.resume_filename,
+            "extracted_text": self.extracted_text,
+            "profile_json": self.profile_json,
+        }
+
+
+@dataclass(frozen=True)
+class SyntheticJD:
+    title: str
+    text: str
+
+    def to_dict(self) -> dict:
+        return {"title": self.title, "text": self.text}
+
+
+def generate_resume(rng: random.Random, size: str | int) -> SyntheticCandidate:
+    target = RESUME_SIZES[size] if isinstance(size, str) else size
+    skills = rng.sample(SKILLS, rng.randint(2, 8))
+    years = rng.randint(0, 15)
+    education = rng.choice(EDUCATION)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    header = f"{name}\n{years} years of experience. {education.title()} degree.\nSkills: {', '.join(skills)}\n"
+    parts = [header]
+    length = len(header)
+    while length < target:
+        if rng.random() < 0.08:
+            word = rng.choice(skills)
+        elif rng.random() < 0.75:
+            word = rng.choice(FILLER)
+        else:
+            # Long-tail vocabulary, so large resumes also have many distinct terms.
+            word = f"term{rng.randrange(50_000)}"
+        parts.append(word)
+        length += len(word) + 1
+
+    return SyntheticCandidate(
+        full_name=name,
+        resume_filename=f"{name.lower().replace(' ', '_')}.pdf",
+        extracted_text=" ".join(parts),
+        profile_json={"skills": sorted(skills), "years_experience": years, "education": education},
+    )
+
+
+def generate_jd(rng: random.Random) -> SyntheticJD:
+    skills = rng.sample(SKILLS, rng.randint(3, 6))
+    years = rng.randint(1, 8)
+    education = rng.choice(EDUCATION)
+    filler = " ".join(rng.choice(FILLER) for _ in range(60))
+    text = (
+        f"We are hiring an engineer with {years}+ years of experience in {', '.join(skills)}. "
+        f"{education.title()} degree preferred. {filler}"
+    )
+    return SyntheticJD(title=f"Engineer {rng.randrange(1000)}", text=text)
+
+
+def generate_pool(rng: random.Random, count: int, mix: dict[str, float] | None = None) -> list[SyntheticCandidate]:
+    """``count`` resumes drawn from the size classes with weights ``mix`` (default mostly median)."""
+    mix = mix or {"small": 0.3, "median": 0.65, "large": 0.05}
+    sizes = rng.choices(list(mix), weights=list(mix.values()), k=count)
+    return [generate_resume(rng, size) for size in sizes]
+
+
+def generate_pdf_resume(rng: random.Random, pages: int, chars_per_page: int = 3_000) -> bytes:
+    """A text PDF of ``pages`` pages; the first page starts with the usual resume header."""
+    text = generate_resume(rng, pages * chars_per_page).extracted_text
+    return build_pdf([text[start : start + chars_per_page] for start in range(0, pages * chars_per_page, chars_per_page)])
+
+
+def build_pdf(pages: list[str], line_length: int = 90) -> bytes:
+    """A minimal PDF with one page per string, set in Helvetica, with a valid xref table."""
+    page_ids = [4 + 2 * index for index in range(len(pages))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(pages)),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, text in zip(page_ids, pages):
+        lines = []
+        for paragraph in text.split("\n"):
+            words = paragraph.split(" ")
+            line = ""
+            for word in words:
+                if line and len(line) + len(word) + 1 > line_length:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = f"{line} {word}" if line else word
+            lines.append(line)
+        commands = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            commands.append(f"({escaped}) Tj T*")
+        commands.append("ET")
+        stream = "\n".join(commands).encode("latin-1", errors="replace")
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (page_id + 1)
+        )
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output += b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id])
+    xref_offset = len(output)
+    size = max(objects) + 1
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for object_id in range(1, size):
+        output += b"%010d 00000 n \n" % offsets[object_id]
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset)
+    return bytes(output)
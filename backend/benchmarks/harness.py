@@ -0,0 +1,108 @@
+"""Timing, memory measurement and baseline comparison for the benchmark suite."""
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    group: str
+    ops_per_sec: float
+    mean_ms: float
+    peak_memory_kb: float
+    iterations: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def measure(name: str, group: str, func: Callable[[], object], min_time: float = 0.5, repeat: int = 3):
+    """Time ``func`` and record the peak memory one call allocates.
+
+    Each of ``repeat`` rounds runs ``func`` until ``min_time`` seconds have passed;
+    the fastest round is reported, which is the least disturbed by other load.
+    """
+    func()  # warm caches and lazily built state before measuring
+
+    best = None
+    iterations = 0
+    for _ in range(repeat):
+        count = 0
+        started = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time or count == 0:
+            func()
+            count += 1
+            elapsed = time.perf_counter() - started
+        iterations += count
+        per_call = elapsed / count
+        best = per_call if best is None else min(best, per_call)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        group=group,
+        ops_per_sec=round(1.0 / best, 2),
+        mean_ms=round(best * 1000.0, 4),
+        peak_memory_kb=round(peak / 1024.0, 1),
+        iterations=iterations,
+    )
+
+
+def build_report(results: list[BenchmarkResult], seed: int) -> dict:
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "seed": seed,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def save_report(report: dict, path: str):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+        handle.write("\n")
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def find_regressions(report: dict, baseline: dict, threshold: float) -> list[dict]:
+    """Benchmarks whose throughput dropped by more than ``threshold`` (0.2 = 20%) from ``baseline``.
+
+    Benchmarks missing from either report are ignored.
+    """
+    previous = {result["name"]: result for result in baseline.get("results", [])}
+    regressions = []
+    for result in report.get("results", []):
+        before = previous.get(result["name"])
+        if before is None or not before["ops_per_sec"]:
+            continue
+        change = result["ops_per_sec"] / before["ops_per_sec"] - 1.0
+        if change < -threshold:
+            regressions.append(
+                {
+                    "name": result["name"],
+                    "baseline_ops_per_sec": before["ops_per_sec"],
+                    "ops_per_sec": result["ops_per_sec"],
+                    "change": round(change, 4),
+                }
+            )
+    return regressions
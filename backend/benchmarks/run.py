@@ -0,0 +1,230 @@
+"""Run the scoring and filtering benchmark suite.
+
+Run from ``backend/``::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 0.25
+
+Function benchmarks run against each resume size class; endpoint benchmarks run
+through the Flask test client against a seeded temporary SQLite database. With
+``--baseline``, the run exits with status 1 if any benchmark's throughput dropped
+by more than ``--threshold`` (a fraction) compared to the baseline report.
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+from array import array
+
+from app import create_app
+from app.extensions import db
+from app.models.application import Application
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.models.user import User
+from app.routes.applications import _candidate_matches_skills, _extract_candidate_years
+from app.services.auth import generate_access_token
+from app.services.batch_scoring import score_applications_for_jd
+from app.services.candidate_features import refresh_candidate_features
+from app.services.jd_profiles import refresh_jd_profile
+from app.services.scoring import (
+    CandidateFeatureRecord,
+    analyze_candidate,
+    compile_jd_profile,
+    score_candidate_against_jd,
+    score_features_against_profile,
+)
+from app.services.text_features import extract_text_features, tokenize
+from app.services.vectorized_scoring import score_pool
+from benchmarks.corpus import RESUME_SIZES, generate_jd, generate_pool, generate_resume
+from benchmarks.harness import build_report, find_regressions, load_report, measure, save_report
+
+DEFAULT_SEED = 1234
+DEFAULT_THRESHOLD = 0.25
+REQUIRED_SKILLS = {"python", "docker"}
+
+
+def _feature_record(candidate: dict, vocabulary: dict[str, int]) -> CandidateFeatureRecord:
+    analysis = analyze_candidate(candidate)
+    term_ids = sorted(vocabulary.setdefault(term, len(vocabulary) + 1) for term in analysis.terms)
+    return CandidateFeatureRecord(
+        term_ids=array("I", term_ids),
+        skills=analysis.skills,
+        years_experience=analysis.years_experience,
+        education_levels=analysis.education_levels,
+    )
+
+
+def function_cases(rng: random.Random, pool_size: int):
+    jd = generate_jd(rng).to_dict()
+    profile = compile_jd_profile(jd["text"])
+    vocabulary: dict[str, int] = {}
+
+    for size in RESUME_SIZES:
+        candidate = generate_resume(rng, size).to_dict()
+        model = Candidate(**candidate, resume_path="")
+        # Free-text path: no profile, so years and skills come from the resume text.
+        text_only = Candidate(**{**candidate, "profile_json": None}, resume_path="")
+        record = _feature_record(candidate, vocabulary)
+        jd_term_ids = {term: vocabulary[term] for term in profile.terms if term in vocabulary}
+
+        yield f"tokenize[{size}]", lambda c=candidate: tokenize(c["extracted_text"])
+        yield f"extract_text_features[{size}]", lambda c=candidate: extract_text_features(c["extracted_text"])
+        yield f"analyze_candidate[{size}]", lambda c=candidate: analyze_candidate(c)
+        yield f"score_candidate_against_jd[{size}]", lambda c=candidate: score_candidate_against_jd(c, jd)
+        yield (
+            f"score_features_against_profile[{size}]",
+            lambda r=record, ids=jd_term_ids: score_features_against_profile(r, profile, ids),
+        )
+        yield f"_candidate_matches_skills[{size}]", lambda m=text_only: _candidate_matches_skills(m, REQUIRED_SKILLS)
+        yield f"_extract_candidate_years[{size}]", lambda m=text_only: _extract_candidate_years(m)
+        yield f"_extract_candidate_years[{size},profile]", lambda m=model: _extract_candidate_years(m)
+
+    records = [_feature_record(candidate.to_dict(), vocabulary) for candidate in generate_pool(rng, pool_size)]
+    jd_term_ids = {term: vocabulary[term] for term in profile.terms if term in vocabulary}
+    yield f"score_pool[{pool_size}]", lambda: score_pool(records, profile, jd_term_ids)
+
+
+def _benchmark_app(database_path: str, work_dir: str):
+    class BenchmarkConfig:
+        TESTING = True
+        SECRET_KEY = "benchmark-secret"
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{database_path}"
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        UPLOAD_DIR = os.path.join(work_dir, "uploads")
+        EXPORT_DIR = os.path.join(work_dir, "exports")
+        AUDIT_LOG_PATH = os.path.join(work_dir, "audit.log")
+        TOKEN_MAX_AGE_SECONDS = 28800
+        SWAGGER = {"title": "Resume ATS Scanner API (Benchmark)", "uiversion": 3, "openapi": "3.0.2"}
+
+    return create_app(BenchmarkConfig)
+
+
+def endpoint_cases(rng: random.Random, app, pool_size: int):
+    with app.app_context():
+        db.create_all()
+        admin = User(username="admin", role="admin", is_active=True)
+        admin.set_password("admin123")
+        jd_data = generate_jd(rng)
+        jd = JobDescription(title=jd_data.title, text=jd_data.text)
+        refresh_jd_profile(jd)
+        db.session.add_all([admin, jd])
+        db.session.flush()
+
+        for synthetic in generate_pool(rng, pool_size):
+            candidate = Candidate(**synthetic.to_dict(), resume_path="")
+            db.session.add(candidate)
+            refresh_candidate_features(candidate)
+            db.session.add(Application(candidate=candidate, jd_id=jd.id))
+        db.session.commit()
+        score_applications_for_jd(jd)
+
+        jd_id = jd.id
+        application_ids = [row[0] for row in db.session.query(Application.id).filter_by(jd_id=jd_id).limit(300)]
+        application_id = application_ids[0]
+        token = generate_access_token(user_id=admin.id, role="admin")
+
+    client = app.test_client()
+    client.environ_base["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+
+    def call(method: str, path: str, **kwargs):
+        def request():
+            response = client.open(path, method=method, **kwargs)
+            assert response.status_code == 200, (path, response.status_code, response.get_data(as_text=True))
+            # Drain streamed bodies chunk by chunk, as a client would.
+            for _ in response.iter_encoded():
+                pass
+
+        return request
+
+    yield "GET /jds/<id>/applications", call("GET", f"/api/jds/{jd_id}/applications")
+    yield (
+        "GET /jds/<id>/applications?skills&min_experience",
+        call("GET", f"/api/jds/{jd_id}/applications?skills=python,docker&min_experience=3"),
+    )
+    # The last page of a keyset-paginated listing should cost about as much as the first.
+    deep_limit = max(1, min(pool_size - 25, 1000))
+    deep_cursor = client.get(f"/api/jds/{jd_id}/applications?limit={deep_limit}").headers.get("X-Next-Cursor", "")
+    yield "GET /jds/<id>/applications?limit=25", call("GET", f"/api/jds/{jd_id}/applications?limit=25")
+    yield (
+        "GET /jds/<id>/applications?limit=25&cursor (deep)",
+        call("GET", f"/api/jds/{jd_id}/applications?limit=25&cursor={deep_cursor}"),
+    )
+    yield (
+        "GET /jds/<id>/shortlist/export.csv?status=new",
+        call("GET", f"/api/jds/{jd_id}/shortlist/export.csv?status=new"),
+    )
+    yield "POST /applications/score", call("POST", "/api/applications/score", json={"application_id": application_id})
+    yield "GET /jds/<id>/matches", call("GET", f"/api/jds/{jd_id}/matches?k=20")
+    yield "POST /jds/<id>/score-all", call("POST", f"/api/jds/{jd_id}/score-all", json={})
+    # Triage: the same status change as one bulk request and as one request per application.
+    triage = {"status": "reviewed", "reviewed_by": "bench"}
+    yield (
+        f"PATCH /applications/status ({len(application_ids)} ids)",
+        call("PATCH", "/api/applications/status", json={**triage, "applications": application_ids}),
+    )
+    single_updates = [call("PATCH", f"/api/applications/{item}/status", json=triage) for item in application_ids]
+    yield (
+        f"PATCH /applications/<id>/status x {len(application_ids)}",
+        lambda: [update() for update in single_updates],
+    )
+
+
+def _print_table(results):
+    print(f"{'benchmark':<52} {'ops/s':>12} {'mean ms':>11} {'peak KiB':>10}")
+    for result in results:
+        print(f"{result.name:<52} {result.ops_per_sec:>12.1f} {result.mean_ms:>11.3f} {result.peak_memory_kb:>10.1f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--only", choices=("functions", "endpoints"), help="run a single group")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds per timing round")
+    parser.add_argument("--pool-size", type=int, default=200, help="candidates in pool and endpoint benchmarks")
+    parser.add_argument("--output", help="write the JSON report to this path")
+    parser.add_argument("--baseline", help="compare against this JSON report")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed ops/s drop, 0.2 = 20%%")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    results = []
+    work_dir = tempfile.mkdtemp(prefix="resume_ats_bench_")
+    try:
+        groups = []
+        if args.only in (None, "functions"):
+            groups.append(("functions", function_cases(rng, args.pool_size)))
+        if args.only in (None, "endpoints"):
+            app = _benchmark_app(os.path.join(work_dir, "bench.db"), work_dir)
+            groups.append(("endpoints", endpoint_cases(rng, app, args.pool_size)))
+
+        for group, cases in groups:
+            for name, func in cases:
+                if args.filter in name:
+                    results.append(measure(name, group, func, min_time=args.min_time))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    _print_table(results)
+    report = build_report(results, seed=args.seed)
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline:
+        regressions = find_regressions(report, load_report(args.baseline), args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['name']}: {regression['baseline_ops_per_sec']:.1f} -> "
+                f"{regression['ops_per_sec']:.1f} ops/s ({regression['change']:+.1%})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""add candidate full-text search
+
+Revision ID: 7c2d5a9f3e61
+Revises: 4b8f1e6c2a95
+Create Date: 2026-10-18 17:12:09.530118
+
+"""
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2d5a9f3e61'
+down_revision = '4b8f1e6c2a95'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+LEXEME_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _lexemes(value):
+    # Same normalization as app.services.candidate_search.lexemes at the time of this revision.
+    decomposed = unicodedata.normalize("NFKD", (value or "").lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(LEXEME_PATTERN.findall(stripped))
+
+
+def upgrade():
+    bind = op.get_bind()
+    postgres = bind.dialect.name == 'postgresql'
+    if postgres:
+        op.execute(
+            "CREATE TABLE candidate_search ("
+            "candidate_id INTEGER PRIMARY KEY REFERENCES candidates (id) ON DELETE CASCADE, "
+            "document TSVECTOR NOT NULL)"
+        )
+        op.execute("CREATE INDEX ix_candidate_search_document ON candidate_search USING GIN (document)")
+        insert = sa.text(
+            "INSERT INTO candidate_search (candidate_id, document) VALUES (:candidate_id, "
+            "setweight(to_tsvector('simple', :full_name), 'A') || setweight(to_tsvector('simple', :email), 'A')"
+            " || setweight(to_tsvector('simple', :skills), 'B') || setweight(to_tsvector('simple', :body), 'C'))"
+        )
+    else:
+        op.execute(
+            "CREATE VIRTUAL TABLE candidate_search "
+            "USING fts5(full_name, email, skills, body, tokenize='unicode61 remove_diacritics 2')"
+        )
+        insert = sa.text(
+            "INSERT INTO candidate_search (rowid, full_name, email, skills, body) "
+            "VALUES (:candidate_id, :full_name, :email, :skills, :body)"
+        )
+
+    # Index the candidates that already exist.
+    candidates = sa.table(
+        'candidates',
+        sa.column('id', sa.Integer()),
+        sa.column('full_name', sa.String()),
+        sa.column('email', sa.String()),
+        sa.column('extracted_text', sa.Text()),
+    )
+    candidate_features = sa.table(
+        'candidate_features',
+        sa.column('candidate_id', sa.Integer()),
+        sa.column('skills', sa.JSON()),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(
+                candidates.c.id,
+                candidates.c.full_name,
+                candidates.c.email,
+                candidates.c.extracted_text,
+                candidate_features.c.skills,
+            )
+            .select_from(
+                candidates.outerjoin(candidate_features, candidate_features.c.candidate_id == candidates.c.id)
+            )
+            .where(candidates.c.id > last_id)
+            .order_by(candidates.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            insert,
+            [
+                {
+                    'candidate_id': candidate_id,
+                    'full_name': _lexemes(full_name),
+                    'email': _lexemes(email),
+                    'skills': _lexemes(" ".join(sorted(str(skill) for skill in skills or []))),
+                    'body': _lexemes(extracted_text),
+                }
+                for candidate_id, full_name, email, extracted_text, skills in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def downgrade():
+    op.execute("DROP TABLE candidate_search")
@@ -16,6 +16,7 @@ def app():
     os.close(fd)
     upload_dir = tempfile.mkdtemp(prefix="resume_ats_uploads_")
     audit_dir = tempfile.mkdtemp(prefix="resume_ats_audit_")
+    export_dir = tempfile.mkdtemp(prefix="resume_ats_exports_")
     audit_log_path = os.path.join(audit_dir, "audit.log")
 
     class TestConfig:
@@ -24,6 +25,7 @@ def app():
         SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
         SQLALCHEMY_TRACK_MODIFICATIONS = False
         UPLOAD_DIR = upload_dir
+        EXPORT_DIR = export_dir
         AUDIT_LOG_PATH = audit_log_path
         TOKEN_MAX_AGE_SECONDS = 28800
         SWAGGER = {
@@ -45,6 +47,7 @@ def app():
     os.remove(db_path)
     shutil.rmtree(upload_dir)
     shutil.rmtree(audit_dir)
+    shutil.rmtree(export_dir)
 
 
 @pytest.fixture
@@ -0,0 +1,197 @@
+import io
+
+import pytest
+
+from app.extensions import db
+from app.models.candidate_features import CandidateFeatures
+from app.services import application_status
+from app.services.worker import run_pending_jobs
+
+
+def _seed(client, scores, skills=None):
+    jd = client.post("/api/jds", json={"title": "Backend Engineer", "text": "Python Flask SQL"}).get_json()
+    applications = []
+    for index, score in enumerate(scores):
+        candidate_skills = (skills or {}).get(index, ["python"])
+        candidate = client.post(
+            "/api/candidates/upload",
+            data={
+                "resume": (io.BytesIO(f"resume {index}".encode()), "resume.txt"),
+                "extracted_text": " ".join(candidate_skills),
+                "profile_json": f'{{"skills": {candidate_skills!r}, "years_experience": 3}}'.replace("'", '"'),
+            },
+            content_type="multipart/form-data",
+        ).get_json()["candidate"]
+        applications.append(
+            client.post(
+                "/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"], "total_score": score}
+            ).get_json()
+        )
+    return jd, applications
+
+
+def _statuses(client, jd):
+    return {item["id"]: item["status"] for item in client.get(f"/api/jds/{jd['id']}/applications").get_json()}
+
+
+def test_bulk_status_by_ids_in_one_update(app, client, monkeypatch):
+    jd, applications = _seed(client, [10, 20, 30, 40])
+    calls = []
+    original = application_status.set_status_where
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(application_status, "set_status_where", counting)
+    ids = [applications[0]["id"], applications[2]["id"], applications[3]["id"]]
+    response = client.patch(
+        "/api/applications/status", json={"applications": ids, "status": "rejected", "reviewed_by": "triage"}
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert len(calls) == 1
+    assert (body["updated"], body["conflict"], body["not_found"]) == (3, 0, 0)
+    assert body["results"] == [{"id": application_id, "result": "updated", "version": 2} for application_id in ids]
+    statuses = _statuses(client, jd)
+    assert [statuses[application["id"]] for application in applications] == ["rejected", "new", "rejected", "rejected"]
+    detail = client.get(f"/api/jds/{jd['id']}/applications?status=rejected").get_json()[0]
+    assert detail["reviewed_by"] == "triage" and detail["reviewed_at"] is not None
+
+
+def test_bulk_status_reports_version_conflicts_and_unknown_ids(client):
+    jd, applications = _seed(client, [10, 20, 30])
+    first, second, third = (application["id"] for application in applications)
+    # Someone else reviews the second application after the client loaded the list.
+    client.patch(f"/api/applications/{second}/status", json={"status": "shortlisted", "reviewed_by": "other"})
+
+    response = client.patch(
+        "/api/applications/status",
+        json={
+            "applications": [{"id": first, "version": 1}, {"id": second, "version": 1}, third, 99999],
+            "status": "rejected",
+        },
+    )
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert (body["updated"], body["conflict"], body["not_found"]) == (2, 1, 1)
+    assert body["results"] == [
+        {"id": first, "result": "updated", "version": 2},
+        {"id": second, "result": "conflict", "version": 2},
+        {"id": third, "result": "updated", "version": 2},
+        {"id": 99999, "result": "not_found", "version": None},
+    ]
+    assert _statuses(client, jd)[second] == "shortlisted"
+
+
+def test_bulk_status_by_jd_filter(client):
+    jd, applications = _seed(client, [10, 35, 80, None])
+    other_jd, other_applications = _seed(client, [5])
+    client.patch(f"/api/applications/{applications[0]['id']}/status", json={"status": "shortlisted"})
+
+    response = client.patch(
+        "/api/applications/status",
+        json={"jd_id": jd["id"], "filter": {"status": "new", "max_score": 50}, "status": "rejected"},
+    )
+
+    assert response.status_code == 200
+    assert [result["id"] for result in response.get_json()["results"]] == [applications[1]["id"]]
+    assert response.get_json()["results"][0]["version"] == 2
+    statuses = _statuses(client, jd)
+    assert [statuses[application["id"]] for application in applications] == [
+        "shortlisted",
+        "rejected",
+        "new",
+        "new",
+    ]
+    assert _statuses(client, other_jd)[other_applications[0]["id"]] == "new"
+
+    response = client.patch("/api/applications/status", json={"jd_id": jd["id"], "status": "reviewed"})
+    assert response.get_json()["updated"] == 4
+    assert set(_statuses(client, jd).values()) == {"reviewed"}
+
+
+def test_bulk_status_by_jd_filter_with_candidate_filters(app, client):
+    jd, applications = _seed(client, [10, 20, 30], skills={0: ["python", "flask"], 1: ["java"], 2: ["flask"]})
+    with app.app_context():
+        run_pending_jobs()
+        # The third candidate's feature record is missing: it is checked in Python.
+        db.session.query(CandidateFeatures).filter_by(candidate_id=applications[2]["candidate_id"]).delete()
+        db.session.commit()
+
+    response = client.patch(
+        "/api/applications/status",
+        json={"jd_id": jd["id"], "filter": {"skills": ["flask"]}, "status": "shortlisted"},
+    )
+
+    assert response.status_code == 200
+    assert [result["id"] for result in response.get_json()["results"]] == [
+        applications[0]["id"],
+        applications[2]["id"],
+    ]
+    assert _statuses(client, jd)[applications[1]["id"]] == "new"
+
+
+def test_single_status_update_checks_version(client):
+    _, [application] = _seed(client, [50])
+
+    response = client.patch(f"/api/applications/{application['id']}/status", json={"status": "reviewed", "version": 1})
+    assert response.status_code == 200
+    assert response.get_json()["version"] == 2
+
+    stale = client.patch(f"/api/applications/{application['id']}/status", json={"status": "rejected", "version": 1})
+    assert stale.status_code == 409
+    assert stale.get_json()["version"] == 2
+
+    unchecked = client.patch(f"/api/applications/{application['id']}/status", json={"status": "rejected"})
+    assert unchecked.status_code == 200
+    assert unchecked.get_json()["status"] == "rejected"
+    assert unchecked.get_json()["version"] == 3
+
+
+@pytest.mark.parametrize(
+    "body, status_code, message",
+    [
+        ({"applications": [1]}, 400, "invalid status value"),
+        ({"status": "rejected"}, 400, "provide either applications or jd_id"),
+        ({"status": "rejected", "applications": [1], "jd_id": 1}, 400, "provide either applications or jd_id"),
+        ({"status": "rejected", "applications": []}, 400, "applications must be a non-empty list"),
+        (
+            {"status": "rejected", "applications": [{"id": 1, "version": "1"}]},
+            400,
+            "applications must be ids or objects with integer id and version",
+        ),
+        ({"status": "rejected", "applications": list(range(10_001))}, 400, "at most 10000 applications per request"),
+        ({"status": "rejected", "jd_id": 404}, 404, "job description not found"),
+        ({"status": "rejected", "jd_id": 1, "filter": {"min_score": "x"}}, 400, "min_score must be a number"),
+        ({"status": "rejected", "jd_id": 1, "filter": {"status": "hired"}}, 400, "invalid status value"),
+        ({"status": "rejected", "jd_id": 1, "filter": {"min_score": True}}, 400, "min_score must be a number"),
+        (
+            {"status": "rejected", "jd_id": 1, "filter": {"skills": 5}},
+            400,
+            "skills must be a string or a list of strings",
+        ),
+        (
+            {"status": "rejected", "jd_id": 1, "filter": {"skills": ["python", 5]}},
+            400,
+            "skills must be a string or a list of strings",
+        ),
+        (
+            {"status": "rejected", "jd_id": 1, "filter": {"min_experience": 2.5}},
+            400,
+            "min_experience must be an integer",
+        ),
+        (
+            {"status": "rejected", "jd_id": 1, "filter": {"min_experience": True}},
+            400,
+            "min_experience must be an integer",
+        ),
+    ],
+)
+def test_bulk_status_validation(client, body, status_code, message):
+    _seed(client, [10])
+    response = client.patch("/api/applications/status", json=body)
+    assert response.status_code == status_code
+    assert response.get_json()["error"] == message
@@ -1,5 +1,7 @@
 import io
 
+from app.routes import applications as applications_routes
+
 
 def test_create_application_success(client):
     jd = client.post("/api/jds", json={"title": "Python Engineer", "text": "Flask PostgreSQL"}).get_json()
@@ -30,3 +32,41 @@ def test_create_application_validation_error(client):
 
     assert response.status_code == 400
     assert "error" in response.get_json()
+
+
+def test_create_application_rejects_duplicate_pair(client):
+    jd = client.post("/api/jds", json={"title": "Python Engineer", "text": "Flask PostgreSQL"}).get_json()
+    candidate = client.post(
+        "/api/candidates/upload",
+        data={"resume": (io.BytesIO(b"resume body"), "candidate.txt")},
+        content_type="multipart/form-data",
+    ).get_json()["candidate"]
+    first = client.post("/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"]}).get_json()
+
+    response = client.post("/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"]})
+
+    assert response.status_code == 409
+    assert response.get_json()["application_id"] == first["id"]
+
+
+def test_create_application_losing_a_race_returns_conflict(client, monkeypatch):
+    jd = client.post("/api/jds", json={"title": "Python Engineer", "text": "Flask PostgreSQL"}).get_json()
+    candidate = client.post(
+        "/api/candidates/upload",
+        data={"resume": (io.BytesIO(b"resume body"), "candidate.txt")},
+        content_type="multipart/form-data",
+    ).get_json()["candidate"]
+    first = client.post("/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"]}).get_json()
+    original = applications_routes._existing_application_id
+    checks = []
+
+    def checked_before_the_other_insert(*args):
+        checks.append(args)
+        return None if len(checks) == 1 else original(*args)
+
+    monkeypatch.setattr(applications_routes, "_existing_application_id", checked_before_the_other_insert)
+    response = client.post("/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"]})
+
+    assert response.status_code == 409
+    assert response.get_json()["application_id"] == first["id"]
+    assert len(checks) == 2
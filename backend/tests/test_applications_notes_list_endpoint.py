@@ -34,3 +34,31 @@ def test_list_application_notes_not_found(client):
 
     assert response.status_code == 404
     assert "error" in response.get_json()
+
+
+def test_list_application_notes_cursor_pages(client):
+    jd = client.post("/api/jds", json={"title": "Product Manager", "text": "Roadmap"}).get_json()
+    candidate = client.post(
+        "/api/candidates/upload",
+        data={"resume": (io.BytesIO(b"resume"), "candidate.txt")},
+        content_type="multipart/form-data",
+    ).get_json()["candidate"]
+    application = client.post(
+        "/api/applications",
+        json={"candidate_id": candidate["id"], "jd_id": jd["id"]},
+    ).get_json()
+    url = f"/api/applications/{application['id']}/notes"
+    for index in range(3):
+        client.post(url, json={"author_name": "Recruiter", "note_text": f"note {index}"})
+
+    first = client.get(f"{url}?limit=2")
+    second = client.get(f"{url}?limit=2&cursor={first.headers['X-Next-Cursor']}")
+
+    assert [note["note_text"] for note in first.get_json()] == ["note 0", "note 1"]
+    assert [note["note_text"] for note in second.get_json()] == ["note 2"]
+    assert "X-Next-Cursor" not in second.headers
+
+    # A cursor is only valid for the listing that issued it.
+    client.post("/api/jds", json={"title": "Another", "text": "Roadmap"})
+    jd_cursor = client.get("/api/jds?limit=1").headers["X-Next-Cursor"]
+    assert client.get(f"{url}?cursor={jd_cursor}").status_code == 400
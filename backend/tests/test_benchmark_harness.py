@@ -0,0 +1,37 @@
+import random
+
+from benchmarks.corpus import RESUME_SIZES, generate_pool, generate_resume
+from benchmarks.harness import find_regressions, measure
+
+
+def test_corpus_is_reproducible_and_sized():
+    first = generate_pool(random.Random(7), 5)
+    second = generate_pool(random.Random(7), 5)
+
+    assert first == second
+    large = generate_resume(random.Random(7), "large")
+    assert len(large.extracted_text) >= RESUME_SIZES["large"]
+    assert str(large.profile_json["years_experience"]) in large.extracted_text
+
+
+def test_find_regressions_uses_threshold():
+    baseline = {"results": [{"name": "a", "ops_per_sec": 100.0}, {"name": "b", "ops_per_sec": 100.0}]}
+    report = {
+        "results": [
+            {"name": "a", "ops_per_sec": 85.0},
+            {"name": "b", "ops_per_sec": 60.0},
+            {"name": "new", "ops_per_sec": 1.0},
+        ]
+    }
+
+    regressions = find_regressions(report, baseline, threshold=0.25)
+
+    assert [regression["name"] for regression in regressions] == ["b"]
+    assert regressions[0]["change"] == -0.4
+
+
+def test_measure_reports_throughput_and_memory():
+    result = measure("alloc", "functions", lambda: bytearray(64 * 1024), min_time=0.01, repeat=1)
+
+    assert result.ops_per_sec > 0
+    assert result.peak_memory_kb >= 64
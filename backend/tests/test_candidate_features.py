@@ -0,0 +1,106 @@
+import io
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.candidate_features import CandidateFeatures
+from app.services.candidate_features import (
+    get_candidate_features,
+    pack_term_ids,
+    resolve_profile_term_ids,
+    unpack_term_ids,
+)
+from app.services.scoring import (
+    SCORER_VERSION,
+    compile_jd_profile,
+    score_candidate_against_profile,
+    score_features_against_profile,
+)
+from app.services.worker import run_pending_jobs
+
+
+def _upload(client, **fields):
+    data = {"resume": (io.BytesIO(b"resume"), "resume.txt")}
+    data.update(fields)
+    return client.post(
+        "/api/candidates/upload", data=data, content_type="multipart/form-data"
+    ).get_json()["candidate"]
+
+
+def test_process_stores_feature_record(app, client):
+    upload = client.post(
+        "/api/candidates/upload",
+        data={"resume": (io.BytesIO(b"Python Flask PostgreSQL 5 years Bachelor"), "resume.txt")},
+        content_type="multipart/form-data",
+    ).get_json()["candidate"]
+
+    client.post(f"/api/candidates/{upload['id']}/process", json={})
+
+    with app.app_context():
+        run_pending_jobs()
+        features = db.session.get(Candidate, upload["id"]).features
+        assert features.feature_version == SCORER_VERSION
+        assert features.years_experience == 5
+        assert features.education_levels == ["bachelor"]
+        assert "python" in features.skills
+        assert features.term_count == len(unpack_term_ids(features.term_ids))
+
+
+def test_feature_scoring_matches_text_scoring(app, client):
+    jd_text = "Senior Python engineer, Flask and PostgreSQL, 6 years, Master degree preferred"
+    candidates = [
+        _upload(
+            client,
+            full_name="Ada Lovelace",
+            extracted_text="Python Flask developer with 4 years experience, Master of Science",
+            profile_json='{"skills": ["python", "flask"], "years_experience": 4}',
+        ),
+        _upload(client, extracted_text="React TypeScript 10+ years Bachelor"),
+        _upload(client),
+    ]
+
+    with app.app_context():
+        profile = compile_jd_profile(jd_text)
+        for uploaded in candidates:
+            candidate = db.session.get(Candidate, uploaded["id"])
+            record = get_candidate_features(candidate)
+            expected = score_candidate_against_profile(candidate.to_dict(), profile)
+            actual = score_features_against_profile(record, profile, resolve_profile_term_ids(profile))
+            assert actual == expected
+
+
+def test_min_experience_filter_reads_feature_record(app, client):
+    jd = client.post("/api/jds", json={"title": "Backend", "text": "Python"}).get_json()
+    candidate = _upload(client, extracted_text="python 7 years")
+    client.post("/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"]})
+
+    with app.app_context():
+        row = db.session.get(Candidate, candidate["id"])
+        row.extracted_text = "python"
+        db.session.commit()
+
+    body = client.get(f"/api/jds/{jd['id']}/applications?min_experience=6&skills=python").get_json()
+    assert len(body) == 1
+
+
+def test_pack_term_ids_round_trip_sorted():
+    assert list(unpack_term_ids(pack_term_ids([9, 3, 70000]))) == [3, 9, 70000]
+    assert list(unpack_term_ids(b"")) == []
+
+
+def test_refresh_features_cli_rebuilds_outdated_records(app, client):
+    outdated = _upload(client, extracted_text="Python Flask 4 years")
+    current = _upload(client, extracted_text="Java")
+    with app.app_context():
+        db.session.query(CandidateFeatures).filter_by(candidate_id=outdated["id"]).update({"feature_version": "0"})
+        db.session.commit()
+        current_updated_at = db.session.get(CandidateFeatures, current["id"]).updated_at
+
+    result = app.test_cli_runner().invoke(args=["refresh-features", "--chunk-size", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "refreshed 1 candidate feature records" in result.output
+    with app.app_context():
+        features = db.session.get(CandidateFeatures, outdated["id"])
+        assert features.feature_version == SCORER_VERSION
+        assert features.years_experience == 4
+        assert db.session.get(CandidateFeatures, current["id"]).updated_at == current_updated_at
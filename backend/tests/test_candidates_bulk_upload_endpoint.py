@@ -0,0 +1,144 @@
+import io
+import os
+import zipfile
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.services import bulk_upload
+from app.services.job_queue import PermanentJobError
+from app.services.worker import run_pending_jobs
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def test_bulk_upload_zip_and_files_then_process(app, client):
+    app.config["BULK_PARSE_PROCESSES"] = 0
+    archive = _zip(
+        {
+            "resumes/alice.txt": b"Python Flask 6 years Master",
+            "resumes/bob.txt": b"React TypeScript 2 years",
+            "resumes/notes.md": b"not a resume",
+            "__MACOSX/resumes/._alice.txt": b"junk",
+        }
+    )
+
+    response = client.post(
+        "/api/candidates/bulk-upload",
+        data={
+            "resume": [
+                (archive, "batch.zip"),
+                (io.BytesIO(b"Docker Kubernetes 4 years"), "carol.txt"),
+            ]
+        },
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 202
+    body = response.get_json()
+    assert body["batch"]["total_files"] == 4
+    assert body["batch"]["rejected"] == 1
+    assert body["batch"]["pending"] == 3
+    assert body["batch"]["progress"] == 0.0
+    outcomes = {item["filename"]: item["status"] for item in body["items"]}
+    assert outcomes == {"alice.txt": "pending", "bob.txt": "pending", "carol.txt": "pending", "notes.md": "rejected"}
+    assert response.headers["Location"] == f"/api/candidates/bulk-upload/{body['batch']['id']}"
+
+    with app.app_context():
+        assert run_pending_jobs() == 1
+
+    progress = client.get(f"/api/candidates/bulk-upload/{body['batch']['id']}").get_json()
+    assert progress["batch"]["status"] == "completed"
+    assert progress["batch"]["processed"] == 3
+    assert progress["batch"]["progress"] == 1.0
+
+    alice = next(item for item in progress["items"] if item["filename"] == "alice.txt")
+    with app.app_context():
+        candidate = db.session.get(Candidate, alice["candidate_id"])
+        assert candidate.profile_json["years_experience"] == 6
+        assert "python" in candidate.profile_json["skills"]
+        assert candidate.features is not None
+
+
+def test_bulk_upload_parses_in_process_pool_and_reports_failures(app, client):
+    app.config["BULK_PARSE_PROCESSES"] = 2
+    response = client.post(
+        "/api/candidates/bulk-upload",
+        data={"resume": [(io.BytesIO(f"Python {n} years".encode()), f"r{n}.txt") for n in range(1, 5)]},
+        content_type="multipart/form-data",
+    )
+    body = response.get_json()
+    missing = body["items"][0]
+
+    with app.app_context():
+        os.remove(db.session.get(Candidate, missing["candidate_id"]).resume_path)
+        run_pending_jobs()
+
+    progress = client.get(f"/api/candidates/bulk-upload/{body['batch']['id']}").get_json()
+    assert progress["batch"]["processed"] == 3
+    assert progress["batch"]["failed"] == 1
+    failed = next(item for item in progress["items"] if item["status"] == "failed")
+    assert "FileNotFoundError" in failed["error_message"]
+
+
+def test_cancelled_and_dead_batch_jobs_end_the_batch(app, client, monkeypatch):
+    app.config["BULK_PARSE_PROCESSES"] = 0
+
+    def upload():
+        return client.post(
+            "/api/candidates/bulk-upload",
+            data={"resume": [(io.BytesIO(b"Python 3 years"), "r.txt")]},
+            content_type="multipart/form-data",
+        ).get_json()
+
+    body = upload()
+    assert client.post(f"/api/processing-jobs/{body['job']['id']}/cancel").status_code == 200
+    with app.app_context():
+        run_pending_jobs()
+    progress = client.get(f"/api/candidates/bulk-upload/{body['batch']['id']}").get_json()
+    assert progress["batch"]["status"] == "cancelled"
+    assert progress["job"]["status"] == "cancelled"
+
+    def broken_cancel_check(job_id):
+        raise PermanentJobError("job store unavailable")
+
+    # Fails after the batch has been marked as processing.
+    monkeypatch.setattr(bulk_upload, "is_cancel_requested", broken_cancel_check)
+    body = upload()
+    with app.app_context():
+        run_pending_jobs()
+    progress = client.get(f"/api/candidates/bulk-upload/{body['batch']['id']}").get_json()
+    assert progress["batch"]["status"] == "failed"
+    assert progress["job"]["status"] == "failed"
+
+
+def test_bulk_upload_rejects_oversized_and_invalid_archives(app, client):
+    app.config["BULK_UPLOAD_MAX_FILE_BYTES"] = 10
+    response = client.post(
+        "/api/candidates/bulk-upload",
+        data={
+            "resume": [
+                (io.BytesIO(b"this resume is far too long"), "big.txt"),
+                (io.BytesIO(b"not a zip"), "broken.zip"),
+                (io.BytesIO(b"short"), "ok.txt"),
+            ]
+        },
+        content_type="multipart/form-data",
+    )
+
+    items = {item["filename"]: item for item in response.get_json()["items"]}
+    assert items["big.txt"]["status"] == "rejected"
+    assert "exceeds" in items["big.txt"]["error_message"]
+    assert items["broken.zip"]["error_message"] == "not a valid zip archive"
+    assert items["ok.txt"]["status"] == "pending"
+
+
+def test_bulk_upload_requires_files(client):
+    assert client.post("/api/candidates/bulk-upload", data={}, content_type="multipart/form-data").status_code == 400
+    assert client.get("/api/candidates/bulk-upload/999").status_code == 404
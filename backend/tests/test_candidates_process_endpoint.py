@@ -1,26 +1,54 @@
 import io
 import os
 
+from app.services.worker import run_pending_jobs
 
-def test_process_candidate_success(client):
-    upload = client.post(
+
+def _upload(client, body=b"Python Flask PostgreSQL 5 years Bachelor"):
+    return client.post(
         "/api/candidates/upload",
-        data={
-            "resume": (
-                io.BytesIO(b"Python Flask PostgreSQL 5 years Bachelor"),
-                "resume.txt",
-            )
-        },
+        data={"resume": (io.BytesIO(body), "resume.txt")},
         content_type="multipart/form-data",
-    ).get_json()["candidate"]
+    ).get_json()
+
+
+def test_upload_enqueues_processing_job(client):
+    body = _upload(client)
+
+    assert body["status"] == "queued"
+    assert body["job"]["status"] == "queued"
+    assert body["job"]["entity_id"] == body["candidate"]["id"]
+    assert body["job"]["job_type"] == "process_candidate"
+
+
+def test_process_candidate_success(app, client):
+    upload = _upload(client)["candidate"]
+
+    response = client.post(f"/api/candidates/{upload['id']}/process", json={"force_reprocess": True})
+
+    assert response.status_code == 202
+    job = response.get_json()["job"]
+    assert job["status"] == "queued"
+    assert response.headers["Location"] == f"/api/processing-jobs/{job['id']}"
+
+    with app.app_context():
+        assert run_pending_jobs() == 1
 
-    response = client.post(f"/api/candidates/{upload['id']}/process", json={})
+    job = client.get(f"/api/processing-jobs/{job['id']}").get_json()
+    candidate = client.get(f"/api/candidates/{upload['id']}").get_json()
+    assert job["status"] == "completed"
+    assert job["attempts"] == 1
+    assert "python" in candidate["profile_json"]["skills"]
+    assert candidate["profile_json"]["years_experience"] == 5
 
-    assert response.status_code == 200
-    body = response.get_json()
-    assert body["job"]["status"] == "completed"
-    assert "python" in body["candidate"]["profile_json"]["skills"]
-    assert body["candidate"]["profile_json"]["years_experience"] == 5
+
+def test_process_reuses_queued_job(client):
+    upload = _upload(client)
+
+    response = client.post(f"/api/candidates/{upload['candidate']['id']}/process", json={"force_reprocess": True})
+
+    assert response.get_json()["job"]["id"] == upload["job"]["id"]
+    assert response.get_json()["job"]["payload"] == {"force_reprocess": True}
 
 
 def test_process_candidate_not_found(client):
@@ -30,17 +58,25 @@ def test_process_candidate_not_found(client):
     assert "error" in response.get_json()
 
 
-def test_process_candidate_failure_when_file_missing(client):
-    upload = client.post(
-        "/api/candidates/upload",
-        data={"resume": (io.BytesIO(b"resume body"), "resume.txt")},
-        content_type="multipart/form-data",
-    ).get_json()["candidate"]
+def test_process_candidate_failure_when_file_missing(app, client):
+    upload = _upload(client, b"resume body")
+
+    os.remove(upload["candidate"]["resume_path"])
+
+    with app.app_context():
+        run_pending_jobs()
+
+    job = client.get(f"/api/processing-jobs/{upload['job']['id']}").get_json()
+    assert job["status"] == "failed"
+    assert job["attempts"] == 1
+    assert "resume file not found" in job["error_message"]
+
 
-    os.remove(upload["resume_path"])
+def test_worker_cli_drains_queue(app, client):
+    upload = _upload(client)["candidate"]
 
-    response = client.post(f"/api/candidates/{upload['id']}/process", json={})
+    result = app.test_cli_runner().invoke(args=["worker", "--burst", "--concurrency", "2"])
 
-    assert response.status_code == 500
-    body = response.get_json()
-    assert body["job"]["status"] == "failed"
+    assert result.exit_code == 0, result.output
+    assert "after 1 job(s)" in result.output
+    assert client.get(f"/api/candidates/{upload['id']}").get_json()["profile_json"]["years_experience"] == 5
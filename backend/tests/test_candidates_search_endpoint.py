@@ -0,0 +1,99 @@
+import io
+
+import pytest
+
+from app.services.candidate_search import (
+    SearchQueryError,
+    _fts5_match,
+    _tsquery,
+    parse_search_query,
+)
+from app.services.worker import run_pending_jobs
+
+
+def _upload(client, text, full_name=None, email=None, resume=b"resume"):
+    data = {"resume": (io.BytesIO(resume), "resume.txt"), "extracted_text": text}
+    if full_name:
+        data["full_name"] = full_name
+    if email:
+        data["email"] = email
+    return client.post("/api/candidates/upload", data=data, content_type="multipart/form-data").get_json()[
+        "candidate"
+    ]["id"]
+
+
+def _search(client, query, **params):
+    response = client.get("/api/candidates/search", query_string={"q": query, **params})
+    assert response.status_code == 200, response.get_json()
+    return [result["candidate_id"] for result in response.get_json()["results"]]
+
+
+def test_search_words_phrases_prefixes_and_booleans(client):
+    python_ml = _upload(client, "Python developer, machine learning with PyTorch. 5 years")
+    python_web = _upload(client, "Python and Django web developer; learning machine shop skills")
+    java = _upload(client, "Java Spring engineer, Kubernetes")
+
+    assert sorted(_search(client, "python developer")) == sorted([python_ml, python_web])
+    assert _search(client, '"machine learning"') == [python_ml]
+    assert _search(client, "kube*") == [java]
+    assert sorted(_search(client, "django OR spring")) == sorted([python_web, java])
+    assert _search(client, "python -django") == [python_ml]
+    assert _search(client, "python NOT (django OR pytorch)") == []
+    assert _search(client, "Python.Developer") == [python_ml]
+    assert _search(client, "developer.python") == []
+    assert _search(client, "rust") == []
+    assert "python" in client.get("/api/candidates/search?q=pytorch").get_json()["results"][0]["skills"]
+
+
+def test_search_ranks_by_relevance_and_returns_candidate_fields(client):
+    mentions_once = _upload(client, "Worked with go once among many other things " + "filler " * 50)
+    mentions_often = _upload(client, "Go engineer: go services, go tooling, go everything")
+    named = _upload(client, "Backend engineer", full_name="Gopher Go", email="go@example.com")
+    for _ in range(5):
+        _upload(client, "Rust and C++ systems work")
+
+    response = client.get("/api/candidates/search?q=go").get_json()
+
+    assert [result["candidate_id"] for result in response["results"]] == [named, mentions_often, mentions_once]
+    assert response["results"][0]["full_name"] == "Gopher Go"
+    assert response["results"][0]["email"] == "go@example.com"
+    assert response["results"][0]["score"] > response["results"][1]["score"] > response["results"][2]["score"]
+    assert _search(client, "go", limit=1, offset=1) == [mentions_often]
+    assert _search(client, "go@example.com") == [named]
+
+
+def test_search_follows_reprocessing(app, client):
+    candidate_id = _upload(client, "Cobol mainframe", resume=b"Rust systems programmer")
+    assert _search(client, "cobol") == [candidate_id]
+
+    client.post(f"/api/candidates/{candidate_id}/process", json={"force_reprocess": True})
+    with app.app_context():
+        run_pending_jobs()
+
+    assert _search(client, "cobol") == []
+    assert _search(client, "rust") == [candidate_id]
+
+
+def test_search_rejects_invalid_queries(client):
+    assert client.get("/api/candidates/search").status_code == 400
+    assert client.get("/api/candidates/search?q=-java").status_code == 400
+    assert client.get("/api/candidates/search?q=python)").status_code == 400
+    assert client.get("/api/candidates/search?q=%2B%2B%2B").status_code == 400
+    assert client.get("/api/candidates/search?q=python&limit=0").status_code == 400
+    assert client.get("/api/candidates/search?q=python&offset=-1").status_code == 400
+
+
+def test_query_compiles_to_both_backends():
+    node = parse_search_query('"Machine Learning" pyth* OR (go -java) AND c++')
+
+    assert _fts5_match(node) == '(("machine learning") AND ("pyth"*)) OR (((("go")) NOT ("java")) AND ("c"))'
+    assert _tsquery(node) == "(('machine' <-> 'learning') & ('pyth':*)) | ((('go') & !('java')) & ('c'))"
+
+
+@pytest.mark.parametrize("query", ["", "   ", "***", "NOT python", "(python", "a" * 501])
+def test_query_parser_edge_cases(query):
+    if query == "(python":
+        assert parse_search_query(query) == ("term", ("python",), False)
+    else:
+        with pytest.raises(SearchQueryError):
+            parse_search_query(query)
@@ -1,5 +1,7 @@
 import io
 
+from app.services.scoring import _skills_from_profile
+
 
 def test_upload_resume_success(client):
     response = client.post(
@@ -37,3 +39,22 @@ def test_upload_resume_with_invalid_profile_json(client):
 
     assert response.status_code == 400
     assert "error" in response.get_json()
+
+
+def test_upload_resume_accepts_unusual_profile_skills(client):
+    for skills in ('["python", "' + "x" * 101 + '"]', "[1]", '"python"', "5"):
+        response = client.post(
+            "/api/candidates/upload",
+            data={
+                "resume": (io.BytesIO(b"sample resume data"), "resume.txt"),
+                "profile_json": '{"skills": ' + skills + "}",
+            },
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 201
+
+
+def test_stored_overlong_profile_skills_are_not_materialized(app):
+    with app.app_context():
+        assert _skills_from_profile({"skills": ["Python", "x" * 101]}) == {"python"}
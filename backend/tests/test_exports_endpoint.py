@@ -0,0 +1,238 @@
+import csv
+import gzip
+import io
+import json
+import zipfile
+from xml.etree import ElementTree
+
+import pytest
+
+from app.services import exports
+from app.services.worker import run_pending_jobs
+
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def _seed(client):
+    """Two Engineering JDs with two applications each (one scored, one with notes) and a Sales JD."""
+    jds = {
+        name: client.post("/api/jds", json={"title": name, "department": department, "text": "Python Flask SQL"})
+        .get_json()["id"]
+        for name, department in [("Backend", "Engineering"), ("Data", "Engineering"), ("Account Exec", "Sales")]
+    }
+    applications = {}
+    for jd_name, jd_id in jds.items():
+        for index in range(2):
+            candidate_id = client.post(
+                "/api/candidates/upload",
+                data={
+                    "resume": (io.BytesIO(f"{jd_name} {index}".encode()), "resume.txt"),
+                    "full_name": f"{jd_name} Candidate {index}",
+                    "email": f"{jd_name.replace(' ', '').lower()}{index}@example.com",
+                    "extracted_text": "Python developer with Flask, 4 years of experience",
+                },
+                content_type="multipart/form-data",
+            ).get_json()["candidate"]["id"]
+            applications[(jd_name, index)] = client.post(
+                "/api/applications", json={"candidate_id": candidate_id, "jd_id": jd_id}
+            ).get_json()["id"]
+    client.post("/api/applications/score", json={"application_id": applications[("Backend", 0)]})
+    client.post(
+        f"/api/applications/{applications[('Backend', 1)]}/notes",
+        json={"author_name": "Ana", "note_text": "Strong, call back"},
+    )
+    client.post(
+        f"/api/applications/{applications[('Backend', 1)]}/notes",
+        json={"author_name": "Ben", "note_text": 'Said "maybe"\nsecond line'},
+    )
+    client.patch(f"/api/applications/{applications[('Data', 0)]}/status", json={"status": "shortlisted"})
+    return jds, applications
+
+
+def _run_export(app, client, **body):
+    response = client.post("/api/exports", json=body)
+    assert response.status_code == 202, response.get_json()
+    export = response.get_json()
+    assert response.headers["Location"] == f"/api/exports/{export['id']}"
+    with app.app_context():
+        run_pending_jobs()
+    export = client.get(f"/api/exports/{export['id']}").get_json()
+    assert export["status"] == "completed", export
+    return export
+
+
+def _download(client, export) -> bytes:
+    response = client.get(export["download_url"])
+    assert response.status_code == 200
+    return response.data
+
+
+def test_csv_export_of_a_department_with_breakdowns_and_notes(app, client):
+    jds, applications = _seed(client)
+
+    response = client.post("/api/exports", json={"format": "csv", "department": "Engineering"})
+    export = response.get_json()
+    assert export["status"] == "queued"
+    assert export["progress"] == 0.0
+    assert export["job"]["job_type"] == "export_report"
+    assert client.get(f"/api/exports/{export['id']}/download").status_code == 409
+
+    with app.app_context():
+        run_pending_jobs()
+    export = client.get(f"/api/exports/{export['id']}").get_json()
+    assert export["status"] == "completed"
+    assert export["total_rows"] == export["rows_written"] == 4
+    assert export["progress"] == 1.0
+    assert export["job"]["status"] == "completed"
+
+    response = client.get(export["download_url"])
+    assert response.mimetype == "application/gzip"
+    assert response.headers["Content-Disposition"] == f'attachment; filename=report_{export["id"]}.csv.gz'
+    assert int(response.headers["Content-Length"]) == export["size_bytes"]
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.data).decode())))
+
+    assert [int(row["application_id"]) for row in rows] == [
+        applications[("Backend", 0)],
+        applications[("Backend", 1)],
+        applications[("Data", 0)],
+        applications[("Data", 1)],
+    ]
+    assert {row["department"] for row in rows} == {"Engineering"}
+    scored, noted, shortlisted = rows[0], rows[1], rows[2]
+    assert float(scored["total_score"]) > 0
+    assert scored["skills_score"] and scored["skills_weight"] == "0.45"
+    assert "python" in scored["matched_skills"]
+    assert scored["note_count"] == "0" and scored["notes"] == ""
+    assert noted["total_score"] == "" and noted["skills_score"] == ""
+    assert noted["note_count"] == "2"
+    assert noted["notes"].splitlines()[0].endswith("Ana: Strong, call back")
+    assert 'Ben: Said "maybe"' in noted["notes"]
+    assert shortlisted["status"] == "shortlisted"
+
+
+def test_ndjson_export_of_selected_jds_with_filters(app, client):
+    jds, applications = _seed(client)
+
+    export = _run_export(
+        app, client, format="ndjson", jd_ids=[jds["Account Exec"], jds["Backend"]], min_score=1
+    )
+    records = [json.loads(line) for line in gzip.decompress(_download(client, export)).splitlines()]
+    assert [record["application_id"] for record in records] == [applications[("Backend", 0)]]
+    assert records[0]["jd"] == {"id": jds["Backend"], "title": "Backend", "department": "Engineering"}
+    assert records[0]["score_breakdown"]["skills"]["score"] > 0
+    assert records[0]["candidate"]["email"] == "backend0@example.com"
+
+    export = _run_export(app, client, format="ndjson", jd_ids=[jds["Backend"]], status="new")
+    records = [json.loads(line) for line in gzip.decompress(_download(client, export)).splitlines()]
+    notes = next(record["notes"] for record in records if record["application_id"] == applications[("Backend", 1)])
+    assert [note["author_name"] for note in notes] == ["Ana", "Ben"]
+    assert export["params"] == {"jd_ids": [jds["Backend"]], "status": "new"}
+
+
+def test_xlsx_export_is_a_readable_workbook(app, client):
+    _seed(client)
+
+    export = _run_export(app, client, format="xlsx", department="Engineering")
+    response = client.get(export["download_url"])
+    assert response.mimetype == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    with zipfile.ZipFile(io.BytesIO(response.data)) as workbook:
+        assert workbook.testzip() is None
+        assert "[Content_Types].xml" in workbook.namelist()
+        sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+    rows = [
+        ["".join(cell.itertext()) for cell in row]
+        for row in sheet.iter(f"{SHEET_NS}row")
+    ]
+    assert rows[0] == exports.REPORT_COLUMNS
+    assert len(rows) == 5
+    notes = rows[2][exports.REPORT_COLUMNS.index("notes")]
+    assert 'Said "maybe"\nsecond line' in notes
+
+
+def test_export_reads_in_chunks_and_reports_progress(app, client, monkeypatch):
+    _seed(client)
+    monkeypatch.setattr(exports, "EXPORT_CHUNK_ROWS", 1)
+    progress = []
+    original = exports.renew_lease
+
+    def record_progress(job_id, worker_id):
+        query = exports.db.session.query(exports.ReportExport.rows_written)
+        progress.append(query.filter(exports.ReportExport.id == 1).scalar())
+        return original(job_id, worker_id)
+
+    monkeypatch.setattr(exports, "renew_lease", record_progress)
+    export = _run_export(app, client, format="csv", department="Engineering")
+
+    assert progress == [1, 2, 3, 4]
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(_download(client, export)).decode())))
+    assert len(rows) == 4
+    assert sum(int(row["note_count"]) for row in rows) == 2
+
+
+def test_download_supports_range_requests(app, client):
+    _seed(client)
+    export = _run_export(app, client, format="ndjson", department="Engineering")
+    full = _download(client, export)
+
+    head = client.get(export["download_url"], headers={"Range": "bytes=0-9"})
+    assert head.status_code == 206
+    assert head.headers["Content-Range"] == f"bytes 0-9/{len(full)}"
+    assert head.headers["Accept-Ranges"] == "bytes"
+    tail = client.get(export["download_url"], headers={"Range": "bytes=10-"})
+    assert tail.status_code == 206
+    assert head.data + tail.data == full
+
+    unsatisfiable = client.get(export["download_url"], headers={"Range": f"bytes={len(full)}-"})
+    assert unsatisfiable.status_code == 416
+
+
+def test_cancelled_and_failed_exports(app, client, monkeypatch):
+    jds, _ = _seed(client)
+
+    export = client.post("/api/exports", json={"jd_ids": [jds["Backend"]]}).get_json()
+    assert client.post(f"/api/processing-jobs/{export['job']['id']}/cancel").status_code == 200
+    with app.app_context():
+        run_pending_jobs()
+    export = client.get(f"/api/exports/{export['id']}").get_json()
+    assert export["status"] == "cancelled"
+    assert export["job"]["status"] == "cancelled"
+    assert client.get(f"/api/exports/{export['id']}/download").status_code == 409
+
+    def broken_record(*args):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(exports, "_report_record", broken_record)
+    export = client.post("/api/exports", json={"jd_ids": [jds["Backend"]]}).get_json()
+    with app.app_context():
+        run_pending_jobs()
+    export = client.get(f"/api/exports/{export['id']}").get_json()
+    assert export["job"]["status"] == "queued"
+    assert export["job"]["error_message"] == "RuntimeError: disk full"
+    assert list(exports.Path(app.config["EXPORT_DIR"]).iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        ({"format": "pdf", "department": "Engineering"}, "format must be one of: csv, ndjson, xlsx"),
+        ({"format": "csv"}, "provide either jd_ids or department"),
+        ({"jd_ids": [1], "department": "Engineering"}, "provide either jd_ids or department"),
+        ({"jd_ids": []}, "jd_ids must be a non-empty list of integers"),
+        ({"jd_ids": ["1"]}, "jd_ids must be a non-empty list of integers"),
+        ({"jd_ids": [999]}, "unknown job descriptions: 999"),
+        ({"department": "Legal"}, "no job descriptions in that department"),
+        ({"department": "Engineering", "status": "hired"}, "invalid status value"),
+        ({"department": "Engineering", "min_score": "high"}, "min_score must be a number"),
+    ],
+)
+def test_create_export_validation(client, body, message):
+    _seed(client)
+    response = client.post("/api/exports", json=body)
+    assert response.status_code == 400
+    assert response.get_json()["error"] == message
+
+
+def test_unknown_export(client):
+    assert client.get("/api/exports/404").status_code == 404
+    assert client.get("/api/exports/404/download").status_code == 404
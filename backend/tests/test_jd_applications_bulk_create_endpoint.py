@@ -0,0 +1,144 @@
+import io
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models.application import Application
+from app.services import batch_scoring
+from app.services.worker import run_pending_jobs
+
+
+def _seed(client, texts):
+    jd = client.post(
+        "/api/jds",
+        json={"title": "Backend Engineer", "text": "Python Flask PostgreSQL 3 years Bachelor"},
+    ).get_json()
+    candidate_ids = [
+        client.post(
+            "/api/candidates/upload",
+            data={"resume": (io.BytesIO(text.encode()), f"candidate{index}.txt"), "extracted_text": text},
+            content_type="multipart/form-data",
+        ).get_json()["candidate"]["id"]
+        for index, text in enumerate(texts)
+    ]
+    return jd, candidate_ids
+
+
+def _applications(client, jd):
+    return {item["candidate_id"]: item for item in client.get(f"/api/jds/{jd['id']}/applications").get_json()}
+
+
+def test_bulk_create_scores_new_applications_and_skips_existing(app, client):
+    jd, candidate_ids = _seed(
+        client,
+        [
+            "Python Flask PostgreSQL, 5 years, Bachelor",
+            "Python developer, 1 year",
+            "Java Spring, 10 years, Master",
+        ],
+    )
+    existing = client.post(
+        "/api/applications", json={"candidate_id": candidate_ids[0], "jd_id": jd["id"]}
+    ).get_json()
+
+    response = client.post(
+        f"/api/jds/{jd['id']}/applications/bulk",
+        json={"candidate_ids": candidate_ids + [candidate_ids[1], 99999], "chunk_size": 2},
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["jd_id"] == jd["id"]
+    assert body["requested"] == 4
+    assert (body["created"], body["existing"]) == (2, 1)
+    assert body["missing_candidate_ids"] == [99999]
+    assert body["chunks"] == 2
+
+    applications = _applications(client, jd)
+    assert set(applications) == set(candidate_ids)
+    assert applications[candidate_ids[0]]["id"] == existing["id"]
+    assert applications[candidate_ids[0]]["total_score"] is None
+    assert applications[candidate_ids[1]]["total_score"] > 0
+    assert applications[candidate_ids[1]]["status"] == "new"
+    assert applications[candidate_ids[1]]["score_breakdown_json"]["skills"]["matched"] == ["python"]
+
+    # Scores match what scoring the application on its own gives.
+    single = client.post("/api/applications/score", json={"application_id": applications[candidate_ids[2]]["id"]})
+    assert single.get_json()["total_score"] == applications[candidate_ids[2]]["total_score"]
+
+    again = client.post(f"/api/jds/{jd['id']}/applications/bulk", json={"candidate_ids": candidate_ids})
+    assert (again.get_json()["created"], again.get_json()["existing"]) == (0, 3)
+
+
+def test_bulk_create_counts_pairs_linked_concurrently_as_existing(app, client, monkeypatch):
+    jd, candidate_ids = _seed(client, ["Python Flask", "Python", "Java"])
+    score_records = batch_scoring._score_records
+
+    def link_first_then_score(*args):
+        # Another request links the first candidate after this one checked for existing pairs.
+        db.session.add(Application(candidate_id=candidate_ids[0], jd_id=jd["id"]))
+        db.session.flush()
+        return score_records(*args)
+
+    monkeypatch.setattr(batch_scoring, "_score_records", link_first_then_score)
+    response = client.post(
+        f"/api/jds/{jd['id']}/applications/bulk", json={"candidate_ids": candidate_ids + [99999]}
+    )
+
+    body = response.get_json()
+    assert (body["created"], body["existing"], body["missing_candidate_ids"]) == (2, 1, [99999])
+    assert _applications(client, jd)[candidate_ids[0]]["total_score"] is None
+
+
+def test_bulk_create_from_search_with_python_engine(app, client):
+    jd, candidate_ids = _seed(
+        client, ["Python Flask developer", "Python data engineer, Spark", "Go and Rust systems", "Filler text"]
+    )
+    with app.app_context():
+        run_pending_jobs()
+
+    response = client.post(
+        f"/api/jds/{jd['id']}/applications/bulk", json={"search": "python -spark", "engine": "python"}
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["created"] == 1
+    assert list(_applications(client, jd)) == [candidate_ids[0]]
+
+
+def test_unique_constraint_on_candidate_and_jd(app, client):
+    jd, [candidate_id] = _seed(client, ["Python"])
+    client.post(f"/api/jds/{jd['id']}/applications/bulk", json={"candidate_ids": [candidate_id]})
+
+    with app.app_context():
+        db.session.add(Application(candidate_id=candidate_id, jd_id=jd["id"]))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        ({}, "provide either candidate_ids or search"),
+        ({"candidate_ids": [1], "search": "python"}, "provide either candidate_ids or search"),
+        ({"candidate_ids": []}, "candidate_ids must be a non-empty list of integers"),
+        ({"candidate_ids": [True]}, "candidate_ids must be a non-empty list of integers"),
+        ({"candidate_ids": list(range(1, 50_002))}, "at most 50000 candidates per request"),
+        ({"search": "-python"}, "a query needs at least one term that is not negated"),
+        ({"search": 3}, "search must be a string"),
+        ({"candidate_ids": [1], "chunk_size": 0}, "chunk_size must be an integer between 1 and 5000"),
+        ({"candidate_ids": [1], "engine": "gpu"}, "engine must be one of: python, numpy"),
+        ({"candidate_ids": [1], "weights": [1]}, "weights must be an object"),
+    ],
+)
+def test_bulk_create_validation(client, body, message):
+    jd, _ = _seed(client, ["Python"])
+    response = client.post(f"/api/jds/{jd['id']}/applications/bulk", json=body)
+    assert response.status_code == 400
+    assert response.get_json()["error"] == message
+
+
+def test_bulk_create_unknown_jd(client):
+    assert client.post("/api/jds/404/applications/bulk", json={"candidate_ids": [1]}).status_code == 404
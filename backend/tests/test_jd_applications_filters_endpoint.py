@@ -1,5 +1,10 @@
 import io
 
+from app.extensions import db
+from app.models.candidate_features import CandidateFeatures
+from app.models.candidate_skill import CandidateSkill
+from app.routes import applications
+
 
 def _seed_candidates_and_applications(client):
     jd = client.post(
@@ -100,3 +105,33 @@ def test_filter_validation_error(client):
 
     assert response.status_code == 400
     assert "error" in response.get_json()
+
+
+def test_skills_and_experience_filters_run_in_sql(app, client, monkeypatch):
+    jd, app_one, app_two = _seed_candidates_and_applications(client)
+    with app.app_context():
+        skills = {(row.candidate_id, row.skill) for row in CandidateSkill.query.all()}
+    assert {skill for _, skill in skills} >= {"python", "flask", "sql", "react"}
+
+    def no_python_analysis(candidate):
+        raise AssertionError("candidates with current feature records are filtered in SQL")
+
+    monkeypatch.setattr(applications, "candidate_analysis", no_python_analysis)
+    body = client.get(f"/api/jds/{jd['id']}/applications?skills=python,sql&min_experience=4&limit=5").get_json()
+
+    assert [item["id"] for item in body] == [app_one["id"]]
+
+
+def test_candidates_without_current_features_are_still_filtered(app, client):
+    jd, app_one, app_two = _seed_candidates_and_applications(client)
+    with app.app_context():
+        db.session.get(CandidateFeatures, app_two["candidate_id"]).feature_version = "outdated"
+        db.session.commit()
+
+    react = client.get(f"/api/jds/{jd['id']}/applications?skills=react").get_json()
+    python = client.get(f"/api/jds/{jd['id']}/applications?skills=python&limit=1&offset=1").get_json()
+    experienced = client.get(f"/api/jds/{jd['id']}/applications?min_experience=3").get_json()
+
+    assert [item["id"] for item in react] == [app_two["id"]]
+    assert [item["id"] for item in python] == [app_two["id"]]
+    assert [item["id"] for item in experienced] == [app_one["id"]]
@@ -38,3 +38,100 @@ def test_list_applications_for_missing_jd(client):
 
     assert response.status_code == 404
     assert "error" in response.get_json()
+
+
+def _seed_scored_applications(client, scores):
+    jd = client.post("/api/jds", json={"title": "Data Engineer", "text": "Python SQL"}).get_json()
+    for index, score in enumerate(scores):
+        candidate = client.post(
+            "/api/candidates/upload",
+            data={
+                "resume": (io.BytesIO(b"resume"), f"candidate{index}.txt"),
+                "extracted_text": f"python sql {index + 1} years",
+            },
+            content_type="multipart/form-data",
+        ).get_json()["candidate"]
+        payload = {"candidate_id": candidate["id"], "jd_id": jd["id"]}
+        if score is not None:
+            payload["total_score"] = score
+        client.post("/api/applications", json=payload)
+    return jd
+
+
+def test_list_applications_limit_and_offset(client):
+    jd = _seed_scored_applications(client, [40.0, None, 90.0, 70.0, 70.0, 10.0])
+
+    top = client.get(f"/api/jds/{jd['id']}/applications?limit=3").get_json()
+    page = client.get(f"/api/jds/{jd['id']}/applications?limit=3&offset=3").get_json()
+    ascending = client.get(f"/api/jds/{jd['id']}/applications?sort=score_asc&limit=2").get_json()
+
+    assert [item["total_score"] for item in top] == [90.0, 70.0, 70.0]
+    assert top[1]["id"] < top[2]["id"]
+    assert [item["total_score"] for item in page] == [40.0, 10.0, None]
+    assert [item["total_score"] for item in ascending] == [None, 10.0]
+
+
+def test_list_applications_top_k_with_python_filters_matches_full_sort(client):
+    jd = _seed_scored_applications(client, [40.0, None, 90.0, 70.0, 70.0, 10.0])
+    url = f"/api/jds/{jd['id']}/applications?min_experience=2"
+
+    everything = client.get(url).get_json()
+    top = client.get(f"{url}&limit=2").get_json()
+    page = client.get(f"{url}&limit=2&offset=2").get_json()
+
+    assert [item["total_score"] for item in everything] == [90.0, 70.0, 70.0, 10.0, None]
+    assert top == everything[:2]
+    assert page == everything[2:4]
+
+
+def test_list_applications_rejects_invalid_limit(client):
+    jd = _seed_scored_applications(client, [50.0])
+
+    assert client.get(f"/api/jds/{jd['id']}/applications?limit=0").status_code == 400
+    assert client.get(f"/api/jds/{jd['id']}/applications?limit=5000").status_code == 400
+    assert client.get(f"/api/jds/{jd['id']}/applications?limit=abc").status_code == 400
+    assert client.get(f"/api/jds/{jd['id']}/applications?offset=-1").status_code == 400
+
+
+def _walk(client, url, limit):
+    pages = []
+    response = client.get(f"{url}&limit={limit}")
+    while True:
+        assert response.status_code == 200
+        pages.append(response.get_json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+        response = client.get(f"{url}&limit={limit}&cursor={cursor}")
+
+
+def test_list_applications_cursor_pages_match_full_listing(client):
+    jd = _seed_scored_applications(client, [40.0, None, 90.0, 70.0, 70.0, None, 10.0])
+
+    for sort in ("score_desc", "score_asc"):
+        url = f"/api/jds/{jd['id']}/applications?sort={sort}"
+        everything = client.get(url).get_json()
+        for limit in (1, 2, 3):
+            pages = _walk(client, url, limit)
+            assert [item for page in pages for item in page] == everything
+            assert all(len(page) == limit for page in pages[:-1])
+
+
+def test_list_applications_cursor_with_python_filters(client):
+    jd = _seed_scored_applications(client, [40.0, None, 90.0, 70.0, 70.0, 10.0])
+    url = f"/api/jds/{jd['id']}/applications?min_experience=2"
+
+    pages = _walk(client, url, 2)
+
+    assert [[item["total_score"] for item in page] for page in pages] == [[90.0, 70.0], [70.0, 10.0], [None]]
+
+
+def test_list_applications_rejects_foreign_or_combined_cursor(client):
+    jd = _seed_scored_applications(client, [50.0, 40.0])
+    other = _seed_scored_applications(client, [50.0, 40.0])
+    cursor = client.get(f"/api/jds/{jd['id']}/applications?limit=1").headers["X-Next-Cursor"]
+
+    assert client.get(f"/api/jds/{jd['id']}/applications?cursor={cursor}").status_code == 200
+    assert client.get(f"/api/jds/{jd['id']}/applications?sort=score_asc&cursor={cursor}").status_code == 400
+    assert client.get(f"/api/jds/{other['id']}/applications?cursor={cursor}").status_code == 400
+    assert client.get(f"/api/jds/{jd['id']}/applications?cursor={cursor}&offset=1").status_code == 400
@@ -1,3 +1,8 @@
+from app.extensions import db
+from app.models.job_description import JobDescription
+from app.services.pagination import DEFAULT_PAGE_SIZE
+
+
 def test_list_jds_returns_array(client):
     client.post("/api/jds", json={"title": "JD 1", "text": "Skill A"})
     client.post("/api/jds", json={"title": "JD 2", "text": "Skill B"})
@@ -8,3 +13,59 @@ def test_list_jds_returns_array(client):
     body = response.get_json()
     assert isinstance(body, list)
     assert len(body) == 2
+
+
+def test_list_jds_is_unbounded_without_limit_or_cursor(app, client):
+    count = DEFAULT_PAGE_SIZE + 5
+    with app.app_context():
+        db.session.add_all(JobDescription(title=f"JD {index}", text="Skill") for index in range(count))
+        db.session.commit()
+
+    everything = client.get("/api/jds")
+    assert len(everything.get_json()) == count
+    assert "X-Next-Cursor" not in everything.headers
+
+    # A cursor without a limit pages by the default page size.
+    cursor = client.get("/api/jds?limit=3").headers["X-Next-Cursor"]
+    page = client.get(f"/api/jds?cursor={cursor}")
+    assert len(page.get_json()) == DEFAULT_PAGE_SIZE
+    assert "X-Next-Cursor" in page.headers
+
+
+def _walk(client, url):
+    pages = []
+    while True:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append([item["title"] for item in response.get_json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+        url = f"/api/jds?limit=2&cursor={cursor}"
+
+
+def test_list_jds_cursor_pages_newest_first(client):
+    for index in range(5):
+        client.post("/api/jds", json={"title": f"JD {index}", "text": "Skill"})
+
+    pages = _walk(client, "/api/jds?limit=2")
+
+    assert pages == [["JD 4", "JD 3"], ["JD 2", "JD 1"], ["JD 0"]]
+
+
+def test_list_jds_cursor_is_stable_under_inserts(client):
+    for index in range(4):
+        client.post("/api/jds", json={"title": f"JD {index}", "text": "Skill"})
+
+    first = client.get("/api/jds?limit=2")
+    client.post("/api/jds", json={"title": "JD new", "text": "Skill"})
+    second = client.get(f"/api/jds?limit=2&cursor={first.headers['X-Next-Cursor']}")
+
+    assert [item["title"] for item in second.get_json()] == ["JD 1", "JD 0"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_list_jds_rejects_invalid_limit_and_cursor(client):
+    assert client.get("/api/jds?limit=0").status_code == 400
+    assert client.get("/api/jds?limit=5000").status_code == 400
+    assert client.get("/api/jds?cursor=not-a-cursor").status_code == 400
@@ -0,0 +1,128 @@
+import io
+import random
+
+import pytest
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.candidate_features import CandidateFeatures
+from app.models.job_description import JobDescription
+from app.routes import job_descriptions
+from app.services.candidate_features import get_candidate_features, resolve_profile_term_ids
+from app.services import candidate_index
+from app.services.candidate_index import find_top_matches
+from app.services.jd_profiles import get_jd_profile
+from app.services.scoring import score_features_against_profile
+from app.services.taxonomy import compile_taxonomy, init_skill_taxonomy
+
+WORDS = "python flask django postgresql react docker aws kubernetes spark java go rust sql".split()
+
+
+def _upload(client, text, full_name=None):
+    data = {"resume": (io.BytesIO(b"resume"), "resume.txt"), "extracted_text": text}
+    if full_name:
+        data["full_name"] = full_name
+    return client.post(
+        "/api/candidates/upload", data=data, content_type="multipart/form-data"
+    ).get_json()["candidate"]
+
+
+def test_matches_returns_best_candidates_and_skips_unrelated(client):
+    jd = client.post(
+        "/api/jds", json={"title": "Backend", "text": "Python Flask PostgreSQL 3 years Bachelor"}
+    ).get_json()
+    strong = _upload(client, "python flask postgresql 5 years bachelor", full_name="Strong")
+    weak = _upload(client, "python 1 years")
+    _upload(client, "watercolour painting")
+
+    response = client.get(f"/api/jds/{jd['id']}/matches?k=5")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [match["candidate_id"] for match in body["matches"]] == [strong["id"], weak["id"]]
+    assert body["matches"][0]["full_name"] == "Strong"
+    assert body["matches"][0]["total_score"] > body["matches"][1]["total_score"]
+    assert "skills" in body["matches"][0]["score_breakdown_json"]
+
+
+@pytest.mark.parametrize("block_size, batch_size, aliases", [(512, 256, False), (2, 3, False), (512, 256, True)])
+def test_matches_agree_with_exhaustive_scoring(app, client, monkeypatch, tmp_path, block_size, batch_size, aliases):
+    monkeypatch.setattr(candidate_index, "POSTING_BLOCK_SIZE", block_size)
+    monkeypatch.setattr(candidate_index, "FEATURE_BATCH_SIZE", batch_size)
+    words_pool = WORDS
+    if aliases:
+        # "py3" matches the skill "python" through the taxonomy but is not the term "python".
+        path = tmp_path / "skills.bin"
+        compile_taxonomy({"python": {"py3"}, "sql": set(), "docker": set(), "aws": set(), "flask": set()}, str(path))
+        app.config["SKILL_TAXONOMY_PATH"] = str(path)
+        init_skill_taxonomy(app)
+        # Weighted so that candidates with only the alias are common.
+        words_pool = WORDS + ["py3", "py3"]
+    rng = random.Random(11)
+    for _ in range(80 if aliases else 60):
+        words = rng.sample(words_pool, rng.randrange(1, 8))
+        if rng.random() < 0.6:
+            words.append(f"{rng.randrange(1, 10)} years")
+        if rng.random() < 0.4:
+            words.append("bachelor")
+        _upload(client, " ".join(words))
+    jd_text = "Python SQL Docker AWS Flask" if aliases else "Python Spark SQL AWS 4 years Bachelor"
+    jd = client.post("/api/jds", json={"title": "Data", "text": jd_text}).get_json()
+
+    with app.app_context():
+        profile = get_jd_profile(db.session.get(JobDescription, jd["id"]))
+        jd_term_ids = resolve_profile_term_ids(profile)
+        exhaustive = []
+        for candidate in Candidate.query.all():
+            record = get_candidate_features(candidate)
+            if not any(record.has_term_id(term_id) for term_id in jd_term_ids.values()):
+                continue
+            exhaustive.append(score_features_against_profile(record, profile, jd_term_ids).total_score)
+        exhaustive.sort(reverse=True)
+
+        search = find_top_matches(profile, k=10)
+
+        assert [scored.total_score for _, scored in search.matches] == exhaustive[:10]
+        assert search.evaluated <= len(exhaustive)
+
+
+def test_matches_score_candidates_with_stale_features_from_text(app, client):
+    jd = client.post("/api/jds", json={"title": "Backend", "text": "Python Flask"}).get_json()
+    stale = _upload(client, "python flask")
+    current = _upload(client, "python")
+    expected = client.get(f"/api/jds/{jd['id']}/matches").get_json()["matches"]
+    with app.app_context():
+        db.session.query(CandidateFeatures).filter_by(candidate_id=stale["id"]).update({"feature_version": "0"})
+        db.session.commit()
+
+    body = client.get(f"/api/jds/{jd['id']}/matches").get_json()
+
+    assert [match["candidate_id"] for match in body["matches"]] == [stale["id"], current["id"]]
+    assert body["matches"] == expected
+    assert body["candidates_scored_from_text"] == 1
+
+
+def test_matches_skip_candidates_deleted_after_the_index_scan(app, client, monkeypatch):
+    jd = client.post("/api/jds", json={"title": "Backend", "text": "Python Flask"}).get_json()
+    deleted = _upload(client, "python flask")
+    kept = _upload(client, "python")
+
+    def find_then_delete(profile, k):
+        search = find_top_matches(profile, k=k)
+        db.session.query(CandidateFeatures).filter_by(candidate_id=deleted["id"]).delete()
+        db.session.query(Candidate).filter_by(id=deleted["id"]).delete()
+        return search
+
+    monkeypatch.setattr(job_descriptions, "find_top_matches", find_then_delete)
+    response = client.get(f"/api/jds/{jd['id']}/matches")
+
+    assert response.status_code == 200
+    assert [match["candidate_id"] for match in response.get_json()["matches"]] == [kept["id"]]
+
+
+def test_matches_validation(client):
+    jd = client.post("/api/jds", json={"title": "Backend", "text": "Python"}).get_json()
+
+    assert client.get(f"/api/jds/{jd['id']}/matches?k=0").status_code == 400
+    assert client.get(f"/api/jds/{jd['id']}/matches?k=abc").status_code == 400
+    assert client.get("/api/jds/99999/matches").status_code == 404
@@ -0,0 +1,133 @@
+import io
+
+from app.extensions import db
+from app.models.application import Application
+from app.services import batch_scoring
+
+
+def _seed_scored_jd(client):
+    jd = client.post(
+        "/api/jds",
+        json={"title": "Backend Engineer", "text": "Python Flask PostgreSQL 5 years Master"},
+    ).get_json()
+
+    texts = [
+        "python flask postgresql 1 years",
+        "java 10 years master",
+        "python 3 years bachelor",
+    ]
+    application_ids = []
+    for index, text in enumerate(texts):
+        candidate = client.post(
+            "/api/candidates/upload",
+            data={"resume": (io.BytesIO(b"resume"), f"cv{index}.txt"), "extracted_text": text},
+            content_type="multipart/form-data",
+        ).get_json()["candidate"]
+        application_ids.append(
+            client.post(
+                "/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"]}
+            ).get_json()["id"]
+        )
+
+    client.post(f"/api/jds/{jd['id']}/score-all", json={})
+    return jd, application_ids
+
+
+def _stored_scores(client, jd_id):
+    return {item["id"]: item["total_score"] for item in client.get(f"/api/jds/{jd_id}/applications").get_json()}
+
+
+def test_rerank_recomputes_ranking_without_persisting(client):
+    jd, application_ids = _seed_scored_jd(client)
+    before = _stored_scores(client, jd["id"])
+
+    response = client.post(
+        f"/api/jds/{jd['id']}/rerank",
+        json={"weights": {"skills": 0, "experience": 1, "education": 0, "keywords": 0}, "top_n": 2},
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["reranked"] == 3
+    assert body["committed"] is False
+    assert [item["rank"] for item in body["ranking"]] == [1, 2]
+    assert body["ranking"][0]["application_id"] == application_ids[1]
+    assert body["ranking"][0]["total_score"] == 100.0
+    assert body["ranking"][0]["previous_total_score"] == before[application_ids[1]]
+    assert _stored_scores(client, jd["id"]) == before
+
+
+def test_rerank_matches_full_rescore_and_commits(client):
+    jd, application_ids = _seed_scored_jd(client)
+    weights = {"skills": 0.7, "experience": 0.1, "education": 0.1, "keywords": 0.1}
+
+    reranked = client.post(
+        f"/api/jds/{jd['id']}/rerank", json={"weights": weights, "top_n": 10, "commit": True}
+    ).get_json()
+    committed = _stored_scores(client, jd["id"])
+    assert {item["application_id"]: item["total_score"] for item in reranked["ranking"]} == committed
+
+    client.post(f"/api/jds/{jd['id']}/score-all", json={"weights": weights})
+    rescored = _stored_scores(client, jd["id"])
+    for application_id in application_ids:
+        assert abs(committed[application_id] - rescored[application_id]) <= 0.02
+
+
+def test_rerank_commit_skips_applications_deleted_meanwhile(client, monkeypatch):
+    jd, application_ids = _seed_scored_jd(client)
+    reweight = batch_scoring.reweight
+
+    def reweight_then_delete(matrix, weights):
+        # Deleted after the ranking was read, before the commit re-reads the rows.
+        db.session.query(Application).filter(Application.id == application_ids[0]).delete()
+        return reweight(matrix, weights)
+
+    monkeypatch.setattr(batch_scoring, "reweight", reweight_then_delete)
+    weights = {"skills": 0, "experience": 1, "education": 0, "keywords": 0}
+    response = client.post(f"/api/jds/{jd['id']}/rerank", json={"weights": weights, "commit": True})
+
+    assert response.status_code == 200
+    assert response.get_json()["reranked"] == 2
+    assert set(_stored_scores(client, jd["id"])) == set(application_ids[1:])
+
+
+def test_rerank_commit_totals_follow_breakdowns_rescored_meanwhile(client, monkeypatch):
+    jd, application_ids = _seed_scored_jd(client)
+    reweight = batch_scoring.reweight
+
+    def reweight_then_rescore(matrix, weights):
+        # A concurrent rescore rewrites a breakdown after the ranking was read.
+        application = db.session.get(Application, application_ids[0])
+        breakdown = dict(application.score_breakdown_json)
+        breakdown["experience"] = {**breakdown["experience"], "score": 40.0}
+        application.score_breakdown_json = breakdown
+        db.session.commit()
+        return reweight(matrix, weights)
+
+    monkeypatch.setattr(batch_scoring, "reweight", reweight_then_rescore)
+    weights = {"skills": 0, "experience": 1, "education": 0, "keywords": 0}
+    response = client.post(f"/api/jds/{jd['id']}/rerank", json={"weights": weights, "commit": True})
+
+    assert response.status_code == 200
+    assert response.get_json()["reranked"] == 3
+    assert _stored_scores(client, jd["id"])[application_ids[0]] == 40.0
+
+
+def test_rerank_skips_unscored_and_validates(client):
+    jd = client.post("/api/jds", json={"title": "Backend", "text": "Python"}).get_json()
+    candidate = client.post(
+        "/api/candidates/upload",
+        data={"resume": (io.BytesIO(b"resume"), "cv.txt")},
+        content_type="multipart/form-data",
+    ).get_json()["candidate"]
+    client.post("/api/applications", json={"candidate_id": candidate["id"], "jd_id": jd["id"]})
+
+    body = client.post(f"/api/jds/{jd['id']}/rerank", json={"weights": {"skills": 1}}).get_json()
+    assert body["reranked"] == 0
+    assert body["unscored"] == 1
+    assert body["ranking"] == []
+
+    assert client.post(f"/api/jds/{jd['id']}/rerank", json={}).status_code == 400
+    assert client.post(f"/api/jds/{jd['id']}/rerank", json={"weights": {}, "top_n": 0}).status_code == 400
+    assert client.post(f"/api/jds/{jd['id']}/rerank", json={"weights": {}, "commit": "yes"}).status_code == 400
+    assert client.post("/api/jds/99999/rerank", json={"weights": {}}).status_code == 404
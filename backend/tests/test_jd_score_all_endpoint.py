@@ -0,0 +1,131 @@
+import io
+
+from app.extensions import db
+from app.models.application import Application
+from app.services import batch_scoring
+
+
+def _seed_jd_with_applications(client, count=3):
+    jd = client.post(
+        "/api/jds",
+        json={"title": "Backend Engineer", "text": "Python Flask PostgreSQL 3 years Bachelor"},
+    ).get_json()
+
+    application_ids = []
+    for index in range(count):
+        candidate = client.post(
+            "/api/candidates/upload",
+            data={
+                "resume": (io.BytesIO(b"resume"), f"candidate{index}.txt"),
+                "extracted_text": f"Python Flask {index + 1} years Bachelor",
+                "profile_json": f'{{"skills": ["python", "flask"], "years_experience": {index + 1}}}',
+            },
+            content_type="multipart/form-data",
+        ).get_json()["candidate"]
+        application = client.post(
+            "/api/applications",
+            json={"candidate_id": candidate["id"], "jd_id": jd["id"]},
+        ).get_json()
+        application_ids.append(application["id"])
+
+    return jd, application_ids
+
+
+def test_score_all_scores_every_application_in_chunks(client):
+    jd, application_ids = _seed_jd_with_applications(client, count=3)
+
+    response = client.post(f"/api/jds/{jd['id']}/score-all", json={"chunk_size": 2})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["jd_id"] == jd["id"]
+    assert body["scored"] == 3
+    assert body["chunks"] == 2
+    assert isinstance(body["duration_ms"], float)
+
+    listed = client.get(f"/api/jds/{jd['id']}/applications").get_json()
+    assert {item["id"] for item in listed} == set(application_ids)
+    assert all(item["total_score"] is not None for item in listed)
+    assert all("skills" in item["score_breakdown_json"] for item in listed)
+
+
+def test_score_all_matches_single_application_scoring(client):
+    jd, application_ids = _seed_jd_with_applications(client, count=2)
+    weights = {"skills": 1, "experience": 1, "education": 0, "keywords": 0}
+
+    client.post(f"/api/jds/{jd['id']}/score-all", json={"weights": weights})
+    batch_scores = {
+        item["id"]: item["total_score"]
+        for item in client.get(f"/api/jds/{jd['id']}/applications").get_json()
+    }
+
+    for application_id in application_ids:
+        single = client.post(
+            "/api/applications/score",
+            json={"application_id": application_id, "weights": weights},
+        ).get_json()
+        assert single["total_score"] == batch_scores[application_id]
+
+
+def test_score_all_skips_applications_deleted_while_scoring(client, monkeypatch):
+    jd, application_ids = _seed_jd_with_applications(client, count=3)
+    update_scores = batch_scoring._update_scores
+
+    def delete_then_update(rows):
+        # Deleted after the chunk was read, before its scores are written.
+        db.session.query(Application).filter(Application.id == application_ids[1]).delete()
+        return update_scores(rows)
+
+    monkeypatch.setattr(batch_scoring, "_update_scores", delete_then_update)
+    response = client.post(f"/api/jds/{jd['id']}/score-all", json={})
+
+    assert response.status_code == 200
+    assert response.get_json()["scored"] == 2
+    listed = client.get(f"/api/jds/{jd['id']}/applications").get_json()
+    assert {item["id"] for item in listed} == {application_ids[0], application_ids[2]}
+    assert all(item["total_score"] is not None for item in listed)
+
+
+def test_score_all_validation_and_not_found(client):
+    jd, _ = _seed_jd_with_applications(client, count=1)
+
+    bad_chunk = client.post(f"/api/jds/{jd['id']}/score-all", json={"chunk_size": 0})
+    assert bad_chunk.status_code == 400
+
+    bad_weights = client.post(f"/api/jds/{jd['id']}/score-all", json={"weights": [1, 2]})
+    assert bad_weights.status_code == 400
+
+    missing = client.post("/api/jds/99999/score-all", json={})
+    assert missing.status_code == 404
+    assert "error" in missing.get_json()
+
+
+def test_score_jd_cli_command(app, client):
+    jd, _ = _seed_jd_with_applications(client, count=2)
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["score-jd", str(jd["id"]), "--chunk-size", "1"])
+
+    assert result.exit_code == 0
+    assert "scored 2 applications" in result.output
+
+    missing = runner.invoke(args=["score-jd", "99999"])
+    assert missing.exit_code != 0
+
+
+def test_score_all_numpy_engine_matches_python_engine(client):
+    jd, _ = _seed_jd_with_applications(client, count=3)
+
+    client.post(f"/api/jds/{jd['id']}/score-all", json={"engine": "python"})
+    python_scores = client.get(f"/api/jds/{jd['id']}/applications").get_json()
+
+    response = client.post(f"/api/jds/{jd['id']}/score-all", json={"engine": "numpy"})
+    assert response.status_code == 200
+    numpy_scores = client.get(f"/api/jds/{jd['id']}/applications").get_json()
+
+    assert [(item["id"], item["total_score"], item["score_breakdown_json"]) for item in numpy_scores] == [
+        (item["id"], item["total_score"], item["score_breakdown_json"]) for item in python_scores
+    ]
+
+    bad_engine = client.post(f"/api/jds/{jd['id']}/score-all", json={"engine": "gpu"})
+    assert bad_engine.status_code == 400
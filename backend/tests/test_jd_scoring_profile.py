@@ -0,0 +1,52 @@
+from app.extensions import db
+from app.models.job_description import JobDescription
+from app.services.jd_profiles import JDProfileCache, get_jd_profile
+from app.services.scoring import SCORER_VERSION, compile_jd_profile, jd_text_hash
+
+
+def test_create_jd_persists_compiled_profile(app, client):
+    text = "Python Flask PostgreSQL 3 years Bachelor"
+    jd = client.post("/api/jds", json={"title": "Backend Engineer", "text": text}).get_json()
+
+    with app.app_context():
+        row = db.session.get(JobDescription, jd["id"])
+        assert row.text_hash == jd_text_hash(text)
+        assert row.scorer_version == SCORER_VERSION
+        assert row.scoring_profile_json["required_years"] == 3
+        assert row.scoring_profile_json["required_education"] == "bachelor"
+        assert "python" in row.scoring_profile_json["skill_terms"]
+
+
+def test_get_jd_profile_uses_cache_and_recompiles_stale_rows(app, client):
+    jd = client.post(
+        "/api/jds", json={"title": "Data Engineer", "text": "Python Spark 5 years Master"}
+    ).get_json()
+
+    with app.app_context():
+        row = db.session.get(JobDescription, jd["id"])
+        first = get_jd_profile(row)
+        assert get_jd_profile(row) is first
+        assert first == compile_jd_profile(row.text)
+
+        row.scorer_version = "0"
+        row.scoring_profile_json = None
+        db.session.commit()
+
+        refreshed = get_jd_profile(row)
+        db.session.commit()
+        assert refreshed == first
+        assert db.session.get(JobDescription, jd["id"]).scorer_version == SCORER_VERSION
+
+
+def test_jd_profile_cache_evicts_least_recently_used():
+    cache = JDProfileCache(maxsize=2)
+    profile = compile_jd_profile("Python")
+
+    cache.put((1, "a", SCORER_VERSION), profile)
+    cache.put((2, "b", SCORER_VERSION), profile)
+    assert cache.get((1, "a", SCORER_VERSION)) is profile
+    cache.put((3, "c", SCORER_VERSION), profile)
+
+    assert len(cache) == 2
+    assert cache.get((2, "b", SCORER_VERSION)) is None
+    assert cache.get((1, "a", SCORER_VERSION)) is profile
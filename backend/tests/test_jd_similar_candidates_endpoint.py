@@ -0,0 +1,53 @@
+import io
+
+from app.services.minhash import MinHasher, band_keys, estimate_jaccard, lsh_threshold
+
+
+def _upload(client, text):
+    return client.post(
+        "/api/candidates/upload",
+        data={"resume": (io.BytesIO(b"resume"), "cv.txt"), "extracted_text": text},
+        content_type="multipart/form-data",
+    ).get_json()["candidate"]
+
+
+def test_similar_candidates_found_through_lsh(app, client):
+    app.config["MINHASH_ENABLED"] = True
+    jd_text = "python flask postgresql docker kubernetes aws terraform grafana"
+    jd = client.post("/api/jds", json={"title": "Platform", "text": jd_text}).get_json()
+    close = _upload(client, jd_text + " react")
+    _upload(client, "watercolour oil painting gallery curation")
+
+    response = client.get(f"/api/jds/{jd['id']}/similar-candidates?threshold=0.5")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [item["candidate_id"] for item in body["candidates"]] == [close["id"]]
+    assert body["candidates"][0]["estimated_jaccard"] >= 0.5
+    assert body["lsh"] == {"num_perm": 128, "bands": 64, "threshold": 0.125}
+
+
+def test_similar_candidates_disabled_and_validation(app, client):
+    jd = client.post("/api/jds", json={"title": "Platform", "text": "python"}).get_json()
+
+    disabled = client.get(f"/api/jds/{jd['id']}/similar-candidates")
+    assert disabled.status_code == 400
+
+    app.config["MINHASH_ENABLED"] = True
+    assert client.get(f"/api/jds/{jd['id']}/similar-candidates?threshold=2").status_code == 400
+    assert client.get(f"/api/jds/{jd['id']}/similar-candidates?limit=x").status_code == 400
+    assert client.get("/api/jds/99999/similar-candidates").status_code == 404
+
+
+def test_minhash_estimate_tracks_exact_jaccard():
+    hasher = MinHasher(num_perm=256)
+    left = {f"term{i}" for i in range(200)}
+    right = {f"term{i}" for i in range(100, 300)}
+    exact = len(left & right) / len(left | right)
+
+    estimate = estimate_jaccard(hasher.signature(left), hasher.signature(right))
+
+    assert abs(estimate - exact) < 0.1
+    assert estimate_jaccard(hasher.signature(left), hasher.signature(left)) == 1.0
+    assert band_keys(hasher.signature(left), 64) == band_keys(MinHasher(256).signature(left), 64)
+    assert round(lsh_threshold(128, 32), 3) == 0.42
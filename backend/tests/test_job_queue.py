@@ -0,0 +1,152 @@
+from datetime import UTC, datetime, timedelta
+
+from app.extensions import db
+from app.models.processing_job import ProcessingJob
+from app.services import worker
+from app.services.job_queue import (
+    DEAD,
+    PermanentJobError,
+    cancel_job,
+    claim_next_job,
+    complete_job,
+    enqueue_job,
+    reap_expired_jobs,
+    requeue_job,
+)
+from app.services.worker import execute_job, run_pending_jobs
+
+
+def _enqueue(job_type="test", max_attempts=3):
+    job = enqueue_job(job_type, "test", 1, max_attempts=max_attempts)
+    db.session.commit()
+    return job.id
+
+
+def test_claims_are_exclusive_and_ordered(app):
+    with app.app_context():
+        first_id = _enqueue()
+        second_id = _enqueue()
+
+        first = claim_next_job("worker-a")
+        second = claim_next_job("worker-b")
+
+        assert (first.id, second.id) == (first_id, second_id)
+        assert first.locked_by == "worker-a"
+        assert first.status == "processing"
+        assert first.attempts == 1
+        assert claim_next_job("worker-c") is None
+
+
+def test_expired_lease_is_reclaimed(app):
+    with app.app_context():
+        job_id = _enqueue()
+        claim_next_job("worker-a", lease_seconds=1)
+        job = db.session.get(ProcessingJob, job_id)
+        job.lease_expires_at = datetime.now(UTC) - timedelta(seconds=1)
+        db.session.commit()
+
+        reclaimed = claim_next_job("worker-b")
+
+        assert reclaimed.id == job_id
+        assert reclaimed.locked_by == "worker-b"
+        assert reclaimed.attempts == 2
+        # The first worker lost its lease, so its late completion is ignored.
+        assert complete_job(job_id, "worker-a") == "processing"
+
+
+def test_failed_job_is_retried_with_backoff_then_dead_lettered(app, monkeypatch):
+    calls = []
+
+    def flaky(job):
+        calls.append(job.attempts)
+        raise RuntimeError("parser crashed")
+
+    monkeypatch.setitem(worker.JOB_HANDLERS, "test", flaky)
+    app.config["JOB_RETRY_BACKOFF_SECONDS"] = 0
+
+    with app.app_context():
+        job_id = _enqueue(max_attempts=2)
+
+        assert execute_job(claim_next_job("w"), "w") == "queued"
+        job = db.session.get(ProcessingJob, job_id)
+        assert job.error_message == "RuntimeError: parser crashed"
+
+        assert execute_job(claim_next_job("w"), "w") == DEAD
+        assert calls == [1, 2]
+        assert claim_next_job("w") is None
+
+        assert requeue_job(db.session.get(ProcessingJob, job_id))
+        assert claim_next_job("w").attempts == 1
+
+
+def test_backoff_delays_next_attempt(app, monkeypatch):
+    monkeypatch.setitem(worker.JOB_HANDLERS, "test", lambda job: 1 / 0)
+    app.config["JOB_RETRY_BACKOFF_SECONDS"] = 60
+
+    with app.app_context():
+        job_id = _enqueue()
+        run_pending_jobs()
+
+        job = db.session.get(ProcessingJob, job_id)
+        assert job.status == "queued"
+        assert job.run_after > datetime.now(UTC).replace(tzinfo=None) + timedelta(seconds=30)
+        assert claim_next_job("w") is None
+
+
+def test_permanent_error_skips_retries(app, monkeypatch):
+    def broken(job):
+        raise PermanentJobError("unsupported file")
+
+    monkeypatch.setitem(worker.JOB_HANDLERS, "test", broken)
+
+    with app.app_context():
+        job_id = _enqueue()
+        run_pending_jobs()
+
+        job = db.session.get(ProcessingJob, job_id)
+        assert (job.status, job.attempts, job.error_message) == (DEAD, 1, "unsupported file")
+
+
+def test_cancel_queued_and_running_jobs(app, monkeypatch):
+    with app.app_context():
+        queued_id = _enqueue()
+        running_id = _enqueue()
+        db.session.get(ProcessingJob, running_id).run_after = datetime.now(UTC) - timedelta(minutes=1)
+        db.session.commit()
+
+        running = claim_next_job("w")
+        assert running.id == running_id
+        assert cancel_job(db.session.get(ProcessingJob, queued_id))
+        assert db.session.get(ProcessingJob, queued_id).status == "cancelled"
+
+        def handler(job):
+            job.error_message = "handler side effect"
+            assert cancel_job(db.session.get(ProcessingJob, job.id))
+
+        monkeypatch.setitem(worker.JOB_HANDLERS, "test", handler)
+        assert execute_job(running, "w") == "cancelled"
+        assert not cancel_job(db.session.get(ProcessingJob, running_id))
+
+
+def test_reap_dead_letters_expired_final_attempt(app):
+    with app.app_context():
+        job_id = _enqueue(max_attempts=1)
+        claim_next_job("w")
+        job = db.session.get(ProcessingJob, job_id)
+        job.lease_expires_at = datetime.now(UTC) - timedelta(seconds=1)
+        db.session.commit()
+
+        assert reap_expired_jobs() == 1
+        assert db.session.get(ProcessingJob, job_id).status == DEAD
+
+
+def test_cancel_and_retry_endpoints(app, client):
+    with app.app_context():
+        job_id = _enqueue()
+
+    response = client.post(f"/api/processing-jobs/{job_id}/cancel")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "cancelled"
+    assert client.post(f"/api/processing-jobs/{job_id}/cancel").status_code == 409
+    assert client.post(f"/api/processing-jobs/{job_id}/retry").status_code == 409
+    assert client.post("/api/processing-jobs/9999/cancel").status_code == 404
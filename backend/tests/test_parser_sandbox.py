@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.processing_job import ProcessingJob
+from app.services.candidate_processing import enqueue_candidate_processing
+from app.services.job_queue import DEAD
+from app.services.parser_sandbox import ParserCrashed, ParserSandbox, ParseTimeout, init_parser_sandbox
+from app.services.worker import run_pending_jobs
+
+
+@pytest.fixture
+def sandbox():
+    sandbox = ParserSandbox(1, timeout=5)
+    yield sandbox
+    sandbox.close()
+
+
+def _fifo(tmp_path):
+    # Reading a FIFO nobody writes to blocks forever, like a parser stuck on a hostile file.
+    path = tmp_path / "stuck.txt"
+    os.mkfifo(path)
+    return str(path)
+
+
+def test_sandbox_parses_like_in_process(sandbox, tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_text("Python Flask 5 years")
+
+    assert sandbox.parse(str(path)) == "Python Flask 5 years"
+    assert sandbox.parse(str(path), max_chars=6) == "Python"
+    with pytest.raises(FileNotFoundError):
+        sandbox.parse(str(tmp_path / "missing.txt"))
+
+
+def test_timeout_kills_and_replaces_the_child(tmp_path):
+    sandbox = ParserSandbox(1, timeout=1)
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Docker")
+    try:
+        with pytest.raises(ParseTimeout, match="timed out after 1s"):
+            sandbox.parse(_fifo(tmp_path))
+
+        assert sandbox.parse(str(resume)) == "Docker"
+    finally:
+        sandbox.close()
+
+
+def test_crashed_child_is_replaced(sandbox, tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_text("Kubernetes")
+    sandbox.parse(str(path))
+
+    child = sandbox._idle.get_nowait()
+    child.process.kill()
+    child.process.join()
+    sandbox._idle.put(child)
+
+    with pytest.raises(ParserCrashed):
+        sandbox.parse(str(path))
+    assert sandbox.parse(str(path)) == "Kubernetes"
+
+
+def test_map_reports_errors_per_file(sandbox, tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_text("SQL")
+
+    results = sandbox.map([str(path), str(tmp_path / "missing.txt")])
+
+    assert results[0] == ("SQL", None)
+    assert results[1][0] is None
+    assert results[1][1].startswith("FileNotFoundError")
+
+
+def test_parse_timeout_dead_letters_the_processing_job(app, tmp_path):
+    app.config.update(PARSER_SANDBOX_PROCESSES=1, PARSER_TIMEOUT_SECONDS=1)
+    init_parser_sandbox(app)
+    try:
+        with app.app_context():
+            candidate = Candidate(full_name="Stuck", resume_filename="stuck.txt", resume_path=_fifo(tmp_path))
+            db.session.add(candidate)
+            db.session.commit()
+            job = enqueue_candidate_processing(candidate)
+            db.session.commit()
+
+            run_pending_jobs()
+
+            job = db.session.get(ProcessingJob, job.id)
+            assert job.status == DEAD
+            assert job.attempts == 1
+            assert job.error_message == "resume parsing timed out after 1s"
+    finally:
+        app.extensions["parser_sandbox"].close()
@@ -0,0 +1,87 @@
+import random
+
+from app.services.parse_cache import parse_resume
+from app.services.resume_parser import (
+    extract_profile_from_text,
+    iter_resume_text,
+    parse_resume_file,
+    parse_resume_with_features,
+)
+from app.services.text_features import FeatureExtractor, extract_text_features
+from benchmarks.corpus import build_pdf, generate_pdf_resume
+
+
+def _write_pdf(tmp_path, pages, name="resume.pdf"):
+    path = tmp_path / name
+    path.write_bytes(build_pdf(pages))
+    return str(path)
+
+
+def test_pdf_pages_are_yielded_in_order(tmp_path):
+    path = _write_pdf(tmp_path, [f"Page {number} python" for number in range(1, 4)])
+
+    pages = list(iter_resume_text(path))
+
+    assert [page.strip() for page in pages] == ["Page 1 python", "Page 2 python", "Page 3 python"]
+    assert parse_resume_file(path) == "\n".join(pages).strip()
+
+
+def test_page_parallel_extraction_matches_serial(tmp_path):
+    path = tmp_path / "long.pdf"
+    path.write_bytes(generate_pdf_resume(random.Random(3), 12, chars_per_page=600))
+
+    serial = parse_resume_with_features(str(path))
+    parallel = parse_resume_with_features(str(path), workers=2)
+
+    assert parallel == serial
+    assert serial[1] == extract_text_features(serial[0])
+
+
+def test_page_and_character_budget(tmp_path):
+    path = _write_pdf(tmp_path, ["first page", "second page", "third page"])
+
+    assert parse_resume_file(path, max_pages=2).split("\n\n") == ["first page", "second page"]
+    # The first page is "first page\n", so 14 characters leave three of the second one.
+    assert parse_resume_file(path, max_chars=14).split("\n\n") == ["first page", "sec"]
+    assert parse_resume_file(str(_write_txt(tmp_path, "x" * 50)), max_chars=10) == "x" * 10
+
+
+def _write_txt(tmp_path, text):
+    path = tmp_path / "resume.txt"
+    path.write_text(text)
+    return path
+
+
+def test_incremental_features_match_whole_text_across_page_breaks():
+    rng = random.Random(11)
+    words = "machine learning python postgresql sql ci/cd 7 years 12+ years bachelor master phd node.js".split()
+    for _ in range(200):
+        pages = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 60))) for _ in range(rng.randint(1, 5))]
+        extractor = FeatureExtractor()
+        for page in pages:
+            extractor.feed(page)
+
+        incremental = extractor.result()
+        whole = extract_text_features("\n".join(pages))
+        assert (incremental.terms, set(incremental.skills)) == (whole.terms, set(whole.skills))
+        assert incremental.to_profile() == extract_profile_from_text("\n".join(pages))
+
+
+def test_incremental_features_do_not_match_inside_cut_words():
+    extractor = FeatureExtractor()
+    extractor.feed("a " * 200 + "postgresql")
+    extractor.feed("more text")
+
+    assert extractor.result().skills == ("postgresql",)
+    assert "sql" not in extractor.result().terms
+
+
+def test_parse_cache_applies_configured_budget(app, tmp_path):
+    path = _write_pdf(tmp_path, ["Python 5 years", "Docker", "Kubernetes"])
+    app.config["PDF_MAX_PAGES"] = 2
+
+    text, profile, _ = parse_resume(path)
+
+    assert text.split() == ["Python", "5", "years", "Docker"]
+    assert profile["skills"] == ["docker", "python"]
+    assert profile["years_experience"] == 5
@@ -0,0 +1,180 @@
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from app.extensions import db
+from app.models.user import User
+from app.services.auth import generate_access_token
+from app.services.worker import run_pending_jobs
+
+# Set to a disposable Postgres database to also check plans there, e.g.
+# postgresql://localhost/resume_ats_plans. Every table in it is dropped afterwards.
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+CHECKED_STATEMENTS = ("SELECT", "UPDATE", "DELETE")
+
+
+def _exercise_endpoints(app, client):
+    """Call every endpoint whose queries must be served by an index."""
+    client.post("/api/auth/bootstrap-admin", json={"username": "root", "password": "secret"})
+    client.post("/api/auth/login", json={"username": "root", "password": "secret"})
+
+    jd = client.post("/api/jds", json={"title": "Backend", "text": "Python SQL 3 years"}).get_json()
+    applications = []
+    for index in range(3):
+        candidate = client.post(
+            "/api/candidates/upload",
+            data={
+                "resume": (io.BytesIO(f"python sql {index + 2} years".encode()), f"c{index}.txt"),
+                "full_name": f"Candidate {index}",
+            },
+            content_type="multipart/form-data",
+        ).get_json()
+        client.post(f"/api/candidates/{candidate['candidate']['id']}/process", json={})
+        client.get(f"/api/processing-jobs/{candidate['job']['id']}")
+        application = client.post(
+            "/api/applications", json={"candidate_id": candidate["candidate"]["id"], "jd_id": jd["id"]}
+        ).get_json()
+        applications.append(application)
+    with app.app_context():
+        run_pending_jobs()
+
+    application_id = applications[0]["id"]
+    client.patch(f"/api/applications/{application_id}/status", json={"status": "shortlisted", "reviewed_by": "a"})
+    client.post(f"/api/applications/{application_id}/notes", json={"author_name": "a", "note_text": "good"})
+    client.post(f"/api/applications/{application_id}/notes", json={"author_name": "b", "note_text": "fine"})
+    client.get(f"/api/applications/{application_id}/notes")
+    _follow_cursor(client, f"/api/applications/{application_id}/notes?limit=1")
+
+    client.post("/api/jds", json={"title": "Frontend", "text": "React"})
+    client.get("/api/jds")
+    _follow_cursor(client, "/api/jds?limit=1")
+    client.get(f"/api/jds/{jd['id']}")
+    client.post(f"/api/jds/{jd['id']}/score-all", json={})
+    client.get(f"/api/jds/{jd['id']}/applications")
+    client.get(f"/api/jds/{jd['id']}/applications?sort=score_asc&limit=2")
+    _follow_cursor(client, f"/api/jds/{jd['id']}/applications?limit=1")
+    _follow_cursor(client, f"/api/jds/{jd['id']}/applications?sort=score_asc&limit=1")
+    client.get(f"/api/jds/{jd['id']}/applications?status=shortlisted&min_score=1")
+    client.get(f"/api/jds/{jd['id']}/applications?skills=python,sql&min_experience=3")
+    client.get(f"/api/jds/{jd['id']}/shortlist/export.csv")
+    client.get("/api/candidates/search?q=python+sql*")
+
+
+def _follow_cursor(client, url):
+    cursor = client.get(url).headers["X-Next-Cursor"]
+    client.get(f"{url}&cursor={cursor}")
+
+
+def _capture_statements(engine, statements):
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(CHECKED_STATEMENTS):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    return before_cursor_execute
+
+
+def _sqlite_full_scans(connection, statement, parameters) -> list[str]:
+    plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    # "SCAN t USING INDEX ..." walks an index in order; a bare "SCAN t" reads the whole table.
+    return [row[-1] for row in plan if re.fullmatch(r"SCAN \w+", row[-1])]
+
+
+def _postgres_full_scans(connection, statement, parameters) -> list[str]:
+    raw = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    plan = raw if isinstance(raw, list) else json.loads(raw)
+    scans = []
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan":
+            scans.append(f"Seq Scan on {node['Relation Name']}")
+        nodes.extend(node.get("Plans", []))
+    return scans
+
+
+def _assert_no_full_scans(app, statements, find_full_scans, setup_sql=()):
+    failures = []
+    with app.app_context(), db.engine.connect() as connection:
+        for sql in setup_sql:
+            connection.exec_driver_sql(sql)
+        for statement, parameters in statements:
+            scans = find_full_scans(connection, statement, parameters)
+            if scans:
+                failures.append(f"{', '.join(scans)}:\n{statement}")
+    assert statements
+    assert not failures, "full table scans:\n\n" + "\n\n".join(failures)
+
+
+def test_endpoint_queries_use_indexes_on_sqlite(app, client):
+    statements = []
+    with app.app_context():
+        engine = db.engine
+    listener = _capture_statements(engine, statements)
+    try:
+        _exercise_endpoints(app, client)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    _assert_no_full_scans(app, statements, _sqlite_full_scans)
+
+
+@pytest.fixture
+def postgres_app():
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    upload_dir = tempfile.mkdtemp(prefix="resume_ats_uploads_")
+    audit_dir = tempfile.mkdtemp(prefix="resume_ats_audit_")
+
+    class PostgresTestConfig:
+        TESTING = True
+        SECRET_KEY = "test-secret"
+        SQLALCHEMY_DATABASE_URI = POSTGRES_URL
+        SQLALCHEMY_TRACK_MODIFICATIONS = False
+        UPLOAD_DIR = upload_dir
+        AUDIT_LOG_PATH = os.path.join(audit_dir, "audit.log")
+        TOKEN_MAX_AGE_SECONDS = 28800
+        SWAGGER = {"title": "Resume ATS Scanner API (Test)", "uiversion": 3, "openapi": "3.0.2"}
+
+    app = create_app(PostgresTestConfig)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+    shutil.rmtree(upload_dir)
+    shutil.rmtree(audit_dir)
+
+
+def test_endpoint_queries_use_indexes_on_postgres(postgres_app):
+    with postgres_app.app_context():
+        user = User(username="admin", role="admin", is_active=True)
+        user.set_password("admin123")
+        db.session.add(user)
+        db.session.commit()
+        token = generate_access_token(user_id=user.id, role="admin")
+        engine = db.engine
+    client = postgres_app.test_client()
+    client.environ_base["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+
+    statements = []
+    listener = _capture_statements(engine, statements)
+    try:
+        _exercise_endpoints(postgres_app, client)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # Tiny test tables are always cheapest to read sequentially; with sequential scans
+    # priced out, one still appearing means no index can serve the query.
+    _assert_no_full_scans(postgres_app, statements, _postgres_full_scans, setup_sql=["SET enable_seqscan = off"])
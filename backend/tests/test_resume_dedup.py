@@ -0,0 +1,138 @@
+import hashlib
+import io
+import os
+
+from app.extensions import db
+from app.models.resume_blob import ResumeParse
+from app.services import bulk_upload, parse_cache
+from app.services.worker import run_pending_jobs
+
+RESUME = b"Python Flask PostgreSQL 7 years Master"
+RESUME_SHA256 = hashlib.sha256(RESUME).hexdigest()
+
+
+def _upload(client, content=RESUME, filename="resume.txt"):
+    return client.post(
+        "/api/candidates/upload",
+        data={"resume": (io.BytesIO(content), filename)},
+        content_type="multipart/form-data",
+    ).get_json()
+
+
+def test_identical_uploads_are_stored_once(app, client):
+    first = _upload(client)
+    second = _upload(client, filename="copy-of-resume.txt")
+
+    assert first["candidate"]["resume_sha256"] == RESUME_SHA256
+    assert first["deduplicated"] is False
+    assert second["deduplicated"] is True
+    assert first["candidate"]["id"] != second["candidate"]["id"]
+    assert first["candidate"]["resume_path"] == second["candidate"]["resume_path"]
+    assert os.path.basename(first["candidate"]["resume_path"]) == f"{RESUME_SHA256}.txt"
+    stored = [name for _, _, names in os.walk(app.config["UPLOAD_DIR"]) for name in names]
+    assert stored == [f"{RESUME_SHA256}.txt"]
+
+
+def test_head_precheck_and_upload_by_hash(client):
+    assert client.head(f"/api/resumes/{RESUME_SHA256}").status_code == 404
+    assert client.head("/api/resumes/not-a-hash").status_code == 400
+
+    _upload(client)
+    head = client.head(f"/api/resumes/{RESUME_SHA256.upper()}")
+    assert head.status_code == 200
+    assert head.headers["X-Resume-Size"] == str(len(RESUME))
+
+    response = client.post(
+        "/api/candidates/upload",
+        data={"resume_sha256": RESUME_SHA256, "full_name": "Repeat Applicant"},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body["candidate"]["resume_sha256"] == RESUME_SHA256
+    assert body["candidate"]["resume_filename"] == "resume.txt"
+
+    unknown = client.post(
+        "/api/candidates/upload", data={"resume_sha256": "0" * 64}, content_type="multipart/form-data"
+    )
+    assert unknown.status_code == 400
+
+
+def test_duplicate_upload_reuses_cached_parse(app, client, monkeypatch):
+    first = _upload(client)
+    with app.app_context():
+        run_pending_jobs()
+        assert ResumeParse.query.filter_by(content_sha256=RESUME_SHA256).count() == 1
+
+    def fail_parse(path, **options):
+        raise AssertionError("duplicate content must not be parsed again")
+
+    monkeypatch.setattr(parse_cache, "parse_resume_with_features", fail_parse)
+    second = _upload(client)
+    with app.app_context():
+        run_pending_jobs()
+
+    candidate = client.get(f"/api/candidates/{second['candidate']['id']}").get_json()
+    job = client.get(f"/api/processing-jobs/{second['job']['id']}").get_json()
+    assert job["status"] == "completed"
+    assert candidate["profile_json"] == client.get(f"/api/candidates/{first['candidate']['id']}").get_json()[
+        "profile_json"
+    ]
+    assert candidate["profile_json"]["years_experience"] == 7
+
+
+def test_changed_parse_limits_miss_the_cache(app, client, monkeypatch):
+    _upload(client)
+    with app.app_context():
+        run_pending_jobs()
+        cached_version = parse_cache.parser_version()
+        # Resumes are parsed in full unless limits are configured.
+        assert parse_cache.parse_limits() == {"max_pages": None, "max_chars": None}
+
+    parsed = []
+    original = parse_cache.parse_resume_with_features
+
+    def counting_parse(path, **options):
+        parsed.append(options)
+        return original(path, **options)
+
+    monkeypatch.setattr(parse_cache, "parse_resume_with_features", counting_parse)
+    app.config["PDF_MAX_CHARS"] = 10
+    _upload(client)
+    with app.app_context():
+        run_pending_jobs()
+        assert parse_cache.parser_version() != cached_version
+        assert ResumeParse.query.filter_by(content_sha256=RESUME_SHA256).count() == 2
+
+    assert [options["max_chars"] for options in parsed] == [10]
+
+
+def test_bulk_batch_parses_each_distinct_content_once(app, client, monkeypatch):
+    app.config["BULK_PARSE_PROCESSES"] = 0
+    parsed = []
+    original = bulk_upload.parse_resume_file
+
+    def counting_parse(path, **options):
+        parsed.append(path)
+        return original(path, **options)
+
+    monkeypatch.setattr(bulk_upload, "parse_resume_file", counting_parse)
+    response = client.post(
+        "/api/candidates/bulk-upload",
+        data={
+            "resume": [
+                (io.BytesIO(RESUME), "a.txt"),
+                (io.BytesIO(RESUME), "b.txt"),
+                (io.BytesIO(b"React 3 years"), "c.txt"),
+            ]
+        },
+        content_type="multipart/form-data",
+    )
+    batch_id = response.get_json()["batch"]["id"]
+
+    with app.app_context():
+        run_pending_jobs()
+        assert db.session.query(ResumeParse).count() == 2
+
+    assert len(parsed) == 2
+    assert client.get(f"/api/candidates/bulk-upload/{batch_id}").get_json()["batch"]["processed"] == 3
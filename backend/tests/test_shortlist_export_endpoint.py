@@ -1,6 +1,9 @@
 import csv
 import io
 
+from app.extensions import db
+from app.models.candidate_features import CandidateFeatures
+
 
 def test_shortlist_export_csv_returns_only_shortlisted_candidates(client):
     jd = client.post(
@@ -74,3 +77,70 @@ def test_shortlist_export_requires_auth(anonymous_client):
 
     assert response.status_code == 401
     assert "error" in response.get_json()
+
+
+def _seed(client, rows):
+    jd = client.post("/api/jds", json={"title": "Backend Role", "text": "Python Flask"}).get_json()
+    for index, (text, score, status) in enumerate(rows):
+        candidate = client.post(
+            "/api/candidates/upload",
+            data={
+                "resume": (io.BytesIO(b"resume"), f"candidate{index}.txt"),
+                "full_name": f"Candidate {index}",
+                "extracted_text": text,
+            },
+            content_type="multipart/form-data",
+        ).get_json()["candidate"]
+        application = client.post(
+            "/api/applications",
+            json={"candidate_id": candidate["id"], "jd_id": jd["id"], "total_score": score},
+        ).get_json()
+        client.patch(f"/api/applications/{application['id']}/status", json={"status": status})
+    return jd
+
+
+def _export(client, jd, query=""):
+    response = client.get(f"/api/jds/{jd['id']}/shortlist/export.csv{query}")
+    assert response.status_code == 200
+    return [row["full_name"] for row in csv.DictReader(io.StringIO(response.get_data(as_text=True)))]
+
+
+def test_shortlist_export_accepts_list_filters(app, client):
+    jd = _seed(
+        client,
+        [
+            ("python flask 6 years", 90.0, "shortlisted"),
+            ("python 2 years", 80.0, "shortlisted"),
+            ("java 9 years", 70.0, "shortlisted"),
+            ("python flask 8 years", 95.0, "reviewed"),
+        ],
+    )
+
+    assert _export(client, jd) == ["Candidate 0", "Candidate 1", "Candidate 2"]
+    assert _export(client, jd, "?min_score=75&max_score=85") == ["Candidate 1"]
+    assert _export(client, jd, "?skills=python") == ["Candidate 0", "Candidate 1"]
+    assert _export(client, jd, "?skills=python&min_experience=5") == ["Candidate 0"]
+    assert _export(client, jd, "?status=reviewed") == ["Candidate 3"]
+
+    # Without stored feature records the candidate filters are checked in Python.
+    with app.app_context():
+        db.session.query(CandidateFeatures).delete()
+        db.session.commit()
+    assert _export(client, jd, "?skills=python&min_experience=5") == ["Candidate 0"]
+    assert client.get(f"/api/jds/{jd['id']}/shortlist/export.csv?status=maybe").status_code == 400
+    assert client.get(f"/api/jds/{jd['id']}/shortlist/export.csv?min_score=high").status_code == 400
+
+
+def test_shortlist_export_streams_in_chunks(client, monkeypatch):
+    from app.routes import applications
+
+    monkeypatch.setattr(applications, "EXPORT_CHUNK_BYTES", 64)
+    jd = _seed(client, [(f"python {index} years", float(index), "shortlisted") for index in range(12)])
+
+    response = client.get(f"/api/jds/{jd['id']}/shortlist/export.csv")
+
+    assert response.is_streamed
+    chunks = list(response.response)
+    assert len(chunks) > 3
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert [row["total_score"] for row in rows] == [str(float(index)) for index in reversed(range(12))]
@@ -0,0 +1,58 @@
+from app.services.resume_parser import extract_profile_from_text
+from app.services.scoring import compile_jd_profile, score_candidate_against_profile
+from app.services.skill_matcher import SkillMatcher, get_skill_matcher
+
+
+def test_matcher_respects_word_boundaries():
+    matcher = SkillMatcher.from_skills(["sql", "java", "c", "c++", "go"])
+
+    assert matcher.find("PostgreSQL, JavaScript, Golang") == []
+    assert matcher.find("SQL and Java; C++ (not C#)") == ["sql", "java", "c++"]
+    assert matcher.find("c, go.") == ["c", "go"]
+
+
+def test_matcher_handles_multi_word_patterns_and_aliases():
+    matcher = SkillMatcher(
+        {
+            "machine learning": "machine learning",
+            "ml": "machine learning",
+            "ci/cd": "ci/cd",
+            "learning": "learning",
+        }
+    )
+
+    found = matcher.find("Built ML models.\nMachine\n   Learning pipelines with CI/CD")
+
+    assert found == ["machine learning", "learning", "ci/cd"]
+
+
+def test_parser_uses_shared_matcher():
+    profile = extract_profile_from_text("Python, PostgreSQL and machine learning on AWS; 4 years")
+
+    assert profile["skills"] == ["aws", "machine learning", "postgresql", "python"]
+    assert "sql" not in profile["skills"]
+    assert get_skill_matcher() is get_skill_matcher()
+
+
+def test_jd_skill_terms_come_from_matcher_with_token_fallback():
+    assert compile_jd_profile("We need Python, Docker and CI/CD. 3 years.").skill_terms == (
+        "python",
+        "docker",
+        "ci/cd",
+    )
+    assert compile_jd_profile("Accountant, ledger reconciliation").skill_terms == (
+        "accountant",
+        "ledger",
+        "reconciliation",
+    )
+
+
+def test_multi_word_skill_is_matched_from_resume_text():
+    profile = compile_jd_profile("Machine learning engineer with Python")
+
+    result = score_candidate_against_profile(
+        {"extracted_text": "Python developer focused on machine learning"}, profile
+    )
+
+    assert result.breakdown["skills"]["matched"] == ["machine learning", "python"]
+    assert result.breakdown["skills"]["score"] == 100.0
@@ -0,0 +1,125 @@
+import gc
+import os
+import weakref
+
+import pytest
+
+from app.services.resume_parser import extract_profile_from_text
+from app.services.scoring import SCORER_VERSION, scorer_version
+from app.services.skill_matcher import SkillMatcher, get_skill_matcher
+from app.services.taxonomy import (
+    SkillTaxonomy,
+    TaxonomyError,
+    TaxonomyStore,
+    canonical_skill,
+    compile_taxonomy,
+    init_skill_taxonomy,
+)
+
+SKILLS = {
+    "postgresql": {"postgres", "psql"},
+    "kubernetes": {"k8s"},
+    "machine learning": {"ml"},
+    "python": set(),
+    "c++": {"cpp"},
+}
+
+
+def test_compiled_taxonomy_round_trips(tmp_path):
+    path = tmp_path / "skills.bin"
+    checksum = compile_taxonomy(SKILLS, str(path))
+
+    taxonomy = SkillTaxonomy(str(path))
+
+    assert taxonomy.checksum == checksum
+    assert list(taxonomy.skills()) == sorted(SKILLS)
+    assert taxonomy.alias_count == 5
+    assert taxonomy.canonical("Postgres") == "postgresql"
+    assert taxonomy.canonical("  Machine   Learning ") == "machine learning"
+    assert taxonomy.canonical("cpp") == "c++"
+    assert taxonomy.canonical("golang") is None
+    assert taxonomy.patterns()["k8s"] == "kubernetes"
+
+
+def test_matcher_walks_the_compiled_tables_in_place(tmp_path):
+    path = tmp_path / "skills.bin"
+    compile_taxonomy({**SKILLS, "node.js": {"nodejs"}, "café ops": {"cafés"}}, str(path))
+    taxonomy = SkillTaxonomy(str(path))
+
+    matcher = SkillMatcher.from_taxonomy(taxonomy)
+    text = "C++/cpp, PSQL;  Machine\n\t Learning on k8s, nodejs, Café   Ops, cafés, xcpp, k8sx, mlops"
+
+    assert isinstance(taxonomy.automaton.transitions, memoryview)
+    assert matcher.find(text) == SkillMatcher(taxonomy.patterns()).find(text)
+    assert matcher.find(text) == ["c++", "postgresql", "machine learning", "kubernetes", "node.js", "café ops"]
+
+
+def test_compile_rejects_ambiguous_alias(tmp_path):
+    with pytest.raises(TaxonomyError):
+        compile_taxonomy({"java": {"jvm"}, "kotlin": {"jvm"}}, str(tmp_path / "skills.bin"))
+
+
+def test_loader_rejects_corrupt_files(tmp_path):
+    path = tmp_path / "skills.bin"
+    compile_taxonomy(SKILLS, str(path))
+    path.write_bytes(path.read_bytes()[:-3])
+
+    with pytest.raises(TaxonomyError):
+        SkillTaxonomy(str(path))
+
+
+def test_store_swaps_taxonomy_when_file_is_replaced(tmp_path):
+    path = tmp_path / "skills.bin"
+    compile_taxonomy(SKILLS, str(path))
+    store = TaxonomyStore(str(path), check_interval=0)
+    first = store.current()
+
+    assert store.current() is first
+
+    compile_taxonomy({**SKILLS, "golang": {"go lang"}}, str(path))
+    second = store.current()
+
+    assert second is not first
+    assert second.canonical("go lang") == "golang"
+    # The previous mapping stays valid for readers still holding it.
+    assert first.canonical("golang") is None
+
+    path.write_bytes(b"garbage")
+    assert store.current() is second
+    assert store.error
+
+
+def test_app_matcher_follows_configured_taxonomy(app, tmp_path):
+    path = tmp_path / "skills.bin"
+    app.config["SKILL_TAXONOMY_PATH"] = str(path)
+    app.config["SKILL_TAXONOMY_CHECK_INTERVAL"] = 0
+    init_skill_taxonomy(app)
+    with app.app_context():
+        # Nothing compiled yet: the built-in skill list stays in use.
+        assert get_skill_matcher().version is None
+        assert scorer_version() == SCORER_VERSION
+
+        compile_taxonomy(SKILLS, str(path))
+        profile = extract_profile_from_text("Ran Postgres on K8s, some ML. 5 years")
+
+        assert profile["skills"] == ["kubernetes", "machine learning", "postgresql"]
+        assert scorer_version().startswith(f"{SCORER_VERSION}+")
+        assert canonical_skill("PSQL") == "postgresql"
+
+        # A reload swaps the matcher; nothing keeps the replaced taxonomy mapped.
+        first = weakref.ref(get_skill_matcher().taxonomy)
+        compile_taxonomy({**SKILLS, "golang": {"go lang"}}, str(path))
+        assert get_skill_matcher().find("Go lang") == ["golang"]
+        gc.collect()
+        assert first() is None
+
+
+def test_compile_cli_writes_taxonomy(app, tmp_path):
+    output = tmp_path / "compiled" / "skills.bin"
+    source = os.path.join(app.root_path, os.pardir, "data", "skill_taxonomy.json")
+
+    result = app.test_cli_runner().invoke(args=["taxonomy", "compile", source, str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert "compiled" in result.output
+    assert SkillTaxonomy(str(output)).canonical("k8s") == "kubernetes"
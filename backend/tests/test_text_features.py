@@ -0,0 +1,70 @@
+import random
+
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.routes.applications import _candidate_matches_skills, _extract_candidate_years
+from app.services.candidate_features import (
+    candidate_analysis,
+    features_match_skills,
+    refresh_candidate_features,
+    resolve_skill_term_ids,
+)
+from app.services.resume_parser import extract_profile_from_text
+from app.services.scoring import analyze_candidate, compile_jd_profile
+from app.services.text_features import extract_text_features, tokenize
+from benchmarks.corpus import generate_resume
+
+TEXT = "Senior engineer, 8+ years with Python, Machine  Learning and PostgreSQL. Master of Science."
+
+
+def test_one_scan_yields_every_feature():
+    features = extract_text_features(TEXT)
+
+    assert features.skills == ("python", "machine learning", "postgresql")
+    assert features.years_experience == 8
+    assert features.education == "master"
+    assert features.terms == frozenset(tokenize(TEXT))
+
+
+def test_parser_scorer_and_jd_profile_agree():
+    profile = extract_profile_from_text(TEXT)
+    analysis = analyze_candidate({"extracted_text": TEXT})
+    jd_profile = compile_jd_profile(TEXT)
+
+    assert set(profile["skills"]) == analysis.skills == set(jd_profile.skill_terms)
+    assert profile["years_experience"] == analysis.years_experience == jd_profile.required_years == 8
+    assert profile["education"] == jd_profile.required_education == "master"
+    assert jd_profile.terms <= analysis.terms
+
+
+def test_analysis_reuses_parser_features():
+    rng = random.Random(2)
+    for size in ("small", "median"):
+        candidate = generate_resume(rng, size).to_dict()
+        features = extract_text_features(candidate["extracted_text"])
+
+        assert analyze_candidate(candidate, features) == analyze_candidate(candidate)
+
+
+def test_list_filters_agree_with_and_without_stored_features(app):
+    with app.app_context():
+        candidate = Candidate(
+            full_name="Jo",
+            resume_filename="jo.txt",
+            resume_path="",
+            extracted_text="Built CI/CD pipelines in Node.js for 6 years; some postgresql",
+        )
+        db.session.add(candidate)
+        db.session.flush()
+
+        required = [{"ci/cd"}, {"node.js"}, {"sql"}, {"postgresql", "ci/cd"}, {"kubernetes"}]
+        stale = [_candidate_matches_skills(candidate, skills) for skills in required]
+        stale_years = _extract_candidate_years(candidate)
+
+        record = candidate_analysis(candidate)
+        record_features = refresh_candidate_features(candidate)
+        stored = [features_match_skills(record_features, skills, resolve_skill_term_ids(skills)) for skills in required]
+
+        assert stale == stored == [True, True, False, True, False]
+        db.session.flush()
+        assert stale_years == _extract_candidate_years(candidate, candidate.features) == record.years_experience == 6
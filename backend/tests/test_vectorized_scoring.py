@@ -0,0 +1,106 @@
+import random
+import zlib
+from array import array
+
+import pytest
+
+from app.services.scoring import (
+    CandidateFeatureRecord,
+    analyze_candidate,
+    compile_jd_profile,
+    score_features_against_profile,
+)
+from app.services.vectorized_scoring import score_pool
+
+VOCABULARY = (
+    "python flask django postgresql sql react typescript aws docker kubernetes git spark "
+    "bachelor master phd leadership testing ci cd api design data pipelines"
+).split()
+
+JD_TEXTS = [
+    "Python Flask PostgreSQL 3 years Bachelor",
+    "Senior data engineer: Spark, Python, AWS, 7+ years, Master or PhD",
+    "Frontend React TypeScript",
+    "",
+    "the and of",
+    "Unseenterm anotherunseen python 2 years phd",
+]
+
+WEIGHTS = [
+    None,
+    {"skills": 1, "experience": 0, "education": 0, "keywords": 0},
+    {"skills": 0.3, "experience": 0.3, "education": 0.2, "keywords": 0.7},
+    {"skills": 0, "experience": 0, "education": 0, "keywords": 0},
+]
+
+
+def _random_candidate(rng: random.Random) -> dict:
+    words = [rng.choice(VOCABULARY) for _ in range(rng.randrange(0, 40))]
+    if rng.random() < 0.5:
+        words.append(f"{rng.randrange(0, 15)} years")
+    candidate = {"full_name": rng.choice(["Ada", "Grace Hopper", None]), "extracted_text": " ".join(words)}
+    if rng.random() < 0.5:
+        profile = {"skills": rng.sample(VOCABULARY[:12], rng.randrange(0, 5))}
+        if rng.random() < 0.5:
+            profile["years_experience"] = rng.randrange(0, 12)
+        candidate["profile_json"] = profile
+    return candidate
+
+
+def _records(candidates: list[dict], vocabulary: dict[str, int]) -> list[CandidateFeatureRecord]:
+    records = []
+    for candidate in candidates:
+        analysis = analyze_candidate(candidate)
+        term_ids = sorted(vocabulary.setdefault(term, len(vocabulary) + 1) for term in analysis.terms)
+        records.append(
+            CandidateFeatureRecord(
+                term_ids=array("I", term_ids),
+                skills=analysis.skills,
+                years_experience=analysis.years_experience,
+                education_levels=analysis.education_levels,
+            )
+        )
+    return records
+
+
+@pytest.mark.parametrize("jd_text", JD_TEXTS)
+@pytest.mark.parametrize("weights", WEIGHTS)
+def test_score_pool_matches_scalar_scorer(jd_text, weights):
+    rng = random.Random(zlib.crc32(f"{jd_text}|{weights}".encode()))
+    vocabulary: dict[str, int] = {}
+    records = _records([_random_candidate(rng) for _ in range(200)], vocabulary)
+    profile = compile_jd_profile(jd_text)
+    jd_term_ids = {term: vocabulary[term] for term in profile.terms if term in vocabulary}
+
+    pool = score_pool(records, profile, jd_term_ids, weights)
+
+    assert len(pool) == len(records)
+    for index, record in enumerate(records):
+        assert pool.result(index) == score_features_against_profile(record, profile, jd_term_ids, weights)
+
+
+def test_score_pool_handles_empty_inputs():
+    profile = compile_jd_profile("Python 3 years")
+
+    assert len(score_pool([], profile, {})) == 0
+    assert score_pool([], profile, {}).top_k(5) == []
+
+    empty = CandidateFeatureRecord(array("I"), frozenset(), None, frozenset())
+    pool = score_pool([empty], profile, {"python": 1})
+    assert pool.result(0) == score_features_against_profile(empty, profile, {"python": 1})
+
+
+def test_top_k_orders_by_total_score():
+    vocabulary: dict[str, int] = {}
+    candidates = [
+        {"extracted_text": "react"},
+        {"extracted_text": "python flask postgresql 5 years bachelor"},
+        {"extracted_text": "python 1 years"},
+    ]
+    records = _records(candidates, vocabulary)
+    profile = compile_jd_profile("Python Flask PostgreSQL 3 years Bachelor")
+    jd_term_ids = {term: vocabulary[term] for term in profile.terms if term in vocabulary}
+
+    pool = score_pool(records, profile, jd_term_ids)
+
+    assert pool.top_k(2) == [1, 2]